@@ -0,0 +1,113 @@
+"""
+Benchmark of `diff_strings` and `get_missing_keys` on million-entry catalogs.
+
+The new version changes, removes and adds 1% of the keys of the old one each. The
+hash join is compared with a merge join over the sorted keys, which is what diffing
+two sorted exports line by line amounts to. The missing keys are looked up in a
+catalog with several locales, each missing 5% of the keys.
+
+Usage: python benchmarks/bench_diff.py [--entries N] [--locales N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from mobile_strings_converter.catalog import Catalog
+from mobile_strings_converter.diff import diff_strings, get_missing_keys
+
+
+def diff_strings_sorted(old_strings, new_strings):
+    """Merge join over the sorted keys, kept as the baseline."""
+    old_strings = sorted(dict(old_strings).items())
+    new_strings = sorted(dict(new_strings).items())
+    added, removed, changed = [], [], []
+    i = j = 0
+
+    while i < len(old_strings) and j < len(new_strings):
+        (old_key, old_value), (new_key, new_value) = old_strings[i], new_strings[j]
+        if old_key == new_key:
+            if old_value != new_value:
+                changed.append((old_key, old_value, new_value))
+            i += 1
+            j += 1
+        elif old_key < new_key:
+            removed.append(old_strings[i])
+            i += 1
+        else:
+            added.append(new_strings[j])
+            j += 1
+
+    removed.extend(old_strings[i:])
+    added.extend(new_strings[j:])
+
+    return added, removed, changed
+
+
+def create_versions(entry_count):
+    old_strings = [(f"key_{i}", f"Value {i}") for i in range(entry_count)]
+    new_strings = []
+
+    for i, (key, value) in enumerate(old_strings):
+        if i % 100 == 1:
+            continue
+        new_strings.append((key, f"Changed {i}" if i % 100 == 0 else value))
+
+    new_strings.extend((f"new_key_{i}", f"New {i}") for i in range(entry_count // 100))
+
+    return old_strings, new_strings
+
+
+def create_catalog(strings, locale_count):
+    catalog = Catalog()
+    catalog.add_locale("default", strings)
+
+    for n in range(locale_count - 1):
+        catalog.add_locale(
+            f"locale-{n}",
+            [(key, value) for i, (key, value) in enumerate(strings) if i % 20 != n],
+        )
+
+    return catalog
+
+
+def measure(function, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--locales", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Creating two versions of {args.entries} strings...")
+    old_strings, new_strings = create_versions(args.entries)
+    catalog = create_catalog(new_strings, args.locales)
+
+    benchmarks = [
+        (
+            "merge join (baseline)",
+            lambda: sum(map(len, diff_strings_sorted(old_strings, new_strings))),
+        ),
+        ("hash join", lambda: len(diff_strings(old_strings, new_strings))),
+        (
+            f"missing keys, {args.locales} locales",
+            lambda: sum(map(len, get_missing_keys(catalog).values())),
+        ),
+    ]
+
+    for name, function in benchmarks:
+        seconds, result = measure(function, args.repeat)
+        print(f"{name:<30} {seconds * 1000:>9.1f} ms  {result:>7} differences")
+
+
+if __name__ == "__main__":
+    main()
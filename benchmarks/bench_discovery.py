@@ -0,0 +1,118 @@
+"""
+Benchmark of `get_filepaths_from_dir` on a synthetic tree of 100k files.
+
+The tree mimics a monorepo: resource directories with strings files, plus `.git`,
+`build` and `node_modules` directories full of unrelated files. It compares the
+previous `os.walk` implementation with the `os.scandir` one, with and without the
+default pruning, and measures the time until the first path is yielded.
+
+Usage: python benchmarks/bench_discovery.py [--files N] [--repeat N]
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.utils import get_filepaths_from_dir
+
+EXTENSIONS = [
+    ".csv",
+    ".xlsx",
+    ".ods",
+    ".md",
+    ".json",
+    ".yaml",
+    ".html",
+    ".strings",
+    ".xml",
+    ".pdf",
+]
+
+
+def get_filepaths_from_dir_os_walk(directory, extensions):
+    """Previous implementation, kept as the baseline."""
+    matched_files = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.endswith(tuple(extensions)):
+                matched_files.append(Path(root) / file)
+
+    return matched_files
+
+
+def create_tree(root: Path, file_count: int):
+    # 10% of the files are strings files, the rest live in pruned directories
+    layout = [
+        ("app/src/main/res/values-{i}", "strings.xml", 0.05),
+        ("ios/App/{i}.lproj", "Localizable.strings", 0.05),
+        (".git/objects/{i}", "object-{j}", 0.2),
+        ("build/intermediates/{i}", "file-{j}.xml", 0.2),
+        ("node_modules/package-{i}/lib", "module-{j}.js", 0.5),
+    ]
+    files_per_dir = 100
+
+    for directory_template, filename_template, share in layout:
+        count = int(file_count * share)
+        for n in range(count):
+            i, j = divmod(n, files_per_dir)
+            directory = root / directory_template.format(i=i)
+            if j == 0:
+                directory.mkdir(parents=True, exist_ok=True)
+            filename = filename_template.format(j=j)
+            if "{j}" not in filename_template:
+                filename = f"{j}-{filename}"
+            (directory / filename).touch()
+
+
+def measure(function, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        print(f"Creating {args.files} files in {root}...")
+        create_tree(root, args.files)
+
+        benchmarks = [
+            (
+                "os.walk (previous)",
+                lambda: get_filepaths_from_dir_os_walk(root, EXTENSIONS),
+            ),
+            (
+                "os.scandir, no pruning",
+                lambda: list(
+                    get_filepaths_from_dir(root, EXTENSIONS, excluded_dirs=())
+                ),
+            ),
+            (
+                "os.scandir, default pruning",
+                lambda: list(get_filepaths_from_dir(root, EXTENSIONS)),
+            ),
+            (
+                "os.scandir, first path",
+                lambda: [next(get_filepaths_from_dir(root, EXTENSIONS))],
+            ),
+        ]
+
+        for name, function in benchmarks:
+            seconds, result = measure(function, args.repeat)
+            print(f"{name:<30} {seconds * 1000:>9.1f} ms  {len(result):>7} paths")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of the .html, .md, .strings and .xml writers on one million strings.
+
+The writers, which escape the values and join the rows in blocks, are compared with
+the previous implementations, which called `write` once or more per row and didn't
+escape anything. One value in a hundred has a character that has to be escaped.
+
+Usage: python benchmarks/bench_emitters.py [--strings N] [--repeat N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.converter import to_android, to_html, to_ios, to_md
+
+
+def to_html_previous(strings, output_filepath):
+    """Previous implementation, kept as the baseline."""
+    with open(output_filepath, "w", encoding="utf-8") as file:
+        file.write("<head>\n")
+        file.write('\t<meta charset="UTF-8">\n')
+        file.write("</head>\n")
+        file.write("<table>\n")
+        file.write("\t<thead>\n")
+        file.write("\t\t<tr>\n")
+        file.write("\t\t\t<th>NAME</th>\n")
+        file.write("\t\t\t<th>VALUE</th>\n")
+        file.write("\t\t</tr>\n")
+        file.write("\t</thead>\n")
+        file.write("\t<tbody>\n")
+
+        for name, value in strings:
+            file.write("\t\t<tr>\n")
+            file.write(f"\t\t\t<td>{name}</td>\n")
+            file.write(f"\t\t\t<td>{value}</td>\n")
+            file.write("\t\t</tr>\n")
+
+        file.write("\t</tbody>\n")
+        file.write("</table>\n")
+
+
+def to_md_previous(strings, output_filepath):
+    """Previous implementation, kept as the baseline."""
+    with open(output_filepath, "w", encoding="utf-8") as f:
+        f.write("| NAME | VALUE |\n")
+        f.write("| ----------- | ----------- |\n")
+        for name, translation in strings:
+            f.write(f"| {name} | {translation} |\n")
+
+
+def to_ios_previous(strings, output_filepath):
+    """Previous implementation, kept as the baseline."""
+    with open(output_filepath, "w", encoding="utf-8") as file:
+        for string in strings:
+            file.write(f'"{string[0]}" = "{string[1]}";\n')
+
+
+def to_android_previous(strings, output_filepath):
+    """Previous implementation, kept as the baseline."""
+    with open(output_filepath, "w", encoding="utf-8") as file:
+        file.write("<resources>\n")
+        for string in strings:
+            file.write(f'\t<string name="{string[0]}">{string[1]}</string>\n')
+
+        file.write("</resources>")
+
+
+def measure(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strings", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--escape-every", type=int, default=10_000)
+    args = parser.parse_args()
+
+    strings = [
+        (
+            f"key_{i}",
+            (
+                f'Tom & Jerry | "{i}" < 3'
+                if i % args.escape_every == 0
+                else f"Valeur numéro {i} ✓"
+            ),
+        )
+        for i in range(args.strings)
+    ]
+
+    writers = [
+        ("html", to_html_previous, to_html),
+        ("md", to_md_previous, to_md),
+        ("strings", to_ios_previous, to_ios),
+        ("xml", to_android_previous, to_android),
+    ]
+
+    print(f"{args.strings} strings")
+
+    with TemporaryDirectory() as temp_dir:
+        for extension, previous, writer in writers:
+            path = Path(temp_dir) / f"output.{extension}"
+            previous_seconds = measure(lambda: previous(strings, path), args.repeat)
+            seconds = measure(lambda: writer(strings, path), args.repeat)
+            size = path.stat().st_size / 1024**2
+
+            print(
+                f".{extension:<8} previous {previous_seconds * 1000:>8.1f} ms  "
+                f"blocks {seconds * 1000:>8.1f} ms  {size / seconds:>6.1f} MB/s  "
+                f"{previous_seconds / seconds:>4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark of the .json writer and reader on one million strings.
+
+The streaming writer and the incremental reader are compared with the previous
+implementations, which built a list with every record before calling `json.dump`
+and loaded the whole file with `json.load`. Each case is timed, and then run again
+under `tracemalloc` to measure the peak memory allocated on top of the strings.
+
+Usage: python benchmarks/bench_json.py [--strings N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.converter import (
+    get_strings_from_json,
+    iter_strings_from_json,
+    orjson,
+    to_json,
+)
+
+
+def to_json_previous(strings, output_filepath):
+    """Previous implementation, kept as the baseline."""
+    data_list = []
+    for name, value in strings:
+        data_list.append({"name": name, "value": value})
+
+    with open(output_filepath, "w", encoding="utf-8") as file:
+        json.dump(data_list, file, ensure_ascii=False, indent=2)
+
+
+def get_strings_from_json_previous(json_filepath):
+    """Previous implementation, kept as the baseline."""
+    data = []
+
+    with open(json_filepath, "r", encoding="utf-8") as file:
+        json_data = json.load(file)
+
+    for record in json_data:
+        if "name" in record and "value" in record:
+            data.append((record["name"], record["value"]))
+
+    return data
+
+
+def measure(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strings", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    strings = [
+        (f"key_{i}", f'Valeur numéro {i} avec des "guillemets" ✓')
+        for i in range(args.strings)
+    ]
+    backends = ["json"] + (["orjson"] if orjson is not None else [])
+
+    with TemporaryDirectory() as temp_dir:
+        json_filepath = Path(temp_dir) / "strings.json"
+        to_json_previous(strings, json_filepath)
+        size = json_filepath.stat().st_size / 1024**2
+        print(f"{args.strings} strings, {size:.1f} MB")
+
+        path = Path(temp_dir) / "output.json"
+        benchmarks = [
+            ("write: json.dump (previous)", lambda: to_json_previous(strings, path)),
+            *(
+                (f"write: stream, {b}", lambda b=b: to_json(strings, path, b))
+                for b in backends
+            ),
+            (
+                "read: json.load (previous)",
+                lambda: get_strings_from_json_previous(json_filepath),
+            ),
+            *(
+                (
+                    f"read: {'incremental' if b == 'json' else 'whole file'}, {b}",
+                    lambda b=b: get_strings_from_json(json_filepath, b),
+                )
+                for b in backends
+            ),
+            (
+                "read: incremental, iterate",
+                lambda: sum(1 for _ in iter_strings_from_json(json_filepath)),
+            ),
+        ]
+
+        for name, function in benchmarks:
+            seconds, peak = measure(function, args.repeat)
+            print(
+                f"{name:<32} {seconds * 1000:>8.1f} ms  {size / seconds:>6.1f} MB/s  "
+                f"peak {peak / 1024**2:>7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
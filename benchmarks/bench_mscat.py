@@ -0,0 +1,92 @@
+"""
+Benchmark of the .mscat writer and reader on one million strings.
+
+Reloading a .mscat file is compared with reloading the same strings from a .json
+file, and looking up one key, which opens the memory-mapped file and searches its
+index, is compared with reading the whole file. Each case is timed, and then run
+again under `tracemalloc` to measure the peak memory allocated on top of the strings.
+
+Usage: python benchmarks/bench_mscat.py [--strings N] [--repeat N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.converter import get_strings_from_json, to_json
+from mobile_strings_converter.mscat import (
+    MscatReader,
+    get_strings_from_mscat,
+    to_mscat,
+)
+
+
+def lookup(mscat_filepath, name):
+    with MscatReader(mscat_filepath) as reader:
+        return reader.get(name)
+
+
+def iterate(mscat_filepath):
+    with MscatReader(mscat_filepath) as reader:
+        return sum(1 for _ in reader)
+
+
+def measure(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strings", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    strings = [
+        (f"key_{i}", f'Valeur numéro {i} avec des "guillemets" ✓')
+        for i in range(args.strings)
+    ]
+    last_name = strings[-1][0]
+
+    with TemporaryDirectory() as temp_dir:
+        json_filepath = Path(temp_dir) / "strings.json"
+        mscat_filepath = Path(temp_dir) / "strings.mscat"
+        to_json(strings, json_filepath)
+        to_mscat(strings, mscat_filepath)
+        print(
+            f"{args.strings} strings, "
+            f"{json_filepath.stat().st_size / 1024**2:.1f} MB as .json, "
+            f"{mscat_filepath.stat().st_size / 1024**2:.1f} MB as .mscat"
+        )
+
+        benchmarks = [
+            ("write: .json", lambda: to_json(strings, json_filepath)),
+            ("write: .mscat", lambda: to_mscat(strings, mscat_filepath)),
+            ("read: .json", lambda: get_strings_from_json(json_filepath)),
+            ("read: .mscat", lambda: get_strings_from_mscat(mscat_filepath)),
+            ("read: .mscat, iterate", lambda: iterate(mscat_filepath)),
+            ("lookup: .mscat, open + get", lambda: lookup(mscat_filepath, last_name)),
+        ]
+
+        for name, function in benchmarks:
+            seconds, peak = measure(function, args.repeat)
+            print(
+                f"{name:<32} {seconds * 1000:>10.3f} ms  "
+                f"peak {peak / 1024**2:>7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of `validate_placeholders` on a catalog of 60 locales and 20k keys.
+
+A fifth of the values have printf-style or named placeholders, and one in a thousand
+translations uses a different placeholder than the default locale. The validation is
+compared with extracting and normalizing the placeholders of every value, which is
+what a straightforward implementation does.
+
+Usage: python benchmarks/bench_validate.py [--keys N] [--locales N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from mobile_strings_converter.catalog import DEFAULT_LOCALE, Catalog
+from mobile_strings_converter.validate import get_placeholders, validate_placeholders
+
+VALUES = [
+    "Hello %1$s, you have %2$d new messages",
+    "Welcome back, {name}!",
+    "%d%% completed",
+    "Saved %@ to %@",
+]
+
+
+def validate_placeholders_naive(catalog, reference_locale=DEFAULT_LOCALE):
+    """Normalizes every value, kept as the baseline."""
+    violations = {}
+    reference_column = catalog.columns[reference_locale]
+
+    for locale, column in catalog.columns.items():
+        if locale == reference_locale:
+            continue
+
+        for row, value in enumerate(column):
+            reference_value = reference_column[row]
+            if value is None or reference_value is None:
+                continue
+
+            expected = get_placeholders(reference_value)
+            found = get_placeholders(value)
+            if found != expected:
+                violations.setdefault(locale, []).append(
+                    (catalog.keys[row], expected, found)
+                )
+
+    return violations
+
+
+def create_catalog(key_count, locale_count):
+    strings = []
+    for i in range(key_count):
+        if i % 5 == 0:
+            strings.append((f"key_{i}", VALUES[i // 5 % len(VALUES)]))
+        else:
+            strings.append((f"key_{i}", f"Plain text number {i}"))
+
+    catalog = Catalog()
+    catalog.add_locale(DEFAULT_LOCALE, strings)
+
+    for n in range(locale_count - 1):
+        catalog.add_locale(
+            f"locale-{n}",
+            [
+                (key, value.replace("%2$d", "%2$s") if i % 1000 == 0 else value)
+                for i, (key, value) in enumerate(strings)
+            ],
+        )
+
+    return catalog
+
+
+def measure(function, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=20_000)
+    parser.add_argument("--locales", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Creating a catalog of {args.locales} locales and {args.keys} keys...")
+    catalog = create_catalog(args.keys, args.locales)
+
+    benchmarks = [
+        ("normalize every value", lambda: validate_placeholders_naive(catalog)),
+        ("validate_placeholders", lambda: validate_placeholders(catalog)),
+    ]
+
+    for name, function in benchmarks:
+        seconds, result = measure(function, args.repeat)
+        count = sum(map(len, result.values()))
+        print(f"{name:<30} {seconds * 1000:>9.1f} ms  {count:>7} violations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of the .yaml writer and reader on 200k strings.
+
+The event-based writer and reader are compared with the previous implementations,
+which called `yaml.dump` and `yaml.safe_load` with the pure Python classes, and with
+the same calls using the libyaml classes. Each case is timed, and then run again
+under `tracemalloc` to measure the peak memory allocated on top of the strings.
+
+Usage: python benchmarks/bench_yaml.py [--strings N] [--repeat N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import yaml
+
+from mobile_strings_converter.converter import get_strings_from_yaml, to_yaml
+
+
+def to_yaml_previous(strings, output_filepath, dumper=yaml.Dumper):
+    """Previous implementation, kept as the baseline."""
+    strings_dict = {name: value for name, value in strings}
+
+    with open(output_filepath, "w", encoding="utf-8") as file:
+        yaml.dump(
+            strings_dict,
+            file,
+            Dumper=dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
+
+
+def get_strings_from_yaml_previous(yaml_filepath, loader=yaml.SafeLoader):
+    """Previous implementation, kept as the baseline."""
+    with open(yaml_filepath, "r", encoding="utf-8") as file:
+        yaml_data = yaml.load(file, Loader=loader)
+
+    return list(yaml_data.items())
+
+
+def measure(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strings", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    strings = [
+        (f"key_{i}", f"Valeur numéro {i}: avec des 'guillemets'" if i % 10 else "yes")
+        for i in range(args.strings)
+    ]
+
+    with TemporaryDirectory() as temp_dir:
+        yaml_filepath = Path(temp_dir) / "strings.yaml"
+        output_filepath = Path(temp_dir) / "output.yaml"
+        to_yaml(strings, yaml_filepath)
+        size = yaml_filepath.stat().st_size / 1024**2
+        print(f"{args.strings} strings, {size:.1f} MB")
+
+        benchmarks = [
+            (
+                "write: yaml.dump (previous)",
+                lambda: to_yaml_previous(strings, output_filepath),
+            ),
+            (
+                "write: yaml.dump, CSafeDumper",
+                lambda: to_yaml_previous(strings, output_filepath, yaml.CSafeDumper),
+            ),
+            ("write: events", lambda: to_yaml(strings, output_filepath)),
+            (
+                "read: yaml.safe_load (previous)",
+                lambda: get_strings_from_yaml_previous(yaml_filepath),
+            ),
+            (
+                "read: yaml.load, CSafeLoader",
+                lambda: get_strings_from_yaml_previous(yaml_filepath, yaml.CSafeLoader),
+            ),
+            ("read: events", lambda: get_strings_from_yaml(yaml_filepath)),
+        ]
+
+        for name, function in benchmarks:
+            seconds, peak = measure(function, args.repeat)
+            print(
+                f"{name:<32} {seconds * 1000:>8.1f} ms  {size / seconds:>6.1f} MB/s  "
+                f"peak {peak / 1024**2:>7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,18 @@
 # @author: José Carlos López Henestrosa
 
 """Imports for the mobile-strings-converter package."""
-from .converter import convert_strings, to_google_sheets
+
+from .converter import (
+    convert_bytes,
+    convert_stream,
+    convert_strings,
+    convert_strings_to_many,
+    get_strings_from_stream,
+    to_google_sheets,
+    to_google_sheets_many,
+    write_strings_to_bytes,
+    write_strings_to_stream,
+)
 
 # Constants
 __version__ = "0.1.5"
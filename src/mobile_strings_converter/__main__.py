@@ -1,24 +1,73 @@
 import argparse
 import os
+import sys
 from pathlib import Path
 
-from console_style import ConsoleStyle
-from converter import convert_strings, to_google_sheets
 from mobile_strings_converter import __version__
+from mobile_strings_converter.cache import StringsCache
+from mobile_strings_converter.catalog import (
+    DEFAULT_LOCALE,
+    discover_locale_files,
+    load_catalog,
+    write_catalog,
+)
+from mobile_strings_converter.compression import (
+    COMPRESSION_SUFFIXES,
+    STDIO_PATH,
+    add_compression_suffixes,
+    get_stdio_path,
+    is_stdio_path,
+)
+from mobile_strings_converter.console_style import ConsoleStyle
+from mobile_strings_converter.converter import (
+    DUPLICATE_POLICIES,
+    convert_strings_to_many,
+    get_strings,
+    iter_strings,
+    to_google_sheets_many,
+    write_strings,
+)
+from mobile_strings_converter.diff import (
+    diff_catalogs,
+    diff_strings,
+    get_missing_keys,
+    missing_keys_to_strings,
+)
+from mobile_strings_converter.google_sheets import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    get_input_stem,
+    is_google_sheets_url,
+)
+from mobile_strings_converter.html_report import DEFAULT_PAGE_SIZE, to_html_report
+from mobile_strings_converter.manifest import MANIFEST_FILENAME, Manifest
+from mobile_strings_converter.utils import (
+    DEFAULT_EXCLUDED_DIRS,
+    PathFilter,
+    get_file_hash,
+    get_filepaths_from_dir,
+)
+from mobile_strings_converter.validate import (
+    validate_placeholders,
+    violations_to_strings,
+)
+from mobile_strings_converter.watcher import create_watcher, watch
 
 
-def get_filepaths_from_dir(directory, extensions):
-    """Return a list of filepaths in the directory matching the given extensions."""
-    matched_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(tuple(extensions)):
-                matched_files.append(Path(root) / file)
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-    return matched_files
+    subcommands = {
+        "catalog": catalog_main,
+        "diff": diff_main,
+        "report": report_main,
+        "validate": validate_main,
+    }
 
+    if argv and argv[0] in subcommands:
+        return subcommands[argv[0]](argv[1:])
 
-def main():
     supported_file_types = [
         ".csv",
         ".xlsx",
@@ -30,13 +79,26 @@ def main():
         ".strings",
         ".xml",
         ".pdf",
+        ".mscat",
+        ".sqlite",
+        ".db",
     ]
     supported_file_types_str = "\n".join(f"  - {ext}" for ext in supported_file_types)
+    # Any of them can also be read and written compressed, e.g. `strings.json.gz`
+    compressed_file_types = add_compression_suffixes(supported_file_types)
 
     parser = argparse.ArgumentParser(
         description="Script to convert Android & iOS string files to any supported "
         "file type, and vice versa.\n\n"
-        f"Supported file types:\n{supported_file_types_str}",
+        f"Supported file types:\n{supported_file_types_str}\n\n"
+        "Any of them can be compressed with one of the "
+        f"{', '.join(COMPRESSION_SUFFIXES)} suffixes, e.g. `strings.json.gz`.",
+        epilog="Commands:\n"
+        "  catalog  Merge the strings of every locale of a resource tree into one "
+        "table\n"
+        "  diff     Report the keys added, removed and changed between two versions\n"
+        "  report   Write the strings to a paginated .html report\n"
+        "  validate Check the placeholders of every locale against the default one",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -45,7 +107,9 @@ def main():
         type=str,
         nargs="+",  # Accept one or more values
         help="Files or directory paths of supported files to convert. Check the list "
-        "of the supported file types above.",
+        "of the supported file types above. A Google spreadsheet can be read with "
+        "`gsheet://<name>`, or `gsheet://<name>#<worksheet>` for a worksheet other "
+        "than the first one. Use `-` to read from stdin, along with `--input-type`.",
     )
     parser.add_argument(
         "-v",
@@ -61,7 +125,8 @@ def main():
         type=str,
         metavar="FILE_PATH",
         help="File path to save the converted file. Only works if only one input file "
-        "is specified. Check the list of the supported file types above.",
+        "is specified. Check the list of the supported file types above. Use `-` to "
+        "write to stdout, along with the file type in `--target-type`.",
     )
     parser.add_argument(
         "-d",
@@ -79,8 +144,16 @@ def main():
         type=str,
         metavar="FILE_TYPE",
         help="Target file type to convert the files. Required when specifying "
-        "multiple file paths or `--output-dir`. Check the list of the supported file "
-        "types above.",
+        "multiple file paths or `--output-dir`. Several file types can be separated "
+        "by commas (e.g. `-t .csv,.json,.xlsx`) to parse each input file only once and "
+        "write all of them. Check the list of the supported file types above.",
+    )
+    parser.add_argument(
+        "--input-type",
+        type=str,
+        metavar="FILE_TYPE",
+        help="File type of the data read from stdin when the input path is `-`, e.g. "
+        "`.json` or `.json.gz`.",
     )
     parser.add_argument(
         "-g",
@@ -93,6 +166,51 @@ def main():
         "generate it in the Generating a Spreadsheet in Google Sheets section in the "
         "README.",
     )
+    parser.add_argument(
+        "--sheets-chunk-size",
+        required=False,
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="ROWS",
+        help="Maximum number of rows sent in each request to the Google Sheets API. "
+        f"Only valid along with `--google-sheets`. Defaults to {DEFAULT_CHUNK_SIZE}.",
+    )
+    parser.add_argument(
+        "--sheets-sync",
+        required=False,
+        action="store_true",
+        help="Write only the cells of the Google spreadsheet that changed instead of "
+        "replacing its whole content, so the notes and formatting of the unchanged "
+        "rows are kept. Only valid along with `--google-sheets`.",
+    )
+    parser.add_argument(
+        "--sheets-spreadsheet",
+        required=False,
+        type=str,
+        metavar="NAME",
+        help="Write every input file to a worksheet named after the file in the given "
+        "spreadsheet, instead of to the spreadsheet named after the file. Missing "
+        "worksheets are created. Only valid along with `--google-sheets`.",
+    )
+    parser.add_argument(
+        "--sheets-requests-per-minute",
+        required=False,
+        type=int,
+        default=DEFAULT_REQUESTS_PER_MINUTE,
+        metavar="REQUESTS",
+        help="Maximum number of requests sent per minute to the Google Sheets API by "
+        "all the concurrent uploads. Only valid along with `--google-sheets`. Defaults "
+        f"to {DEFAULT_REQUESTS_PER_MINUTE}, the default quota per user.",
+    )
+    parser.add_argument(
+        "--sheets-credentials",
+        required=False,
+        type=str,
+        metavar="CREDENTIALS_PATH",
+        help="Path of the `service_account.json` used to read `gsheet://` inputs. "
+        "Defaults to the `--google-sheets` path if specified, or to "
+        "`~/.config/gspread/service_account.json` otherwise.",
+    )
     parser.add_argument(
         "-p",
         "--print-comments",
@@ -101,44 +219,211 @@ def main():
         help="Print commented strings from the input file to the output file. "
         "Only valid for `.xml` or `.strings` input file types, otherwise it is ignored.",
     )
+    parser.add_argument(
+        "--duplicates",
+        required=False,
+        choices=DUPLICATE_POLICIES,
+        help="What to do with the keys repeated in an input file: `error` stops the "
+        "conversion, `first` and `last` keep only the first or last value of the key, "
+        "and `report` keeps every string but prints the repeated keys. By default, "
+        "every string is kept.",
+    )
+    parser.add_argument(
+        "--patch",
+        required=False,
+        action="store_true",
+        help="Update the output `.xml` and `.strings` files that already exist instead "
+        "of writing them again, keeping their comments and order. Only the changed "
+        "values are replaced, and the new keys are added after the last string.",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        required=False,
+        action="store_true",
+        help="Skip the conversions whose input file, converter version and options "
+        "have not changed since the last run. The conversions are tracked in a "
+        f"`{MANIFEST_FILENAME}` file saved in the output directory.",
+    )
+    parser.add_argument(
+        "--force",
+        required=False,
+        action="store_true",
+        help="Convert every input file even if its output files are up to date. Only "
+        "valid along with `--incremental`, otherwise it is ignored.",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        type=str,
+        metavar="DIR_PATH",
+        help="Directory where the strings extracted from the input files are cached, "
+        "so files whose content has already been parsed are not parsed again. The "
+        "specified directory will be created if it does not already exist.",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--watch",
+        required=False,
+        action="store_true",
+        help="Keep running after the conversion and convert the input files again "
+        "every time they change. Uses inotify where available and polls the input "
+        "paths otherwise.",
+    )
 
-    # Check if the output-extension argument is provided when output-dir is specified
+    parser.add_argument(
+        "--include",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Only convert the files in the input directories matching the glob "
+        "pattern, e.g. `values-*/strings.xml`. The pattern is matched against the "
+        "path relative to the input directory and against the file name. Can be "
+        "specified multiple times.",
+    )
+    parser.add_argument(
+        "--exclude",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Skip the files and directories in the input directories matching the "
+        "glob pattern. Can be specified multiple times.",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        required=False,
+        action="store_true",
+        help="Also search the directories skipped by default: "
+        f"{', '.join(sorted(DEFAULT_EXCLUDED_DIRS, key=str.lower))}.",
+    )
+
+    args = parser.parse_args(argv)
+
+    cache = StringsCache(Path(args.cache_dir)) if args.cache_dir else None
+
+    # Check if the target-type argument is provided when output-dir is specified
     if args.output_dir and not args.target_type:
         raise ValueError(
-            f"{ConsoleStyle.RED}--output-dir requires --output-extension."
+            f"{ConsoleStyle.RED}--output-dir requires --target-type."
             f"{ConsoleStyle.END}"
         )
 
-    input_filepaths = []
+    target_types = []
+    if args.target_type:
+        target_types = [
+            target_type.strip()
+            for target_type in args.target_type.split(",")
+            if target_type.strip()
+        ]
+
+        for target_type in target_types:
+            if target_type not in compressed_file_types:
+                raise ValueError(
+                    f"{ConsoleStyle.RED}Unsupported target type: {target_type}"
+                    f"{ConsoleStyle.END}"
+                )
+
+    # `-` reads the input from stdin or writes the output to stdout
+    reads_stdin = STDIO_PATH in args.input_paths
+    writes_stdout = args.output_file == STDIO_PATH
+
+    if reads_stdin and args.input_type not in compressed_file_types:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Reading from stdin requires --input-type with a "
+            f"supported file type.{ConsoleStyle.END}"
+        )
+    if reads_stdin and not args.output_file:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Reading from stdin requires --output-file."
+            f"{ConsoleStyle.END}"
+        )
+    if writes_stdout and len(target_types) != 1:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Writing to stdout requires --target-type with one "
+            f"file type.{ConsoleStyle.END}"
+        )
+    if writes_stdout and (args.incremental or args.watch):
+        raise ValueError(
+            f"{ConsoleStyle.RED}--incremental and --watch can't be used when writing "
+            f"to stdout.{ConsoleStyle.END}"
+        )
+
+    excluded_dirs = () if args.no_default_excludes else DEFAULT_EXCLUDED_DIRS
     output_dir = None
 
-    for path in args.input_paths:
-        if os.path.isdir(path):
-            # If it's a directory, get all matching files
-            input_filepaths.extend(get_filepaths_from_dir(path, supported_file_types))
-        elif os.path.isfile(path) and path.endswith(tuple(supported_file_types)):
-            # If it's a supported file type, add it to the list
-            input_filepaths.append(Path(path))
-        else:
-            print(
-                f"{ConsoleStyle.YELLOW}Skipping unsupported file or path: {path}"
-                f"{ConsoleStyle.END}"
-            )
+    sheets_credentials_path = args.sheets_credentials or args.google_sheets
+    sheets_credentials_path = (
+        Path(sheets_credentials_path) if sheets_credentials_path else None
+    )
+
+    def is_in_output_dir(filepath):
+        if output_dir is None:
+            return False
+
+        resolved_output_dir = output_dir.resolve()
+        return resolved_output_dir in filepath.resolve().parents
+
+    def iter_input_filepaths():
+        for path in args.input_paths:
+            if path == STDIO_PATH:
+                yield get_stdio_path(args.input_type)
+            elif is_google_sheets_url(path):
+                # Kept as a string, since a Path would collapse the double slash
+                yield path
+            elif os.path.isdir(path):
+                # If it's a directory, get all matching files. They are yielded while
+                # the directory is walked, so the conversions start right away
+                for filepath in get_filepaths_from_dir(
+                    path,
+                    compressed_file_types,
+                    include=args.include,
+                    exclude=args.exclude,
+                    excluded_dirs=excluded_dirs,
+                ):
+                    # The walk would find the files already written to an output
+                    # directory inside the input directory and convert them again
+                    if not is_in_output_dir(filepath):
+                        yield filepath
+            elif os.path.isfile(path) and path.endswith(tuple(compressed_file_types)):
+                # If it's a supported file type, add it to the list
+                yield Path(path)
+            else:
+                print(
+                    f"{ConsoleStyle.YELLOW}Skipping unsupported file or path: {path}"
+                    f"{ConsoleStyle.END}",
+                    file=sys.stderr,
+                )
+
+    input_filepaths = iter_input_filepaths()
+
+    # Both options need every input file before converting them
+    if args.output_file or args.google_sheets:
+        input_filepaths = list(input_filepaths)
 
     # Ensure the correct output options are used
-    if args.output_filepath:
+    if args.output_file:
         if len(input_filepaths) > 1:
             raise ValueError(
-                "Cannot use --output-filepath with multiple input files. Use "
+                "Cannot use --output-file with multiple input files. Use "
+                "--output-dir instead."
+            )
+        if len(target_types) > 1:
+            raise ValueError(
+                "Cannot use --output-file with multiple target types. Use "
                 "--output-dir instead."
             )
-        output_path = Path(args.output_filepath)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if writes_stdout:
+            output_path = get_stdio_path(target_types[0])
+        else:
+            output_path = Path(args.output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = Manifest(output_path.parent, __version__)
     elif args.output_dir:
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = Manifest(output_dir, __version__)
     else:
         raise ValueError(
             f"{ConsoleStyle.RED}You must specify an output path with the "
@@ -147,28 +432,645 @@ def main():
 
     if credentials_path := args.google_sheets:
         if os.path.isfile(credentials_path):
-            for input_filepath in input_filepaths:
-                to_google_sheets(
-                    args.input_filepath,
-                    sheet_name=Path(input_filepath).stem,
-                    credentials_filepath=Path(credentials_path),
-                    with_comments=args.print_comments,
-                )
+            # The credentials are loaded once and the sheets are uploaded concurrently
+            to_google_sheets_many(
+                input_filepaths,
+                credentials_filepath=Path(credentials_path),
+                with_comments=args.print_comments,
+                chunk_size=args.sheets_chunk_size,
+                sync=args.sheets_sync,
+                spreadsheet_name=args.sheets_spreadsheet,
+                requests_per_minute=args.sheets_requests_per_minute,
+                cache=cache,
+                duplicates=args.duplicates,
+            )
         else:
             raise ValueError(
                 f"{ConsoleStyle.RED}You need to pass the path of the "
                 f"`service_account.json` file to generate a Sheet.{ConsoleStyle.END}"
             )
 
-    for input_filepath in input_filepaths:
-        if args.output_filepath:
-            output_filepath = Path(args.output_filepath)
-        else:
-            output_filename = Path(input_filepath).stem + args.target_type
-            output_filepath = output_dir / output_filename
+    def convert_input_filepaths(filepaths):
+        rebuilt_count = 0
+        skipped_count = 0
+
+        try:
+            for input_filepath in filepaths:
+                if args.output_file:
+                    output_filepaths = [output_path]
+                else:
+                    output_filepaths = [
+                        output_dir / (get_input_stem(input_filepath) + target_type)
+                        for target_type in target_types
+                    ]
+
+                # Spreadsheets have no local file to hash, but their strings are
+                # cached by revision, so converting them again is cheap. stdin can
+                # only be read once
+                if (
+                    not args.incremental
+                    or is_google_sheets_url(input_filepath)
+                    or is_stdio_path(input_filepath)
+                ):
+                    convert_strings_to_many(
+                        input_filepath,
+                        output_filepaths,
+                        args.print_comments,
+                        cache=cache,
+                        credentials_filepath=sheets_credentials_path,
+                        duplicates=args.duplicates,
+                        patch=args.patch,
+                    )
+                    continue
+
+                input_hash = get_file_hash(input_filepath)
+                stale_filepaths = [
+                    output_filepath
+                    for output_filepath in output_filepaths
+                    if args.force
+                    or not manifest.is_up_to_date(
+                        input_filepath,
+                        output_filepath,
+                        input_hash,
+                        args.print_comments,
+                        args.duplicates,
+                        args.patch,
+                    )
+                ]
+
+                if stale_filepaths:
+                    convert_strings_to_many(
+                        input_filepath,
+                        stale_filepaths,
+                        args.print_comments,
+                        cache=cache,
+                        duplicates=args.duplicates,
+                        patch=args.patch,
+                    )
+
+                    for output_filepath in stale_filepaths:
+                        manifest.record(
+                            input_filepath,
+                            output_filepath,
+                            input_hash,
+                            args.print_comments,
+                            args.duplicates,
+                            args.patch,
+                        )
+
+                rebuilt_count += len(stale_filepaths)
+                skipped_count += len(output_filepaths) - len(stale_filepaths)
+        finally:
+            # Keep track of the conversions done so far even if one of them fails
+            if args.incremental:
+                manifest.save()
+
+        if args.incremental:
+            print(
+                f"{ConsoleStyle.GREEN}Rebuilt {rebuilt_count} file(s), skipped "
+                f"{skipped_count} up-to-date file(s).{ConsoleStyle.END}"
+            )
+
+    convert_input_filepaths(input_filepaths)
+
+    if args.watch:
+        watch_input_paths(
+            [
+                path
+                for path in args.input_paths
+                if not is_google_sheets_url(path) and path != STDIO_PATH
+            ],
+            PathFilter(
+                compressed_file_types, args.include, args.exclude, excluded_dirs
+            ),
+            convert_input_filepaths,
+            output_path=output_path if args.output_file else output_dir,
+        )
+
+
+def catalog_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="mobile-strings-converter catalog",
+        description="Merge the strings of every locale of Android (`values-*/"
+        "strings.xml`) and iOS (`*.lproj/Localizable.strings`) resource trees into one "
+        "table, with the keys as rows and a column per locale.",
+    )
+
+    parser.add_argument(
+        "input_dirs",
+        type=str,
+        nargs="+",
+        help="Resource directories to search for the strings files of every locale.",
+    )
+    parser.add_argument(
+        "-f",
+        "--output-file",
+        required=True,
+        type=str,
+        metavar="FILE_PATH",
+        help="File path to save the catalog. Supported file types: .csv, .xlsx, "
+        ".json, .sqlite and .db, optionally compressed, e.g. `.csv.gz`. Use `-` to "
+        "write to stdout, along with the file type in `--target-type`.",
+    )
+    parser.add_argument(
+        "-t",
+        "--target-type",
+        required=False,
+        type=str,
+        metavar="FILE_TYPE",
+        help="File type of the catalog written to stdout when the output path is `-`, "
+        "e.g. `.csv` or `.json.gz`.",
+    )
+    parser.add_argument(
+        "-p",
+        "--print-comments",
+        required=False,
+        action="store_true",
+        help="Include the commented strings of the input files.",
+    )
+    parser.add_argument(
+        "--duplicates",
+        required=False,
+        choices=DUPLICATE_POLICIES,
+        help="What to do with the keys repeated in a strings file: `error` stops "
+        "loading the catalog, `report` prints the repeated keys, and `first` keeps the "
+        "first value of the key instead of the last one.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        metavar="N",
+        help="Number of processes used to parse the locales. Defaults to the number "
+        "of CPUs.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        type=str,
+        metavar="DIR_PATH",
+        help="Directory where the strings extracted from the input files are cached.",
+    )
+    parser.add_argument(
+        "--include",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Only read the files matching the glob pattern. Can be specified "
+        "multiple times.",
+    )
+    parser.add_argument(
+        "--exclude",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Skip the files and directories matching the glob pattern. Can be "
+        "specified multiple times.",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        required=False,
+        action="store_true",
+        help="Also search the directories skipped by default.",
+    )
+
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog_from_dirs(
+        args.input_dirs,
+        with_comments=args.print_comments,
+        max_workers=args.jobs,
+        cache=StringsCache(Path(args.cache_dir)) if args.cache_dir else None,
+        duplicates=args.duplicates,
+        include=args.include,
+        exclude=args.exclude,
+        excluded_dirs=() if args.no_default_excludes else DEFAULT_EXCLUDED_DIRS,
+    )
+
+    if args.output_file == STDIO_PATH:
+        if not args.target_type:
+            raise ValueError(
+                f"{ConsoleStyle.RED}Writing to stdout requires --target-type."
+                f"{ConsoleStyle.END}"
+            )
+        output_filepath = get_stdio_path(args.target_type)
+    else:
+        output_filepath = Path(args.output_file)
+        output_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    write_catalog(catalog, output_filepath)
+
+
+def diff_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="mobile-strings-converter diff",
+        description="Report the keys added, removed and changed between two versions "
+        "of a strings file, or between every locale of two resource trees.",
+    )
+
+    parser.add_argument(
+        "old_path",
+        type=str,
+        help="Previous version: a supported file, a `gsheet://` path or a resource "
+        "directory.",
+    )
+    parser.add_argument(
+        "new_path",
+        type=str,
+        help="Current version, of the same kind as OLD_PATH.",
+    )
+    parser.add_argument(
+        "-f",
+        "--output-file",
+        required=False,
+        type=str,
+        metavar="FILE_PATH",
+        help="File path to save the report, with a row per key. Any supported "
+        "output file type can be used. The report is printed if not specified.",
+    )
+    parser.add_argument(
+        "-m",
+        "--missing",
+        required=False,
+        action="store_true",
+        help="Also report the keys of the reference locale that are missing in each "
+        "locale of NEW_PATH. Only valid for resource directories.",
+    )
+    parser.add_argument(
+        "--reference-locale",
+        required=False,
+        type=str,
+        default=DEFAULT_LOCALE,
+        metavar="LOCALE",
+        help="Locale with every key, used along with `--missing`. Defaults to the "
+        "`values` or `Base.lproj` directory.",
+    )
+    parser.add_argument(
+        "-p",
+        "--print-comments",
+        required=False,
+        action="store_true",
+        help="Include the commented strings of the input files.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        metavar="N",
+        help="Number of processes used to parse the locales of resource directories. "
+        "Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        type=str,
+        metavar="DIR_PATH",
+        help="Directory where the strings extracted from the input files are cached.",
+    )
+
+    args = parser.parse_args(argv)
+
+    cache = StringsCache(Path(args.cache_dir)) if args.cache_dir else None
+    paths = [args.old_path, args.new_path]
+
+    if all(os.path.isdir(path) for path in paths):
+        old_catalog, new_catalog = [
+            load_catalog_from_dirs(
+                [path],
+                with_comments=args.print_comments,
+                max_workers=args.jobs,
+                cache=cache,
+            )
+            for path in paths
+        ]
+
+        report = []
+        for locale, locale_diff in diff_catalogs(old_catalog, new_catalog).items():
+            report.extend(locale_diff.to_strings(locale))
+
+        if args.missing:
+            missing_keys = get_missing_keys(new_catalog, args.reference_locale)
+            report.extend(missing_keys_to_strings(missing_keys))
+    elif not any(os.path.isdir(path) for path in paths):
+        if args.missing:
+            raise ValueError(
+                f"{ConsoleStyle.RED}--missing is only valid for resource "
+                f"directories.{ConsoleStyle.END}"
+            )
+
+        old_strings, new_strings = [
+            get_strings(path, args.print_comments, cache) for path in paths
+        ]
+        report = diff_strings(old_strings, new_strings).to_strings()
+    else:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Cannot compare a file with a directory."
+            f"{ConsoleStyle.END}"
+        )
+
+    if args.output_file:
+        output_filepath = Path(args.output_file)
+        output_filepath.parent.mkdir(parents=True, exist_ok=True)
+        write_strings(report, output_filepath)
+    elif report:
+        for key, description in report:
+            if description.startswith("added"):
+                color = ConsoleStyle.GREEN
+            elif description.startswith("removed"):
+                color = ConsoleStyle.RED
+            else:
+                color = ConsoleStyle.YELLOW
+
+            print(f"{color}{key}: {description}{ConsoleStyle.END}")
+    else:
+        print(f"{ConsoleStyle.GREEN}No differences found.{ConsoleStyle.END}")
+
+
+def report_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="mobile-strings-converter report",
+        description="Write the strings of a file to a paginated .html report, with an "
+        "index page listing the first and last key of every page. Large catalogs can "
+        "be browsed without loading a single giant table.",
+    )
+
+    parser.add_argument(
+        "input_path",
+        type=str,
+        help="Supported file or `gsheet://` path to read the strings from.",
+    )
+    parser.add_argument(
+        "-f",
+        "--output-file",
+        required=True,
+        type=str,
+        metavar="FILE_PATH",
+        help="File path to save the index page. The pages are saved in a "
+        "`<name>-pages` directory next to it.",
+    )
+    parser.add_argument(
+        "--page-size",
+        required=False,
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        metavar="ROWS",
+        help=f"Number of strings per page. Defaults to {DEFAULT_PAGE_SIZE}.",
+    )
+    parser.add_argument(
+        "--search-index",
+        required=False,
+        action="store_true",
+        help="Also save a JSON index of the keys of every page, and a search box in "
+        "the index page that looks them up. The search only works if the report is "
+        "served over HTTP.",
+    )
+    parser.add_argument(
+        "-p",
+        "--print-comments",
+        required=False,
+        action="store_true",
+        help="Include the commented strings of the input file.",
+    )
+    parser.add_argument(
+        "--duplicates",
+        required=False,
+        choices=DUPLICATE_POLICIES,
+        help="What to do with the keys repeated in the input file. See the main "
+        "command.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        type=str,
+        metavar="DIR_PATH",
+        help="Directory where the strings extracted from the input files are cached.",
+    )
+
+    args = parser.parse_args(argv)
+
+    output_filepath = Path(args.output_file)
+    if output_filepath.suffix != ".html":
+        raise ValueError(
+            f"{ConsoleStyle.RED}The report must be saved to a .html file."
+            f"{ConsoleStyle.END}"
+        )
+
+    # The pages are written as the strings are read, unless a duplicate policy or
+    # the cache needs all of them first
+    if args.duplicates is None and not args.cache_dir:
+        strings = iter_strings(args.input_path, args.print_comments)
+    else:
+        strings = get_strings(
+            args.input_path,
+            args.print_comments,
+            StringsCache(Path(args.cache_dir)) if args.cache_dir else None,
+            duplicates=args.duplicates,
+        )
+
+    output_filepath.parent.mkdir(parents=True, exist_ok=True)
+    count = to_html_report(strings, output_filepath, args.page_size, args.search_index)
+
+    print(
+        f"{ConsoleStyle.GREEN}Report of {count} strings written to "
+        f"{output_filepath}{ConsoleStyle.END}"
+    )
+
+
+def validate_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="mobile-strings-converter validate",
+        description="Check that the placeholders of every translation, like `%1$s`, "
+        "`%@` or `{name}`, match the ones of the same key in the reference locale. "
+        "Exits with status 1 if any of them doesn't.",
+    )
+
+    parser.add_argument(
+        "input_dirs",
+        type=str,
+        nargs="+",
+        help="Resource directories to search for the strings files of every locale.",
+    )
+    parser.add_argument(
+        "-f",
+        "--output-file",
+        required=False,
+        type=str,
+        metavar="FILE_PATH",
+        help="File path to save the report, with a row per violation. Any supported "
+        "output file type can be used. The report is printed if not specified.",
+    )
+    parser.add_argument(
+        "--reference-locale",
+        required=False,
+        type=str,
+        default=DEFAULT_LOCALE,
+        metavar="LOCALE",
+        help="Locale with the placeholders that every translation must use. Defaults "
+        "to the `values` or `Base.lproj` directory.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        metavar="N",
+        help="Number of processes used to parse the locales. Defaults to the number "
+        "of CPUs.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        type=str,
+        metavar="DIR_PATH",
+        help="Directory where the strings extracted from the input files are cached.",
+    )
+    parser.add_argument(
+        "--include",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Only read the files matching the glob pattern. Can be specified "
+        "multiple times.",
+    )
+    parser.add_argument(
+        "--exclude",
+        required=False,
+        action="append",
+        metavar="GLOB",
+        help="Skip the files and directories matching the glob pattern. Can be "
+        "specified multiple times.",
+    )
+
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog_from_dirs(
+        args.input_dirs,
+        with_comments=False,
+        max_workers=args.jobs,
+        cache=StringsCache(Path(args.cache_dir)) if args.cache_dir else None,
+        include=args.include,
+        exclude=args.exclude,
+    )
+    violations = validate_placeholders(catalog, args.reference_locale)
+    report = violations_to_strings(violations)
+
+    if args.output_file:
+        output_filepath = Path(args.output_file)
+        output_filepath.parent.mkdir(parents=True, exist_ok=True)
+        write_strings(report, output_filepath)
+    else:
+        for key, description in report:
+            print(f"{ConsoleStyle.RED}{key}: {description}{ConsoleStyle.END}")
+
+    if report:
+        print(
+            f"{ConsoleStyle.RED}{len(report)} placeholder mismatch(es) found in "
+            f"{len(violations)} locale(s).{ConsoleStyle.END}"
+        )
+        return 1
+
+    print(
+        f"{ConsoleStyle.GREEN}The placeholders of {len(catalog.locales)} locale(s) "
+        f"and {len(catalog)} key(s) match.{ConsoleStyle.END}"
+    )
+    return 0
+
+
+def load_catalog_from_dirs(
+    input_dirs,
+    with_comments,
+    max_workers,
+    cache,
+    duplicates=None,
+    include=None,
+    exclude=None,
+    excluded_dirs=DEFAULT_EXCLUDED_DIRS,
+):
+    """
+    Finds the strings files of every locale in the input directories and loads them
+    into one catalog.
+    """
+
+    locale_files = {}
+    for input_dir in input_dirs:
+        if not os.path.isdir(input_dir):
+            raise ValueError(
+                f"{ConsoleStyle.RED}{input_dir} is not a directory.{ConsoleStyle.END}"
+            )
+
+        for locale, filepaths in discover_locale_files(
+            input_dir, include=include, exclude=exclude, excluded_dirs=excluded_dirs
+        ).items():
+            locale_files.setdefault(locale, []).extend(filepaths)
+
+    if not locale_files:
+        raise ValueError(
+            f"{ConsoleStyle.RED}No strings files found in {', '.join(input_dirs)}."
+            f"{ConsoleStyle.END}"
+        )
+
+    return load_catalog(locale_files, with_comments, max_workers, cache, duplicates)
+
+
+def watch_input_paths(input_paths, path_filter, convert_input_filepaths, output_path):
+    """
+    Converts the input files again every time they change, until the process is
+    interrupted. The converter stays loaded between conversions, so state that is
+    expensive to build, like the language detector used for .pdf files, is reused.
+    Changes to `output_path` are ignored, since they are caused by the conversions.
+    """
+
+    input_paths = [Path(path).resolve() for path in input_paths]
+    output_path = output_path.resolve()
+
+    print(
+        f"{ConsoleStyle.GREEN}Watching {', '.join(map(str, input_paths))} for "
+        f"changes. Press Ctrl+C to stop.{ConsoleStyle.END}"
+    )
+
+    watcher = create_watcher(
+        input_paths, path_filter.extensions, path_filter.excluded_dirs
+    )
+
+    def is_input_filepath(filepath):
+        if filepath == output_path or output_path in filepath.parents:
+            return False
+
+        for input_path in input_paths:
+            if filepath == input_path:
+                return True
+
+            if input_path in filepath.parents:
+                return path_filter.is_included(
+                    filepath.relative_to(input_path).as_posix()
+                )
+
+        return False
+
+    def on_change(changed_filepaths):
+        changed_filepaths = [
+            filepath
+            for filepath in changed_filepaths
+            if is_input_filepath(filepath.resolve())
+        ]
+        if not changed_filepaths:
+            return
+
+        try:
+            convert_input_filepaths(changed_filepaths)
+        except Exception as e:
+            # Keep watching, the file may be fixed in the next write
+            print(f"{ConsoleStyle.RED}{e}{ConsoleStyle.END}")
 
-        convert_strings(input_filepath, output_filepath, args.print_comments)
+    try:
+        watch(watcher, on_change)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .compression import get_format_suffix
+from .utils import get_file_hash
+
+# Default maximum size of the cache directory, in bytes
+DEFAULT_MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+# Bump it whenever the layout of the cached entries changes
+CACHE_FORMAT_VERSION = 1
+
+CACHE_FILE_SUFFIX = ".pickle"
+
+# Files modified more recently than this are always hashed again (2 seconds)
+RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+
+def get_default_cache_dir() -> Path:
+    """
+    Returns the directory where the cache is saved when no other is specified:
+    `$XDG_CACHE_HOME/mobile-strings-converter`, or `~/.cache/mobile-strings-converter`
+    if the variable is not set.
+
+    :return: The default cache directory
+    :rtype: Path
+    """
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(cache_home) / "mobile-strings-converter"
+
+
+class StringsCache:
+    """
+    On-disk cache of the strings extracted from the input files.
+
+    The entries are keyed by the hash of the file content plus the options used to
+    read it, so a modified file never hits a stale entry. They are stored as pickles,
+    which load an order of magnitude faster than parsing .xlsx, .ods or .pdf files.
+    The least recently used entries are evicted once the cache exceeds its maximum
+    size.
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        """
+        :param cache_dir: Directory where the cache entries are saved. It will be
+            created if it does not already exist
+        :type cache_dir: Path
+        :param max_size: Maximum size of the cache directory, in bytes
+        :type max_size: int
+        """
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+        # File hashes indexed by path, size and modification time, so the content of
+        # an unmodified file is not hashed again in the same process
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def get_key(self, *parts: str, **options) -> str:
+        """
+        Returns the key of the strings identified by the given parts and read with the
+        given options. The parts must change whenever the source of the strings does,
+        e.g. a hash of the file content or the revision of a remote document.
+
+        :param parts: Values identifying the content the strings are extracted from
+        :type parts: str
+        :param options: Options passed to the function reading the strings
+        :return: Key of the cache entry
+        :rtype: str
+        """
+
+        # Imported here to avoid a circular import with the package `__init__`
+        from . import __version__
+
+        key_parts = [str(CACHE_FORMAT_VERSION), __version__, *parts]
+        key_parts.extend(f"{name}={options[name]!r}" for name in sorted(options))
+
+        return hashlib.sha256("\0".join(key_parts).encode("utf-8")).hexdigest()
+
+    def get_file_key(self, filepath: Path, **options) -> str:
+        """
+        Returns the key of the strings extracted from the file with the given options.
+
+        :param filepath: File the strings are extracted from
+        :type filepath: Path
+        :param options: Options passed to the function reading the file
+        :return: Key of the cache entry
+        :rtype: str
+        """
+
+        stat = os.stat(filepath)
+        stat_key = (str(Path(filepath).resolve()), stat.st_size, stat.st_mtime_ns)
+
+        file_hash = self._file_hashes.get(stat_key)
+
+        if file_hash is None:
+            file_hash = get_file_hash(filepath)
+
+            # A file modified twice within the timestamp granularity keeps the same
+            # size and modification time, so only settled files are memoized
+            if time.time_ns() - stat.st_mtime_ns > RACY_MTIME_WINDOW_NS:
+                self._file_hashes[stat_key] = file_hash
+
+        return self.get_key(file_hash, get_format_suffix(filepath), **options)
+
+    def get(self, key: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Returns the strings cached with the given key, or None if there are none.
+
+        :param key: Key of the cache entry
+        :type key: str
+        :return: The cached strings, or None on a cache miss
+        :rtype: Optional[List[Tuple[str, str]]]
+        """
+
+        entry_filepath = self._get_entry_filepath(key)
+
+        try:
+            with open(entry_filepath, "rb") as file:
+                strings = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Corrupt entries are treated as misses and replaced on the next `set`
+            return None
+
+        # Mark the entry as recently used for the LRU eviction
+        try:
+            os.utime(entry_filepath)
+        except OSError:
+            pass
+
+        return strings
+
+    def set(self, key: str, strings: List[Tuple[str, str]]):
+        """
+        Caches the strings with the given key and evicts the least recently used
+        entries if the cache exceeds its maximum size.
+
+        :param key: Key of the cache entry
+        :type key: str
+        :param strings: Strings to cache
+        :type strings: List[Tuple[str, str]]
+        """
+
+        entry_filepath = self._get_entry_filepath(key)
+        temp_filepath = entry_filepath.with_name(f"{entry_filepath.name}.{os.getpid()}")
+
+        with open(temp_filepath, "wb") as file:
+            pickle.dump(list(strings), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_filepath, entry_filepath)
+
+        self._evict()
+
+    def clear(self):
+        """Removes every entry from the cache."""
+
+        for entry_filepath in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                entry_filepath.unlink()
+            except FileNotFoundError:
+                pass
+
+    # Private methods
+
+    def _get_entry_filepath(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+
+        for entry_filepath in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = entry_filepath.stat()
+            except FileNotFoundError:
+                # Removed by another process in the meantime
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_filepath))
+            total_size += stat.st_size
+
+        # Remove the least recently used entries first
+        entries.sort()
+
+        for _, size, entry_filepath in entries:
+            if total_size <= self.max_size:
+                break
+
+            try:
+                entry_filepath.unlink()
+            except FileNotFoundError:
+                pass
+
+            total_size -= size
@@ -0,0 +1,444 @@
+import csv
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import openpyxl
+
+from .cache import StringsCache
+from .compression import get_format_suffix, is_stream_path, open_file, write_seekable
+from .console_style import ConsoleStyle
+from .converter import get_strings
+from .sqlite import write_sqlite
+from .utils import DEFAULT_EXCLUDED_DIRS, get_filepaths_from_dir
+
+# Locale of the `values` directory of Android and the `Base.lproj` one of iOS
+DEFAULT_LOCALE = "default"
+
+# Names of the strings files looked for in the locale directories
+DEFAULT_CATALOG_FILENAMES = ("strings.xml", "Localizable.strings")
+
+# `values-es`, `values-pt-rBR` or `values-b+sr+Latn`, but not `values-night` or
+# `values-v21`
+ANDROID_LOCALE_DIR_PATTERN = re.compile(
+    r"values-(?:(?P<language>[a-z]{2,3})(?:-r(?P<region>[A-Z]{2}))?"
+    r"|b\+(?P<bcp47>[a-zA-Z0-9+]+))"
+)
+
+# `es.lproj`, `pt-BR.lproj` or `zh-Hans.lproj`
+IOS_LOCALE_DIR_PATTERN = re.compile(
+    r"(?P<locale>[A-Za-z]{2,3}(?:[-_][A-Za-z0-9]+)*)\.lproj"
+)
+
+
+class Catalog:
+    """
+    Table of the strings of several locales, with the keys as rows and the locales as
+    columns.
+
+    The keys are stored once, in the order they are first found, along with an index
+    from each key to its row. Each locale only stores a column with its values in the
+    order of the rows, so looking up a key in any locale takes constant time. A column
+    may be shorter than the table when the keys after its end were added by other
+    locales, and missing values are None.
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.key_index: Dict[str, int] = {}
+        self.columns: Dict[str, List[Optional[str]]] = {}
+
+    @property
+    def locales(self) -> List[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add_locale(self, locale: str, strings: Iterable[Tuple[str, str]]):
+        """
+        Adds a column with the strings of a locale. If a key is repeated, its last
+        value is kept.
+
+        :param locale: Locale of the strings, e.g. `es` or `pt-BR`
+        :type locale: str
+        :param strings: Strings extracted with `get_strings`
+        :type strings: Iterable[Tuple[str, str]]
+        """
+
+        column = self.columns.setdefault(locale, [])
+
+        for name, value in strings:
+            row = self.key_index.get(name)
+
+            if row is None:
+                row = len(self.keys)
+                self.key_index[name] = row
+                self.keys.append(name)
+
+            if row >= len(column):
+                column.extend([None] * (row + 1 - len(column)))
+
+            column[row] = value
+
+    def get(self, key: str, locale: str) -> Optional[str]:
+        """
+        :param key: Name of the string
+        :type key: str
+        :param locale: Locale of the value
+        :type locale: str
+        :return: The value of the key in the locale, or None if it is missing
+        :rtype: Optional[str]
+        """
+
+        row = self.key_index.get(key)
+        column = self.columns.get(locale)
+
+        if row is None or column is None or row >= len(column):
+            return None
+
+        return column[row]
+
+    def get_strings(self, locale: str) -> List[Tuple[str, str]]:
+        """
+        :param locale: Locale of the strings
+        :type locale: str
+        :return: The strings of the locale in the same format as `get_strings`,
+            skipping the missing ones
+        :rtype: List[Tuple[str, str]]
+        """
+
+        column = self.columns[locale]
+
+        return [
+            (self.keys[row], value)
+            for row, value in enumerate(column)
+            if value is not None
+        ]
+
+    def iter_rows(self) -> Iterator[Tuple[str, List[Optional[str]]]]:
+        """
+        Yields every key along with its values in the order of `locales`.
+
+        :return: Iterator of (key, values) tuples
+        :rtype: Iterator[Tuple[str, List[Optional[str]]]]
+        """
+
+        columns = list(self.columns.values())
+
+        for row, key in enumerate(self.keys):
+            yield key, [
+                column[row] if row < len(column) else None for column in columns
+            ]
+
+
+def discover_locale_files(
+    root_dir: Union[str, Path],
+    filenames: Sequence[str] = DEFAULT_CATALOG_FILENAMES,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+) -> Dict[str, List[Path]]:
+    """
+    Finds the strings files of every locale under an Android or iOS resource tree:
+    `values/strings.xml` and `values-<locale>/strings.xml` for Android, and
+    `<locale>.lproj/Localizable.strings` for iOS. The Android region qualifiers are
+    converted to BCP 47, so `values-pt-rBR` and `pt-BR.lproj` are the same locale.
+    Directories with other qualifiers, like `values-night`, are skipped.
+
+    :param root_dir: Directory to search
+    :type root_dir: Union[str, Path]
+    :param filenames: Names of the strings files
+    :type filenames: Sequence[str]
+    :param include: Glob patterns that the files must match. See `PathFilter`
+    :type include: Optional[Iterable[str]]
+    :param exclude: Glob patterns of the files and directories to skip. See
+        `PathFilter`
+    :type exclude: Optional[Iterable[str]]
+    :param excluded_dirs: Names of the directories that are never visited
+    :type excluded_dirs: Iterable[str]
+    :return: The files of each locale, with the default locale first and the rest
+        sorted by name
+    :rtype: Dict[str, List[Path]]
+    """
+
+    locale_files: Dict[str, List[Path]] = {}
+    extensions = {Path(filename).suffix for filename in filenames}
+
+    for filepath in get_filepaths_from_dir(
+        root_dir, extensions, include, exclude, excluded_dirs
+    ):
+        if filepath.name not in filenames:
+            continue
+
+        locale = get_locale_from_dir(filepath.parent.name)
+
+        if locale is not None:
+            locale_files.setdefault(locale, []).append(filepath)
+
+    return {
+        locale: sorted(locale_files[locale])
+        for locale in sorted(locale_files, key=lambda l: (l != DEFAULT_LOCALE, l))
+    }
+
+
+def get_locale_from_dir(dirname: str) -> Optional[str]:
+    """
+    :param dirname: Name of an Android `values*` or iOS `*.lproj` directory
+    :type dirname: str
+    :return: The locale of the directory in BCP 47 format, `DEFAULT_LOCALE` for the
+        default resources, or None if it is not a locale directory
+    :rtype: Optional[str]
+    """
+
+    if dirname in ("values", "Base.lproj"):
+        return DEFAULT_LOCALE
+
+    if match := ANDROID_LOCALE_DIR_PATTERN.fullmatch(dirname):
+        if match.group("bcp47"):
+            return match.group("bcp47").replace("+", "-")
+
+        if match.group("region"):
+            return f"{match.group('language')}-{match.group('region')}"
+
+        return match.group("language")
+
+    if match := IOS_LOCALE_DIR_PATTERN.fullmatch(dirname):
+        return match.group("locale").replace("_", "-")
+
+    return None
+
+
+def load_catalog(
+    locale_files: Mapping[str, Sequence[Path]],
+    with_comments: bool = False,
+    max_workers: Optional[int] = None,
+    cache: Optional[StringsCache] = None,
+    duplicates: Optional[str] = None,
+) -> Catalog:
+    """
+    Parses the files of every locale in parallel and assembles them into a catalog.
+
+    The files are parsed on a process pool, since the regular expressions of the
+    readers hold the GIL. If a locale has several files, e.g. one per module, their
+    strings are added in order.
+
+    :param locale_files: Files of each locale. See `discover_locale_files`
+    :type locale_files: Mapping[str, Sequence[Path]]
+    :param with_comments: True to include the commented strings of .strings/.xml
+        files
+    :type with_comments: bool
+    :param max_workers: Maximum number of processes. 1 parses the files in the
+        calling process. Defaults to the number of CPUs
+    :type max_workers: Optional[int]
+    :param cache: Cache of the extracted strings. See `get_strings`
+    :type cache: Optional[StringsCache]
+    :param duplicates: What to do with the keys repeated in a file. See
+        `resolve_duplicates`. The last value of a key wins if it is still repeated
+    :type duplicates: Optional[str]
+    :return: The catalog with a column per locale, in the order of `locale_files`
+    :rtype: Catalog
+    """
+
+    locales = list(locale_files)
+    arguments = [
+        (locale_files[locale], with_comments, cache, duplicates) for locale in locales
+    ]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # Starting the processes is not worth it if they can't run in parallel
+    if max_workers == 1 or len(locales) <= 1:
+        locale_strings = map(_get_locale_strings, arguments)
+        return _build_catalog(locales, locale_strings)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        locale_strings = executor.map(_get_locale_strings, arguments)
+        return _build_catalog(locales, locale_strings)
+
+
+def write_catalog(catalog: Catalog, output_filepath: Path):
+    """
+    Writes the catalog as a single table with a column per locale. The rows are
+    streamed from the catalog, so the table is never copied in memory.
+
+    Supported formats:
+    - .csv
+    - .xlsx
+    - .json: a list with an object per key, with the value of every locale
+    - .sqlite, .db: a `strings` table with a row per value and its locale
+
+    Every format can also be compressed, e.g. `catalog.csv.gz`.
+
+    :param catalog: Catalog to write
+    :type catalog: Catalog
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    writers: Dict[str, Callable[[Catalog, Path], None]] = {
+        ".csv": catalog_to_csv,
+        ".xlsx": catalog_to_xlsx,
+        ".json": catalog_to_json,
+        ".sqlite": catalog_to_sqlite,
+        ".db": catalog_to_sqlite,
+    }
+
+    suffix = get_format_suffix(output_filepath)
+
+    if suffix not in writers:
+        raise ValueError(
+            f"{ConsoleStyle.YELLOW}Catalogs can only be written to "
+            f"{', '.join(writers)} files.{ConsoleStyle.END}"
+        )
+
+    writers[suffix](catalog, output_filepath)
+
+    # The message would be mixed with the catalog written to stdout
+    if is_stream_path(output_filepath):
+        return
+
+    print(
+        f"{ConsoleStyle.GREEN}Catalog of {len(catalog.locales)} locale(s) and "
+        f"{len(catalog)} key(s) successfully written to {output_filepath}"
+        f"{ConsoleStyle.END}"
+    )
+
+
+def catalog_to_csv(catalog: Catalog, output_filepath: Path):
+    """
+    Formats the catalog to a .csv file
+
+    :param catalog: Catalog to write
+    :type catalog: Catalog
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    with open_file(output_filepath, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+
+        # Write the header row
+        writer.writerow(["name", *catalog.locales])
+
+        # Write the data to the file
+        for key, values in catalog.iter_rows():
+            writer.writerow([key, *values])
+
+
+def catalog_to_xlsx(catalog: Catalog, output_filepath: Path):
+    """
+    Formats the catalog to a .xlsx file
+
+    :param catalog: Catalog to write
+    :type catalog: Catalog
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    # Write-only workbooks stream the rows to the file instead of keeping every cell
+    # in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    # Write the header row
+    sheet.append(["NAME", *catalog.locales])
+
+    # Write the data to the sheet
+    for key, values in catalog.iter_rows():
+        sheet.append([key, *values])
+
+    # Save the file
+    write_seekable(output_filepath, workbook.save)
+
+
+def catalog_to_json(catalog: Catalog, output_filepath: Path):
+    """
+    Formats the catalog to a .json file
+
+    :param catalog: Catalog to write
+    :type catalog: Catalog
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    locales = catalog.locales
+
+    with open_file(output_filepath, "w", encoding="utf-8") as file:
+        file.write("[")
+
+        # Write one object at a time, with the same layout as `json.dump(indent=2)`
+        for i, (key, values) in enumerate(catalog.iter_rows()):
+            record = {"name": key, **dict(zip(locales, values))}
+            text = json.dumps(record, ensure_ascii=False, indent=2)
+
+            file.write("," if i else "")
+            file.write("\n  ")
+            file.write(text.replace("\n", "\n  "))
+
+        file.write("\n]" if len(catalog) else "]")
+
+
+def catalog_to_sqlite(catalog: Catalog, output_filepath: Path):
+    """
+    Formats the catalog to a SQLite database. Each locale is stored as the strings
+    written by `to_sqlite`, skipping the missing values, so the strings of a locale
+    are read back with `get_strings_from_sqlite`.
+
+    :param catalog: Catalog to write
+    :type catalog: Catalog
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    keys = catalog.keys
+
+    write_sqlite(
+        (
+            (locale, keys[row], value)
+            for locale, column in catalog.columns.items()
+            for row, value in enumerate(column)
+            if value is not None
+        ),
+        output_filepath,
+    )
+
+
+def _get_locale_strings(
+    arguments: Tuple[Sequence[Path], bool, Optional[StringsCache], Optional[str]],
+) -> List[Tuple[str, str]]:
+    filepaths, with_comments, cache, duplicates = arguments
+    strings = []
+
+    for filepath in filepaths:
+        strings.extend(
+            get_strings(Path(filepath), with_comments, cache, duplicates=duplicates)
+        )
+
+    return strings
+
+
+def _build_catalog(
+    locales: Sequence[str], locale_strings: Iterable[List[Tuple[str, str]]]
+) -> Catalog:
+    catalog = Catalog()
+
+    for locale, strings in zip(locales, locale_strings):
+        catalog.add_locale(locale, strings)
+
+    return catalog
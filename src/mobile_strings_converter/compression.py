@@ -0,0 +1,328 @@
+import bz2
+import gzip
+import io
+import itertools
+import lzma
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    IO,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from .console_style import ConsoleStyle
+
+# zstd is in the standard library since Python 3.14, and the zstandard package
+# provides the same `open` function for older versions. Both are optional
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+# Suffixes of the compressed files, e.g. `strings.json.gz`. The suffix before them
+# picks the file format
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz", ".zst")
+
+# Functions that open a compressed file like the built-in `open`
+COMPRESSION_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".zst": zstd.open if zstd is not None else None,
+}
+
+# Path given on the command line to read from stdin or write to stdout
+STDIO_PATH = "-"
+
+# Name of the paths that stand for stdin or stdout, followed by the suffixes of the
+# file type of the data, e.g. `<stdio>.json.gz`. See `get_stdio_path`
+STDIO_STEM = "<stdio>"
+
+# Name of the paths that stand for a file object given to `get_stream_path`, e.g.
+# `<stream-3>.json`. The file objects are looked up by it in `_streams`
+STREAM_STEM = "<stream-{}>"
+
+_streams: Dict[str, BinaryIO] = {}
+_stream_ids = itertools.count()
+
+
+def get_compression_suffix(filepath: Union[str, Path]) -> str:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: The compression suffix of the file, e.g. `.gz`, or an empty string if it
+        is not compressed
+    :rtype: str
+    """
+
+    suffix = Path(filepath).suffix
+    return suffix if suffix in COMPRESSION_SUFFIXES else ""
+
+
+def strip_compression_suffix(filepath: Union[str, Path]) -> Path:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: The path without its compression suffix, e.g. `strings.json` for
+        `strings.json.gz`
+    :rtype: Path
+    """
+
+    filepath = Path(filepath)
+
+    if get_compression_suffix(filepath):
+        return filepath.with_suffix("")
+
+    return filepath
+
+
+def get_format_suffix(filepath: Union[str, Path]) -> str:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: The suffix that picks the format of the file, e.g. `.json` for both
+        `strings.json` and `strings.json.gz`
+    :rtype: str
+    """
+
+    return strip_compression_suffix(filepath).suffix
+
+
+def add_compression_suffixes(extensions: Iterable[str]) -> List[str]:
+    """
+    :param extensions: File extensions, e.g. `.json`
+    :type extensions: Iterable[str]
+    :return: The extensions followed by every compressed variant of them, e.g.
+        `.json` and `.json.gz`
+    :rtype: List[str]
+    """
+
+    extensions = list(extensions)
+
+    return extensions + [
+        extension + suffix
+        for suffix in COMPRESSION_SUFFIXES
+        for extension in extensions
+    ]
+
+
+def get_stdio_path(file_type: str) -> Path:
+    """
+    :param file_type: File type of the data read from stdin or written to stdout, e.g.
+        `.json` or `.json.gz`
+    :type file_type: str
+    :return: A path that `open_file` opens as stdin or stdout, with the suffixes of
+        the file type, so the readers and writers are picked like for any other path
+    :rtype: Path
+    """
+
+    return Path(STDIO_STEM + file_type)
+
+
+def is_stdio_path(filepath: Union[str, Path]) -> bool:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: True if the path was returned by `get_stdio_path`
+    :rtype: bool
+    """
+
+    return str(filepath).startswith(STDIO_STEM)
+
+
+@contextmanager
+def get_stream_path(stream: BinaryIO, file_type: str) -> Iterator[Path]:
+    """
+    Lets a binary file object, e.g. a `BytesIO`, a socket file or a spooled temporary
+    file, be read or written by the functions that take a path. The file object is
+    neither closed nor rewound.
+
+    :param stream: Binary file object to read from or write to
+    :type stream: BinaryIO
+    :param file_type: File type of the data, e.g. `.json` or `.json.gz`
+    :type file_type: str
+    :return: A path that `open_file` opens as the file object while the context is
+        active, with the suffixes of the file type
+    :rtype: Iterator[Path]
+    """
+
+    stem = STREAM_STEM.format(next(_stream_ids))
+    _streams[stem] = stream
+
+    try:
+        yield Path(stem + file_type)
+    finally:
+        del _streams[stem]
+
+
+def is_stream_path(filepath: Union[str, Path]) -> bool:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: True if the path was returned by `get_stdio_path` or `get_stream_path`,
+        so it can't be hashed, reopened or written next to
+    :rtype: bool
+    """
+
+    return is_stdio_path(filepath) or _get_stream_stem(filepath) in _streams
+
+
+def open_file(
+    filepath: Union[str, Path],
+    mode: str = "r",
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+) -> IO:
+    """
+    Opens a file like the built-in `open`, decompressing or compressing it on the fly
+    if it has a compression suffix. The data is streamed through the codec, so no
+    decompressed copy of the file is written nor held in memory.
+
+    The paths returned by `get_stdio_path` are opened as stdin when reading and as
+    stdout when writing, and the ones returned by `get_stream_path` as their file
+    object. Closing the returned file flushes them but leaves them open.
+
+    :param filepath: Path of the file
+    :type filepath: Union[str, Path]
+    :param mode: Mode of the file, e.g. `r`, `wb`
+    :type mode: str
+    :param encoding: Encoding of a file opened in text mode
+    :type encoding: Optional[str]
+    :param newline: Newline mode of a file opened in text mode
+    :type newline: Optional[str]
+    :return: The file object
+    :rtype: IO
+    """
+
+    compression_suffix = get_compression_suffix(filepath)
+
+    if is_stream_path(filepath):
+        # The openers also take file objects
+        filepath = _BorrowedStream(_get_stream(filepath, mode))
+
+        if not compression_suffix and "b" in mode:
+            return filepath
+        if not compression_suffix:
+            return io.TextIOWrapper(filepath, encoding=encoding, newline=newline)
+    elif not compression_suffix:
+        return open(filepath, mode, encoding=encoding, newline=newline)
+
+    opener = COMPRESSION_OPENERS[compression_suffix]
+    if opener is None:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Reading and writing {compression_suffix} files "
+            f"requires Python 3.14 or the zstandard package.{ConsoleStyle.END}"
+        )
+
+    # The openers default to binary mode
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+
+    if "b" in mode:
+        return opener(filepath, mode)
+
+    return opener(filepath, mode, encoding=encoding, newline=newline)
+
+
+def read_seekable(filepath: Union[str, Path]) -> Union[Path, BinaryIO]:
+    """
+    Returns a source that the readers of formats needing random access, like the zip
+    containers of .xlsx and .ods files, can read.
+
+    :param filepath: Path of the file
+    :type filepath: Union[str, Path]
+    :return: The path itself, or the decompressed content of the file in memory if it
+        is compressed or a stream
+    :rtype: Union[Path, BinaryIO]
+    """
+
+    if not get_compression_suffix(filepath) and not is_stream_path(filepath):
+        return Path(filepath)
+
+    with open_file(filepath, "rb") as file:
+        return io.BytesIO(file.read())
+
+
+def write_seekable(
+    filepath: Union[str, Path], write: Callable[[Union[Path, BinaryIO]], None]
+):
+    """
+    Calls a writer of a format needing random access, like the zip containers of .xlsx
+    files, with the path of the file, or with a buffer that is then compressed to the
+    file if it has a compression suffix, or written to its stream.
+
+    :param filepath: Path of the file
+    :type filepath: Union[str, Path]
+    :param write: Writes the file to the path or buffer it is called with
+    :type write: Callable[[Union[Path, BinaryIO]], None]
+    """
+
+    if not get_compression_suffix(filepath) and not is_stream_path(filepath):
+        write(Path(filepath))
+        return
+
+    buffer = io.BytesIO()
+    write(buffer)
+
+    with open_file(filepath, "wb") as file:
+        file.write(buffer.getbuffer())
+
+
+def _get_stream_stem(filepath: Union[str, Path]) -> str:
+    name = str(filepath)
+    return name[: name.find(">") + 1]
+
+
+def _get_stream(filepath: Union[str, Path], mode: str) -> BinaryIO:
+    if is_stdio_path(filepath):
+        return sys.stdin.buffer if "r" in mode else sys.stdout.buffer
+
+    return _streams[_get_stream_stem(filepath)]
+
+
+class _BorrowedStream(io.BufferedIOBase):
+    """
+    Binary stdin, stdout or file object of the caller that is flushed, but not closed,
+    when it is closed, so the text and compressed files opened on top of it can be
+    closed like any other file.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return self._stream.readable()
+
+    def writable(self) -> bool:
+        return self._stream.writable()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._stream.read(size)
+
+    def read1(self, size: int = -1) -> bytes:
+        # Not every file object, e.g. a raw socket file, has `read1`
+        return getattr(self._stream, "read1", self._stream.read)(size)
+
+    def readinto(self, buffer) -> int:
+        data = self.read1(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def write(self, data) -> int:
+        return self._stream.write(data)
+
+    def flush(self):
+        if not self.closed and self._stream.writable():
+            self._stream.flush()
@@ -1,28 +1,119 @@
 import csv
+import io
 import json
 import os
 import re
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from itertools import islice
+from json.scanner import make_scanner
 from pathlib import Path
-from typing import List, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import ezodf
-import gspread
 import openpyxl
 import yaml
 from arabic_reshaper import reshape
 from bidi.algorithm import get_display
 from fpdf import FPDF
-from google.oauth2.credentials import Credentials
-from lingua import LanguageDetectorBuilder
+from lingua import LanguageDetector, LanguageDetectorBuilder
+from lxml import etree
 from PyPDF2 import PdfReader
 
+from .cache import StringsCache, get_default_cache_dir
+from .compression import (
+    get_format_suffix,
+    get_stream_path,
+    is_stream_path,
+    open_file,
+    read_seekable,
+    strip_compression_suffix,
+    write_seekable,
+)
 from .console_style import ConsoleStyle
+from .emitter import (
+    HTML_EMITTER,
+    IOS_EMITTER,
+    MD_EMITTER,
+    XML_EMITTER,
+    unescape_md_breaks,
+)
+from .google_sheets import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    authorize,
+    get_client,
+    get_input_stem,
+    get_strings_from_google_sheets,
+    is_google_sheets_url,
+    parse_google_sheets_url,
+    sync_strings,
+    upload_many,
+    upload_strings,
+)
+from .mscat import get_strings_from_mscat, to_mscat
+from .patch import is_patchable, patch_strings
+from .sqlite import get_strings_from_sqlite, to_sqlite
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Backends of the .json reader and writer. orjson is optional
+JSON_BACKENDS = ("json", "orjson")
+
+# Number of records encoded at once by the orjson backend of the .json writer
+JSON_BATCH_SIZE = 1000
+
+# Number of characters read at once by the incremental .json reader
+JSON_READ_CHUNK_SIZE = 1 << 16
+
+JSON_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+JSON_SEPARATOR_PATTERN = re.compile(r"[ \t\n\r]*,[ \t\n\r]*")
+
+# Row below the header of a Markdown table, e.g. `| --- | :---: |`
+MD_DELIMITER_ROW_PATTERN = re.compile(r"[|\s]*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?")
+
+# Number of bytes read at once by the incremental .html reader
+HTML_READ_CHUNK_SIZE = 1 << 16
+
+# libyaml-based implementations, or the pure Python ones if PyYAML was built without
+# libyaml
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Policies for the keys that appear more than once in a file. See `resolve_duplicates`
+DUPLICATE_POLICIES = ("error", "first", "last", "report")
+
+# Formats whose writers write the strings as they are iterated, so they can be given
+# the strings while the input is still being read. See `iter_strings`
+STREAMING_WRITER_FORMATS = (".csv", ".md", ".json", ".html", ".strings", ".xml")
 
 
 def convert_strings(
-    input_filepath: Path, output_filepath: Path, with_comments: bool = False
+    input_filepath: Union[str, Path],
+    output_filepath: Path,
+    with_comments: bool = False,
+    cache: Optional[StringsCache] = None,
+    credentials_filepath: Optional[Path] = None,
+    duplicates: Optional[str] = None,
+    patch: bool = False,
 ):
     """
     Extracts strings from the input file in either .xml or .strings format and converts
@@ -40,49 +131,212 @@ def convert_strings(
     - .strings: to_ios
     - .xml: to_android
     - .pdf: to_pdf
+    - .mscat: to_mscat
+    - .sqlite: to_sqlite
+    - .db: to_sqlite
 
-    :param input_filepath: .strings or .xml file to extract the strings
-    :type input_filepath: Path
+    :param input_filepath: .strings or .xml file to extract the strings, or a
+        `gsheet://` path. See `get_strings`
+    :type input_filepath: Union[str, Path]
     :param output_filepath: Name of the sheet to be generated
     :type output_filepath: Path
     :param with_comments: True if the user wants to include comments from
         .strings/.xml to the output file
     :type with_comments: bool
+    :param cache: Cache of the extracted strings. See `get_strings`
+    :type cache: Optional[StringsCache]
+    :param credentials_filepath: Path to the service_account.json used to read
+        `gsheet://` inputs. See `get_strings`
+    :type credentials_filepath: Optional[Path]
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    :param patch: True to patch the output file if it is an existing .xml or .strings
+        file. See `patch_strings`
+    :type patch: bool
     """
 
-    strings = get_strings(input_filepath, with_comments)
+    strings = get_strings(
+        input_filepath, with_comments, cache, credentials_filepath, duplicates
+    )
 
     if output_filepath:
-        conversion_functions = {
-            ".csv": to_csv,
-            ".xlsx": to_sheet,
-            ".ods": to_sheet,
-            ".md": to_md,
-            ".json": to_json,
-            ".yaml": to_yaml,
-            ".html": to_html,
-            ".strings": to_ios,
-            ".xml": to_android,
-            ".pdf": to_pdf,
+        write_strings(strings, output_filepath, patch)
+
+
+def convert_strings_to_many(
+    input_filepath: Union[str, Path],
+    output_filepaths: List[Path],
+    with_comments: bool = False,
+    max_workers: Optional[int] = None,
+    cache: Optional[StringsCache] = None,
+    credentials_filepath: Optional[Path] = None,
+    duplicates: Optional[str] = None,
+    patch: bool = False,
+):
+    """
+    Extracts strings from the input file only once and writes them to every output
+    file. The writers run concurrently on a thread pool, except for the .pdf one,
+    which runs on the calling thread because it redirects the global stdout/stderr
+    while saving the file.
+
+    :param input_filepath: File to extract the strings from, or a `gsheet://` path.
+        See `get_strings`
+    :type input_filepath: Union[str, Path]
+    :param output_filepaths: Paths of the files to be generated. Their extensions
+        determine the output file formats
+    :type output_filepaths: List[Path]
+    :param with_comments: True if the user wants to include comments from
+        .strings/.xml to the output files
+    :type with_comments: bool
+    :param max_workers: Maximum number of threads used to write the files. Defaults
+        to the `ThreadPoolExecutor` default
+    :type max_workers: Optional[int]
+    :param cache: Cache of the extracted strings. See `get_strings`
+    :type cache: Optional[StringsCache]
+    :param credentials_filepath: Path to the service_account.json used to read
+        `gsheet://` inputs. See `get_strings`
+    :type credentials_filepath: Optional[Path]
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    :param patch: True to patch the output files that are existing .xml or .strings
+        files. See `patch_strings`
+    :type patch: bool
+    """
+
+    # Fail before parsing the input if any of the outputs is not supported
+    for output_filepath in output_filepaths:
+        _get_writer(output_filepath)
+
+    # Strings read from or written to a stream, like stdin or stdout, flow from the
+    # reader to the writer, so the first ones are written before the input is fully
+    # read
+    if (
+        len(output_filepaths) == 1
+        and duplicates is None
+        and not patch
+        and get_format_suffix(output_filepaths[0]) in STREAMING_WRITER_FORMATS
+        and (is_stream_path(input_filepath) or is_stream_path(output_filepaths[0]))
+    ):
+        write_strings(iter_strings(input_filepath, with_comments), output_filepaths[0])
+        return
+
+    strings = get_strings(
+        input_filepath, with_comments, cache, credentials_filepath, duplicates
+    )
+
+    concurrent_filepaths = [
+        path for path in output_filepaths if get_format_suffix(path) != ".pdf"
+    ]
+    serial_filepaths = [
+        path for path in output_filepaths if get_format_suffix(path) == ".pdf"
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_get_writer(path, patch), strings, path): path
+            for path in concurrent_filepaths
         }
 
-        if output_filepath.suffix in conversion_functions:
-            conversion_functions[output_filepath.suffix](strings, output_filepath)
+        for output_filepath in serial_filepaths:
+            _get_writer(output_filepath, patch)(strings, output_filepath)
 
-            print(
-                f"{ConsoleStyle.GREEN}Data successfully written to {output_filepath}"
-                f"{ConsoleStyle.END}"
-            )
-        else:
-            raise ValueError(
-                f"{ConsoleStyle.YELLOW}File type not supported. Feel free to create "
-                f"an issue here (https://github.com/HenestrosaDev/mobile-strings"
-                f"-converter/issues) if you want the file type to be supported by the "
-                f"package.{ConsoleStyle.END}"
-            )
+        # Raise the first exception thrown by a writer, if any
+        for future in futures:
+            future.result()
 
+    # Printed once every writer is done so that the .pdf writer can't swallow them
+    for output_filepath in output_filepaths:
+        if is_stream_path(output_filepath):
+            continue
 
-def get_strings(input_filepath: Path, with_comments: bool) -> List[Tuple[str, str]]:
+        print(
+            f"{ConsoleStyle.GREEN}Data successfully written to {output_filepath}"
+            f"{ConsoleStyle.END}"
+        )
+
+
+def write_strings(
+    strings: List[Tuple[str, str]], output_filepath: Path, patch: bool = False
+):
+    """
+    Writes the strings to the output file using the writer that matches its extension.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: List[Tuple[str, str]]
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    :param patch: True to patch the output file if it is an existing .xml or .strings
+        file. See `patch_strings`
+    :type patch: bool
+    """
+
+    _get_writer(output_filepath, patch)(strings, output_filepath)
+
+    # There is no file to report, and the message would be mixed with the strings
+    # written to stdout
+    if is_stream_path(output_filepath):
+        return
+
+    print(
+        f"{ConsoleStyle.GREEN}Data successfully written to {output_filepath}"
+        f"{ConsoleStyle.END}"
+    )
+
+
+def _get_writer(
+    output_filepath: Path, patch: bool = False
+) -> Callable[[List[Tuple[str, str]], Path], None]:
+    """
+    Returns the function that writes strings to the file type of the output file.
+
+    :param output_filepath: Path of the file to be generated
+    :type output_filepath: Path
+    :param patch: True to return `patch_strings` if the output file is an existing
+        .xml or .strings file
+    :type patch: bool
+    :return: The writer function matching the extension of `output_filepath`
+    :rtype: Callable[[List[Tuple[str, str]], Path], None]
+    """
+
+    if patch and is_patchable(output_filepath):
+        return patch_strings
+
+    conversion_functions = {
+        ".csv": to_csv,
+        ".xlsx": to_sheet,
+        ".ods": to_sheet,
+        ".md": to_md,
+        ".json": to_json,
+        ".yaml": to_yaml,
+        ".html": to_html,
+        ".strings": to_ios,
+        ".xml": to_android,
+        ".pdf": to_pdf,
+        ".mscat": to_mscat,
+        ".sqlite": to_sqlite,
+        ".db": to_sqlite,
+    }
+
+    suffix = get_format_suffix(output_filepath)
+
+    if suffix in conversion_functions:
+        return conversion_functions[suffix]
+    else:
+        raise ValueError(
+            f"{ConsoleStyle.YELLOW}File type not supported. Feel free to create "
+            f"an issue here (https://github.com/HenestrosaDev/mobile-strings"
+            f"-converter/issues) if you want the file type to be supported by the "
+            f"package.{ConsoleStyle.END}"
+        )
+
+
+def get_strings(
+    input_filepath: Union[str, Path],
+    with_comments: bool,
+    cache: Optional[StringsCache] = None,
+    credentials_filepath: Optional[Path] = None,
+    duplicates: Optional[str] = None,
+) -> List[Tuple[str, str]]:
     """
     Extracts strings from various file formats based on the file extension.
 
@@ -97,19 +351,53 @@ def get_strings(input_filepath: Path, with_comments: bool) -> List[Tuple[str, st
     - .strings: get_strings_from_ios
     - .xml: get_strings_from_xml
     - .pdf: get_strings_from_pdf
+    - .mscat: get_strings_from_mscat
+    - .sqlite: get_strings_from_sqlite
+    - .db: get_strings_from_sqlite
 
     If the input file format is .strings or .xml, additional options are available:
     - with_comments: If True, includes comments in the extracted strings.
 
-    :param input_filepath: Path to the input file.
-    :type input_filepath: Path
+    The input can also be a Google spreadsheet, given as a `gsheet://<name>` string,
+    or `gsheet://<name>#<worksheet>` to read a worksheet other than the first one. See
+    `get_strings_from_google_sheets`. Its strings are always cached, in the default
+    cache directory if no cache is provided, so repeated reads of an unchanged
+    spreadsheet only send one lightweight request.
+
+    :param input_filepath: Path to the input file, or a `gsheet://` path.
+    :type input_filepath: Union[str, Path]
     :param with_comments: True if comments should be included (for .strings and
         .xml files), False otherwise.
     :type with_comments: bool
+    :param cache: Cache of the extracted strings. If provided, the strings are read
+        from it when the content of the input file has already been parsed with the
+        same options, and added to it otherwise.
+    :type cache: Optional[StringsCache]
+    :param credentials_filepath: Path to the service_account.json used to read
+        `gsheet://` inputs. Defaults to the gspread default location,
+        `~/.config/gspread/service_account.json`
+    :type credentials_filepath: Optional[Path]
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`.
+        By default, every string is kept
+    :type duplicates: Optional[str]
     :return: A list of tuples containing extracted strings and their corresponding values.
     :rtype: List[Tuple[str, str]]
     """
 
+    if is_google_sheets_url(input_filepath):
+        sheet_name, worksheet_title = parse_google_sheets_url(input_filepath)
+
+        strings = get_strings_from_google_sheets(
+            get_client(credentials_filepath),
+            sheet_name,
+            worksheet_title,
+            cache if cache is not None else StringsCache(get_default_cache_dir()),
+        )
+
+        return resolve_duplicates(strings, duplicates, input_filepath)
+
+    input_filepath = Path(input_filepath)
+
     conversion_functions = {
         ".csv": get_strings_from_csv,
         ".xlsx": get_strings_from_xlsx,
@@ -121,14 +409,298 @@ def get_strings(input_filepath: Path, with_comments: bool) -> List[Tuple[str, st
         ".strings": get_strings_from_ios,
         ".xml": get_strings_from_xml,
         ".pdf": get_strings_from_pdf,
+        ".mscat": get_strings_from_mscat,
+        ".sqlite": get_strings_from_sqlite,
+        ".db": get_strings_from_sqlite,
     }
 
-    if input_filepath.suffix in [".strings", ".xml"]:
-        return conversion_functions[input_filepath.suffix](
-            input_filepath, with_comments
-        )
+    suffix = get_format_suffix(input_filepath)
+
+    if suffix in [".strings", ".xml"]:
+        options = {"with_comments": with_comments}
     else:
-        return conversion_functions[input_filepath.suffix](input_filepath)
+        options = {}
+
+    # Streams can only be read once, so they can't be hashed to look up the cache
+    if is_stream_path(input_filepath):
+        cache = None
+
+    if cache is not None:
+        cache_key = cache.get_file_key(input_filepath, **options)
+        strings = cache.get(cache_key)
+
+        if strings is not None:
+            return resolve_duplicates(strings, duplicates, input_filepath)
+
+    strings = conversion_functions[suffix](input_filepath, **options)
+
+    if cache is not None:
+        cache.set(cache_key, strings)
+
+    return resolve_duplicates(strings, duplicates, input_filepath)
+
+
+def iter_strings(
+    input_filepath: Union[str, Path], with_comments: bool
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the strings of the input file as they are read, for the formats with an
+    incremental reader: .csv, .md, .json, .yaml and .html. The strings of the other
+    formats are extracted with `get_strings` first. The cache and the duplicate key
+    policies of `get_strings` are not applied.
+
+    :param input_filepath: Path to the input file, or a path returned by
+        `get_stdio_path`
+    :type input_filepath: Union[str, Path]
+    :param with_comments: True if comments should be included (for .strings and
+        .xml files), False otherwise.
+    :type with_comments: bool
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    streaming_functions = {
+        ".csv": iter_strings_from_csv,
+        ".md": iter_strings_from_md,
+        ".json": iter_strings_from_json,
+        ".yaml": iter_strings_from_yaml,
+        ".html": iter_strings_from_html,
+    }
+
+    suffix = get_format_suffix(input_filepath)
+
+    if suffix in streaming_functions:
+        return streaming_functions[suffix](input_filepath)
+
+    return iter(get_strings(input_filepath, with_comments))
+
+
+def convert_stream(
+    input_stream: BinaryIO,
+    input_type: str,
+    output_stream: BinaryIO,
+    output_type: str,
+    with_comments: bool = False,
+    duplicates: Optional[str] = None,
+):
+    """
+    Converts the strings read from a binary file object, e.g. an uploaded file or a
+    socket file, and writes them to another one, without writing any file. Neither
+    file object is closed. When both formats allow it, the strings are written as
+    they are read. See `iter_strings`.
+
+    :param input_stream: Binary file object to read the strings from
+    :type input_stream: BinaryIO
+    :param input_type: File type of the input, e.g. `.xml` or `.json.gz`
+    :type input_type: str
+    :param output_stream: Binary file object to write the converted strings to
+    :type output_stream: BinaryIO
+    :param output_type: File type of the output, e.g. `.csv` or `.xlsx`
+    :type output_type: str
+    :param with_comments: True if comments should be included (for .strings and
+        .xml files), False otherwise.
+    :type with_comments: bool
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    """
+
+    with get_stream_path(input_stream, input_type) as input_filepath, get_stream_path(
+        output_stream, output_type
+    ) as output_filepath:
+        convert_strings_to_many(
+            input_filepath,
+            [output_filepath],
+            with_comments,
+            max_workers=1,
+            duplicates=duplicates,
+        )
+
+
+def convert_bytes(
+    data: bytes,
+    input_type: str,
+    output_type: str,
+    with_comments: bool = False,
+    duplicates: Optional[str] = None,
+) -> bytes:
+    """
+    Converts the content of a file held in memory. See `convert_stream`.
+
+    :param data: Content of the input file
+    :type data: bytes
+    :param input_type: File type of the input, e.g. `.xml` or `.json.gz`
+    :type input_type: str
+    :param output_type: File type of the output, e.g. `.csv` or `.xlsx`
+    :type output_type: str
+    :param with_comments: True if comments should be included (for .strings and
+        .xml files), False otherwise.
+    :type with_comments: bool
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    :return: Content of the output file
+    :rtype: bytes
+    """
+
+    output_stream = io.BytesIO()
+    convert_stream(
+        io.BytesIO(data),
+        input_type,
+        output_stream,
+        output_type,
+        with_comments,
+        duplicates,
+    )
+
+    return output_stream.getvalue()
+
+
+def get_strings_from_stream(
+    input_stream: Union[bytes, BinaryIO],
+    input_type: str,
+    with_comments: bool = False,
+    duplicates: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Extracts the strings of a file held in memory or read from a binary file object,
+    like `get_strings` does for a path. The file object is not closed.
+
+    :param input_stream: Content of the input file, or a binary file object to read
+        it from
+    :type input_stream: Union[bytes, BinaryIO]
+    :param input_type: File type of the input, e.g. `.xml` or `.json.gz`
+    :type input_type: str
+    :param with_comments: True if comments should be included (for .strings and
+        .xml files), False otherwise.
+    :type with_comments: bool
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    :return: A list of tuples containing extracted strings and their corresponding values.
+    :rtype: List[Tuple[str, str]]
+    """
+
+    if isinstance(input_stream, (bytes, bytearray, memoryview)):
+        input_stream = io.BytesIO(input_stream)
+
+    with get_stream_path(input_stream, input_type) as input_filepath:
+        return get_strings(input_filepath, with_comments, duplicates=duplicates)
+
+
+def write_strings_to_stream(
+    strings: List[Tuple[str, str]], output_stream: BinaryIO, output_type: str
+):
+    """
+    Writes the strings in the given file type to a binary file object, like
+    `write_strings` does for a path. The file object is not closed.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: List[Tuple[str, str]]
+    :param output_stream: Binary file object to write the strings to
+    :type output_stream: BinaryIO
+    :param output_type: File type of the output, e.g. `.csv` or `.xlsx`
+    :type output_type: str
+    """
+
+    with get_stream_path(output_stream, output_type) as output_filepath:
+        _get_writer(output_filepath)(strings, output_filepath)
+
+
+def write_strings_to_bytes(strings: List[Tuple[str, str]], output_type: str) -> bytes:
+    """
+    Returns the content of a file of the given type with the strings, without writing
+    any file. See `write_strings_to_stream`.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: List[Tuple[str, str]]
+    :param output_type: File type of the output, e.g. `.csv` or `.xlsx`
+    :type output_type: str
+    :return: Content of the output file
+    :rtype: bytes
+    """
+
+    output_stream = io.BytesIO()
+    write_strings_to_stream(strings, output_stream, output_type)
+
+    return output_stream.getvalue()
+
+
+def resolve_duplicates(
+    strings: List[Tuple[str, str]],
+    policy: Optional[str],
+    input_filepath: Union[str, Path, None] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Applies a policy to the keys that appear more than once in the strings.
+
+    Supported policies:
+    - error: raise a ValueError listing the repeated keys
+    - first: keep the first value of each key
+    - last: keep the last value of each key, at the position of the first one, like
+      the .yaml writer does
+    - report: keep every string and print the repeated keys to stderr
+
+    The strings are indexed by key in a single pass, so the policy takes linear time
+    in the number of strings.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: List[Tuple[str, str]]
+    :param policy: One of `DUPLICATE_POLICIES`, or None to keep every string without
+        looking for repeated keys
+    :type policy: Optional[str]
+    :param input_filepath: File the strings were extracted from, used in the messages
+    :type input_filepath: Union[str, Path, None]
+    :return: The strings with the policy applied
+    :rtype: List[Tuple[str, str]]
+    """
+
+    if policy is None:
+        return strings
+
+    if policy not in DUPLICATE_POLICIES:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Unsupported duplicate key policy: {policy}. Use one of "
+            f"{', '.join(DUPLICATE_POLICIES)}.{ConsoleStyle.END}"
+        )
+
+    # Row of the first occurrence of each key in the result
+    key_index: Dict[str, int] = {}
+    # Number of occurrences of each repeated key
+    duplicate_counts: Dict[str, int] = {}
+    resolved = []
+
+    for name, value in strings:
+        row = key_index.get(name)
+
+        if row is None:
+            key_index[name] = len(resolved)
+            resolved.append((name, value))
+            continue
+
+        duplicate_counts[name] = duplicate_counts.get(name, 1) + 1
+
+        if policy == "last":
+            resolved[row] = (name, value)
+        elif policy == "report":
+            resolved.append((name, value))
+
+    if duplicate_counts and policy in ("error", "report"):
+        source = f" in {input_filepath}" if input_filepath else ""
+        keys = ", ".join(
+            f"{name} ({count} times)" for name, count in duplicate_counts.items()
+        )
+
+        if policy == "error":
+            raise ValueError(
+                f"{ConsoleStyle.RED}Duplicate keys found{source}: {keys}"
+                f"{ConsoleStyle.END}"
+            )
+
+        # Sent to stderr so that it isn't mixed with the strings written to stdout
+        print(
+            f"{ConsoleStyle.YELLOW}Duplicate keys found{source}: {keys}{ConsoleStyle.END}",
+            file=sys.stderr,
+        )
+
+    return resolved
 
 
 def to_google_sheets(
@@ -136,6 +708,8 @@ def to_google_sheets(
     sheet_name: str,
     credentials_filepath: Path,
     with_comments: bool,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sync: bool = False,
 ):
     """
     Creates a Google spreadsheet with the extracted strings from the input filepath
@@ -150,27 +724,86 @@ def to_google_sheets(
     :param with_comments: True if the user wants to include comments from
         .strings/.xml to the sheet
     :type with_comments: bool
+    :param chunk_size: Maximum number of rows sent in each request to the Google
+        Sheets API
+    :type chunk_size: int
+    :param sync: True to write only the cells that changed, keeping the notes and
+        formatting of the other rows, instead of replacing the whole sheet
+    :type sync: bool
     """
 
     strings = get_strings(input_filepath, with_comments)
 
     # Authenticate with Google Sheets API
-    scope = [
-        "https://spreadsheets.google.com/feeds",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    credentials = Credentials.from_service_account_file(credentials_filepath, scope)
-    client = gspread.authorize(credentials)
+    client = authorize(credentials_filepath)
 
-    # Open a new sheet or an existing one
-    sheet = client.open(sheet_name).sheet1
+    if sync:
+        # Send only the inserted, updated and deleted rows
+        sync_strings(client, sheet_name, strings)
+    else:
+        # Replace the data of the sheet in batches of rows
+        upload_strings(client, sheet_name, strings, chunk_size)
 
-    # Clear the existing data in the sheet
-    sheet.clear()
 
-    # Write the data to the sheet
-    for string in strings:
-        sheet.append_row(string)
+def to_google_sheets_many(
+    input_filepaths: List[Path],
+    credentials_filepath: Path,
+    with_comments: bool,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sync: bool = False,
+    spreadsheet_name: Optional[str] = None,
+    requests_per_minute: Optional[int] = DEFAULT_REQUESTS_PER_MINUTE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache: Optional[StringsCache] = None,
+    duplicates: Optional[str] = None,
+):
+    """
+    Uploads the strings of several input files to Google Sheets concurrently. The
+    credentials are loaded only once and a single authorized client is shared by every
+    upload, under a rate limiter that keeps the requests within the API quota.
+
+    :param input_filepaths: Files to extract the strings from
+    :type input_filepaths: List[Path]
+    :param credentials_filepath: Path to the service_account.json in order to be able
+        to create the sheets in the user's Google account
+    :type credentials_filepath: Path
+    :param with_comments: True if the user wants to include comments from
+        .strings/.xml to the sheets
+    :type with_comments: bool
+    :param chunk_size: Maximum number of rows sent in each request to the Google
+        Sheets API
+    :type chunk_size: int
+    :param sync: True to write only the cells that changed. See `to_google_sheets`
+    :type sync: bool
+    :param spreadsheet_name: Name of the spreadsheet where every input file is written
+        to a worksheet named after the file. If not provided, each input file is
+        written to the first worksheet of the spreadsheet named after the file
+    :type spreadsheet_name: Optional[str]
+    :param requests_per_minute: Maximum number of requests sent per minute. None
+        disables the limit
+    :type requests_per_minute: Optional[int]
+    :param max_workers: Maximum number of sheets uploaded at the same time
+    :type max_workers: int
+    :param cache: Cache of the extracted strings. See `get_strings`
+    :type cache: Optional[StringsCache]
+    :param duplicates: What to do with the repeated keys. See `resolve_duplicates`
+    :type duplicates: Optional[str]
+    """
+
+    uploads = []
+    for input_filepath in input_filepaths:
+        strings = get_strings(
+            input_filepath, with_comments, cache, credentials_filepath, duplicates
+        )
+
+        if spreadsheet_name is None:
+            uploads.append((get_input_stem(input_filepath), None, strings))
+        else:
+            uploads.append((spreadsheet_name, get_input_stem(input_filepath), strings))
+
+    client = authorize(credentials_filepath, requests_per_minute)
+
+    upload_many(client, uploads, chunk_size, sync, max_workers)
 
 
 def to_csv(strings: List[str], output_filepath: Path):
@@ -183,7 +816,7 @@ def to_csv(strings: List[str], output_filepath: Path):
     :type output_filepath: Path
     """
 
-    with open(output_filepath, "w", encoding="utf-8", newline="") as file:
+    with open_file(output_filepath, "w", encoding="utf-8", newline="") as file:
         writer = csv.writer(file)
 
         # Write the header row
@@ -221,35 +854,58 @@ def to_sheet(strings: List[str], output_filepath: Path):
         sheet.cell(row=i, column=2, value=value)
 
     # Save the file
-    workbook.save(output_filepath)
+    write_seekable(output_filepath, workbook.save)
 
 
-def to_json(strings: List[str], output_filepath: Path):
+def to_json(
+    strings: Iterable[Tuple[str, str]],
+    output_filepath: Path,
+    backend: Optional[str] = None,
+):
     """
     Formats strings to a .json file
 
+    The records are streamed to the file as the strings are iterated, so no copy of
+    the strings is kept in memory. The output is the same as `json.dump` with
+    `indent=2` with either backend: orjson encodes numbers differently, so the
+    records with values that are not strings, like the numeric cells of .xlsx files,
+    are always encoded with the json module.
+
     :param strings: Strings extracted from a .strings or .xml file
-    :type strings: List[str]
+    :type strings: Iterable[Tuple[str, str]]
     :param output_filepath: The path where the generated file will be saved.
     :type output_filepath: Path
+    :param backend: `json` or `orjson`. Defaults to `orjson` if it is installed, since
+        it encodes the records several times faster
+    :type backend: Optional[str]
     """
 
-    # Create a list of dictionaries to store the data
-    data_list = []
-    for name, value in strings:
-        data_list.append({"name": name, "value": value})
+    backend = _get_json_backend(backend)
+
+    with open_file(output_filepath, "wb") as file:
+        file.write(b"[")
+
+        if backend == "orjson":
+            is_empty = _write_json_records_orjson(strings, file)
+        else:
+            is_empty = _write_json_records(strings, file)
 
-    # Write the data to the JSON file
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        json.dump(data_list, file, ensure_ascii=False, indent=2)
+        file.write(b"]" if is_empty else b"\n]")
 
 
-def to_yaml(strings: List[str], output_filepath: Path):
+def to_yaml(strings: Iterable[Tuple[str, str]], output_filepath: Path):
     """
     Formats strings to a .yaml file
 
+    The mapping is written event by event with the libyaml emitter, if PyYAML was
+    built with it, instead of being represented as a graph of nodes first. The output
+    is the same as `yaml.dump`: the keys are sorted and a repeated key keeps its last
+    value. Sorting needs every key, so the strings are collected in a dict before the
+    first event is emitted and the memory used still grows with their number. Only
+    the node graph and the serializer state of `yaml.dump` are saved.
+
     :param strings: Strings extracted from a .strings or .xml file
-    :type strings: List[str]
+    :type strings: Iterable[Tuple[str, str]]
     :param output_filepath: The path where the generated file will be saved.
     :type output_filepath: Path
     """
@@ -258,8 +914,23 @@ def to_yaml(strings: List[str], output_filepath: Path):
     strings_dict = {name: value for name, value in strings}
 
     # Write the data to the YAML file
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        yaml.dump(strings_dict, file, default_flow_style=False, allow_unicode=True)
+    with open_file(output_filepath, "w", encoding="utf-8") as file:
+        dumper = YAML_DUMPER(file, default_flow_style=False, allow_unicode=True)
+
+        try:
+            dumper.emit(yaml.StreamStartEvent())
+            dumper.emit(yaml.DocumentStartEvent(explicit=False))
+            dumper.emit(yaml.MappingStartEvent(None, None, True, flow_style=False))
+
+            for name in sorted(strings_dict):
+                dumper.emit(_get_yaml_scalar_event(dumper, name))
+                dumper.emit(_get_yaml_scalar_event(dumper, strings_dict[name]))
+
+            dumper.emit(yaml.MappingEndEvent())
+            dumper.emit(yaml.DocumentEndEvent(explicit=False))
+            dumper.emit(yaml.StreamEndEvent())
+        finally:
+            dumper.dispose()
 
 
 def to_html(strings: List[str], output_filepath: Path):
@@ -272,29 +943,22 @@ def to_html(strings: List[str], output_filepath: Path):
     :type output_filepath: Path
     """
 
-    # Create an HTML file
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        file.write("<head>\n")
-        file.write('\t<meta charset="UTF-8">\n')
-        file.write("</head>\n")
-        file.write("<table>\n")
-        file.write("\t<thead>\n")
-        file.write("\t\t<tr>\n")
-        file.write("\t\t\t<th>NAME</th>\n")
-        file.write("\t\t\t<th>VALUE</th>\n")
-        file.write("\t\t</tr>\n")
-        file.write("\t</thead>\n")
-        file.write("\t<tbody>\n")
-
-        # Write the data to the HTML file
-        for name, value in strings:
-            file.write("\t\t<tr>\n")
-            file.write(f"\t\t\t<td>{name}</td>\n")
-            file.write(f"\t\t\t<td>{value}</td>\n")
-            file.write("\t\t</tr>\n")
-
-        file.write("\t</tbody>\n")
-        file.write("</table>\n")
+    with open_file(output_filepath, "wb") as file:
+        file.write(
+            b"<head>\n"
+            b'\t<meta charset="UTF-8">\n'
+            b"</head>\n"
+            b"<table>\n"
+            b"\t<thead>\n"
+            b"\t\t<tr>\n"
+            b"\t\t\t<th>NAME</th>\n"
+            b"\t\t\t<th>VALUE</th>\n"
+            b"\t\t</tr>\n"
+            b"\t</thead>\n"
+            b"\t<tbody>\n"
+        )
+        HTML_EMITTER.write(file, strings)
+        file.write(b"\t</tbody>\n</table>\n")
 
 
 def to_ios(strings: List[str], output_filepath: Path):
@@ -307,9 +971,8 @@ def to_ios(strings: List[str], output_filepath: Path):
     :type output_filepath: Path
     """
 
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        for string in strings:
-            file.write(f'"{string[0]}" = "{string[1]}";\n')
+    with open_file(output_filepath, "wb") as file:
+        IOS_EMITTER.write(file, strings)
 
 
 def to_android(strings: List[str], output_filepath: Path):
@@ -322,12 +985,10 @@ def to_android(strings: List[str], output_filepath: Path):
     :type output_filepath: Path
     """
 
-    with open(output_filepath, "w", encoding="utf-8") as file:
-        file.write("<resources>\n")
-        for string in strings:
-            file.write(f'\t<string name="{string[0]}">{string[1]}</string>\n')
-
-        file.write("</resources>")
+    with open_file(output_filepath, "wb") as file:
+        file.write(b"<resources>\n")
+        XML_EMITTER.write(file, strings)
+        file.write(b"</resources>")
 
 
 def to_pdf(strings: List[str], output_filepath: Path):
@@ -363,11 +1024,7 @@ def to_pdf(strings: List[str], output_filepath: Path):
     pdf.cell(c_width, c_height, "VALUE", border=1)
     pdf.ln()
 
-    detector = (
-        LanguageDetectorBuilder.from_all_languages()
-        .with_preloaded_language_models()
-        .build()
-    )
+    detector = get_language_detector()
 
     # Add table data
     # https://stackoverflow.com/questions/53526311/fpdf-multicell-same-height
@@ -438,12 +1095,18 @@ def to_pdf(strings: List[str], output_filepath: Path):
 
                 pdf.set_xy(x + (c_width * (j + 1)), y)
             except (Exception,):
-                with open(
-                    output_filepath.parent / f"{output_filepath.stem}-errors.txt",
-                    "a",
-                    encoding="utf-8",
-                ) as f:
-                    f.write(f"{string[1]} not supported\n")
+                # A stream has no directory to write the errors file next to
+                if is_stream_path(output_filepath):
+                    warnings.warn(f"{string[1]} not supported", RuntimeWarning)
+                else:
+                    with open(
+                        output_filepath.parent
+                        / f"{strip_compression_suffix(output_filepath).stem}"
+                        f"-errors.txt",
+                        "a",
+                        encoding="utf-8",
+                    ) as f:
+                        f.write(f"{string[1]} not supported\n")
 
         for j in range(cells_in_row + 1):
             pdf.line(x + c_width * j, y, x + c_width * j, y + max_height)
@@ -467,8 +1130,29 @@ def to_pdf(strings: List[str], output_filepath: Path):
     # codec can't encode characters in position 0-9: character maps to <undefined>
     with open(os.devnull, "w") as devnull:
         with redirect_stdout(devnull), redirect_stderr(devnull):
-            # Save the PDF file
-            pdf.output(str(output_filepath))
+            data = pdf.output()
+
+    # Saved once stdout is restored, since it is where the PDF goes with `-f -`
+    with open_file(output_filepath, "wb") as file:
+        file.write(data)
+
+
+@lru_cache(maxsize=None)
+def get_language_detector() -> LanguageDetector:
+    """
+    Returns the detector used to choose the font of each value in .pdf files. Building
+    it takes several seconds, so it is built only once per process and kept in memory
+    for the following conversions.
+
+    :return: Detector of all the languages supported by `lingua`
+    :rtype: LanguageDetector
+    """
+
+    return (
+        LanguageDetectorBuilder.from_all_languages()
+        .with_preloaded_language_models()
+        .build()
+    )
 
 
 def to_md(strings: List[str], output_filepath: Path):
@@ -481,12 +1165,10 @@ def to_md(strings: List[str], output_filepath: Path):
     :type output_filepath: Path
     """
 
-    with open(output_filepath, "w", encoding="utf-8") as f:
+    with open_file(output_filepath, "wb") as file:
         # Write each string to the Markdown file in a table format
-        f.write("| NAME | VALUE |\n")
-        f.write("| ----------- | ----------- |\n")
-        for name, translation in strings:
-            f.write(f"| {name} | {translation} |\n")
+        file.write(b"| NAME | VALUE |\n| ----------- | ----------- |\n")
+        MD_EMITTER.write(file, strings)
 
 
 # GET STRINGS FROM
@@ -503,20 +1185,28 @@ def get_strings_from_csv(csv_filepath: Path):
     :rtype: List[Tuple[str, str]]
     """
 
-    # Initialize a list to hold the tuples
-    data = []
+    return list(iter_strings_from_csv(csv_filepath))
+
+
+def iter_strings_from_csv(csv_filepath: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the rows of a CSV file with NAME and VALUE columns as they are read.
+
+    :param csv_filepath: The path to the input CSV file.
+    :type csv_filepath: Path
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
 
     # Open the CSV file and read its contents
-    with open(csv_filepath, "r", newline="", encoding="utf-8") as file:
+    with open_file(csv_filepath, "r", newline="", encoding="utf-8") as file:
         csv_reader = csv.reader(file)
-        next(csv_reader)  # Skip the header row
+        next(csv_reader, None)  # Skip the header row
 
         # Iterate over the rows in the CSV file
         for row in csv_reader:
             name, value = row
-            data.append((name, value))
-
-    return data
+            yield name, value
 
 
 def get_strings_from_xlsx(sheet_filepath: Path):
@@ -531,7 +1221,7 @@ def get_strings_from_xlsx(sheet_filepath: Path):
     """
 
     # Load the workbook and select the active sheet
-    workbook = openpyxl.load_workbook(sheet_filepath)
+    workbook = openpyxl.load_workbook(read_seekable(sheet_filepath))
     sheet = workbook.active
 
     # Initialize a list to hold the tuples
@@ -560,7 +1250,7 @@ def get_strings_from_ods(ods_filepath: Path) -> List[Tuple[str, str]]:
     data = []
 
     # Load the ODS file
-    doc = ezodf.opendoc(ods_filepath)
+    doc = ezodf.opendoc(read_seekable(ods_filepath))
 
     # Get the first sheet
     sheet = doc.sheets[0]
@@ -589,61 +1279,116 @@ def get_strings_from_md(
     :rtype: List[Tuple[str, str]]
     """
 
-    # Initialize a list to hold the tuples
-    data = []
+    return list(iter_strings_from_md(md_filepath, delimiter))
 
-    # Open the Markdown file and read its contents
-    with open(md_filepath, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-
-    # Find the start and end indices of the table
-    start_index = None
-    end_index = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith("|"):
-            start_index = i
-            break
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].strip().startswith("|"):
-            end_index = i
-            break
-
-    # Extract data from the table, skipping the first two lines (header)
-    if start_index is not None and end_index is not None:
-        for row in lines[start_index + 2 : end_index + 1]:
-            # Split the line by the delimiter and extract NAME and VALUE
-            parts = row.strip().strip(delimiter).split(delimiter)
-            if len(parts) >= 2:
-                name, value = parts[:2]
-                data.append((name.strip(), value.strip()))
 
-    return data
+def iter_strings_from_md(
+    md_filepath: Path, delimiter: str = "|"
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the NAME and VALUE cells of the rows of the tables of a Markdown file as
+    the lines are read.
 
+    The file is read line by line in a single pass, so the memory used doesn't depend
+    on its size. A table starts with a line beginning with the delimiter and ends with
+    the first line that doesn't, so a file can have several tables. The header of
+    each table and the delimiter row below it are skipped. Delimiters escaped
+    with a backslash are part of the cell, `<br>` is read as a line break and
+    `&lt;br>` as a literal `<br>`, like `to_md` writes them.
+    Tables without a delimiter row below the first one have no header.
 
-def get_strings_from_json(json_filepath: Path) -> List[Tuple[str, str]]:
+    :param md_filepath: The path to the input Markdown file.
+    :type md_filepath: Path
+    :param delimiter: The delimiter used in the Markdown table, defaults to '|'.
+    :type delimiter: str, optional
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    split_pattern = re.compile(r"(?<!\\)" + re.escape(delimiter))
+    is_in_table = False
+    # First row of the current table, kept until the next one tells if it's a header
+    first_row = None
+
+    with open_file(md_filepath, "r", encoding="utf-8") as file:
+        for row in file:
+            row = row.strip()
+
+            if not row.startswith(delimiter):
+                if first_row is not None:
+                    yield from _split_md_row(first_row, delimiter, split_pattern)
+                    first_row = None
+
+                is_in_table = False
+                continue
+
+            if not is_in_table:
+                is_in_table = True
+                first_row = row
+                continue
+
+            if first_row is not None:
+                # Skip the header and the delimiter row below it
+                if MD_DELIMITER_ROW_PATTERN.fullmatch(row):
+                    first_row = None
+                    continue
+
+                yield from _split_md_row(first_row, delimiter, split_pattern)
+                first_row = None
+
+            yield from _split_md_row(row, delimiter, split_pattern)
+
+    if first_row is not None:
+        yield from _split_md_row(first_row, delimiter, split_pattern)
+
+
+def get_strings_from_json(
+    json_filepath: Path, backend: Optional[str] = None
+) -> List[Tuple[str, str]]:
     """
     Extract data from a JSON file with objects containing NAME and VALUE fields and
     return it as a list of tuples.
 
     :param json_filepath: The path to the input JSON file.
     :type json_filepath: Path
+    :param backend: See `iter_strings_from_json`
+    :type backend: Optional[str]
     :return: A list of tuples where each tuple contains a NAME and VALUE.
     :rtype: List[Tuple[str, str]]
     """
 
-    # Initialize a list to hold the tuples
-    data = []
+    return list(iter_strings_from_json(json_filepath, backend))
 
-    # Open the JSON file and load its contents
-    with open(json_filepath, "r", encoding="utf-8") as file:
-        json_data = json.load(file)
 
-    # Iterate over each object in the JSON data
-    for record in json_data:
-        if "name" in record and "value" in record:
-            data.append((record["name"], record["value"]))
+def iter_strings_from_json(
+    json_filepath: Path, backend: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the NAME and VALUE fields of the objects of a JSON file as they are
+    parsed.
 
-    return data
+    By default, the file is read in chunks and the objects of the top-level array are
+    decoded one at a time, so the memory used doesn't depend on the size of the file.
+    With the `orjson` backend, the whole file is parsed at once instead, which is
+    faster but keeps the file and every object in memory.
+
+    :param json_filepath: The path to the input JSON file.
+    :type json_filepath: Path
+    :param backend: `json` or `orjson`. Defaults to `json`
+    :type backend: Optional[str]
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    if _get_json_backend(backend or "json") == "orjson":
+        with open_file(json_filepath, "rb") as file:
+            records = orjson.loads(file.read())
+    else:
+        records = _iter_json_array(json_filepath)
+
+    for record in records:
+        if isinstance(record, dict) and "name" in record and "value" in record:
+            yield record["name"], record["value"]
 
 
 def get_strings_from_yaml(yaml_filepath: Path) -> List[Tuple[str, str]]:
@@ -657,24 +1402,52 @@ def get_strings_from_yaml(yaml_filepath: Path) -> List[Tuple[str, str]]:
     :rtype: List[Tuple[str, str]]
     """
 
-    # Initialize a list to hold the tuples
-    data = []
+    return list(iter_strings_from_yaml(yaml_filepath))
 
-    # Open the YAML file and load its contents
-    with open(yaml_filepath, "r", encoding="utf-8") as file:
-        yaml_data = yaml.safe_load(file)
 
-    # Iterate over each key-value pair in the YAML data
-    for key, value in yaml_data.items():
-        data.append((key, value))
+def iter_strings_from_yaml(yaml_filepath: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the key-value pairs of the flat mapping of a YAML file as they are parsed.
 
-    return data
+    The file is read with the libyaml parser, if PyYAML was built with it, and only
+    the parser events are used, so the document is never composed into a graph of
+    nodes nor loaded as a dictionary. The scalars are resolved like with
+    `yaml.safe_load`, e.g. `3` is read as an integer. Every pair is yielded, so
+    repeated keys are handled by the duplicate key policy of `get_strings`.
+
+    :param yaml_filepath: The path to the input YAML file.
+    :type yaml_filepath: Path
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    with open_file(yaml_filepath, "r", encoding="utf-8") as file:
+        loader = YAML_LOADER(file)
+
+        try:
+            # An empty file has no document
+            loader.get_event()
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent):
+                raise ValueError("The file provided is not a valid .yaml file.")
+            loader.get_event()
+
+            while not loader.check_event(yaml.MappingEndEvent):
+                name = _get_yaml_scalar(loader)
+                value = _get_yaml_scalar(loader)
+                yield name, value
+        finally:
+            loader.dispose()
 
 
 def get_strings_from_html(html_filepath: Path) -> List[Tuple[str, str]]:
     """
     Extract data from an HTML file with a table containing NAME and VALUE columns and
-    return it as a list of tuples.
+    return it as a list of tuples. Only the first table is read. See
+    `iter_strings_from_html`.
 
     :param html_filepath: The path to the input HTML file.
     :type html_filepath: Path
@@ -682,31 +1455,48 @@ def get_strings_from_html(html_filepath: Path) -> List[Tuple[str, str]]:
     :rtype: List[Tuple[str, str]]
     """
 
-    # Initialize a list to hold the tuples
-    data = []
+    return list(iter_strings_from_html(html_filepath))
 
-    # Open the HTML file and read its contents
-    with open(html_filepath, "r", encoding="utf-8") as file:
-        html_content = file.read()
 
-    # Find the start and end indices of the table
-    table_start = html_content.find("<table")
-    table_end = html_content.find("</table>", table_start)
+def iter_strings_from_html(html_filepath: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the NAME and VALUE cells of the rows of the first table of an HTML file as
+    the rows are parsed.
 
-    # Extract data from the table if it exists
-    if table_start != -1 and table_end != -1:
-        table_content = html_content[table_start:table_end]
-        rows = re.findall(r"<tr[^>]*>(.*?)</tr>", table_content, re.DOTALL)
+    The file is read in chunks and fed to the incremental HTML parser of lxml, so it
+    is read in a single pass and the memory used doesn't depend on its size. lxml is
+    used instead of `html.parser.HTMLParser`, which has the same feed-based API but is
+    written in Python and about 5 times slower on large files. No tree is built: the
+    parser calls a target with the tags and text as it finds them. The markup inside
+    the cells is dropped, entities are unescaped, and rows with less than two `<td>`
+    cells, like the header, are skipped.
 
-        # Extract data from each row
-        for row in rows:
-            cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.DOTALL)
-            if len(cells) >= 2:
-                name = re.sub(r"<.*?>", "", cells[0].strip())
-                value = re.sub(r"<.*?>", "", cells[1].strip())
-                data.append((name, value))
+    Only the first table is read, like the files written by `to_html` have a single
+    one. Reading stops at its end, so the tables after it are ignored and the rest of
+    the file is not parsed.
 
-    return data
+    :param html_filepath: The path to the input HTML file.
+    :type html_filepath: Path
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    target = _HtmlTableTarget()
+    parser = etree.HTMLPullParser(target=target, encoding="utf-8")
+
+    with open_file(html_filepath, "rb") as file:
+        while True:
+            chunk = file.read(HTML_READ_CHUNK_SIZE)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+
+            yield from target.rows
+            target.rows.clear()
+
+            if not chunk or target.is_table_read:
+                break
 
 
 def get_strings_from_ios(
@@ -730,7 +1520,7 @@ def get_strings_from_ios(
         pattern = r'^(?!\s*//)\s*"(.+?)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;'
 
     # Open the strings file
-    with open(ios_filepath, "r", encoding="utf-8") as file:
+    with open_file(ios_filepath, "r", encoding="utf-8") as file:
         strings_data = file.read()
 
     # Extract the strings using a regular expression
@@ -763,7 +1553,7 @@ def get_strings_from_xml(
         pattern = r'^(?!\s*<!--)\s*<string name="(.*?)">(.*?)</string>(?!\s*-->)'
 
     # Open the strings file
-    with open(xml_filepath, "r", encoding="utf-8") as file:
+    with open_file(xml_filepath, "r", encoding="utf-8") as file:
         strings_data = file.read()
 
     # Extract the strings using a regular expression
@@ -789,7 +1579,7 @@ def get_strings_from_pdf(pdf_filepath: Path) -> List[Tuple[str, str]]:
     data = []
 
     # Create a PdfReader object
-    pdf_reader = PdfReader(pdf_filepath)
+    pdf_reader = PdfReader(read_seekable(pdf_filepath))
 
     # Extract text from each page
     for page in pdf_reader.pages:
@@ -808,3 +1598,265 @@ def get_strings_from_pdf(pdf_filepath: Path) -> List[Tuple[str, str]]:
                 data.append((name.strip(), value.strip()))
 
     return data
+
+
+def _split_md_row(
+    row: str, delimiter: str, split_pattern: re.Pattern
+) -> Iterator[Tuple[str, str]]:
+    # Yields the NAME and VALUE cells of a row of a Markdown table, if it has both
+    escaped_delimiter = "\\" + delimiter
+
+    row = row[len(delimiter) :]
+    if row.endswith(delimiter) and not row.endswith(escaped_delimiter):
+        row = row[: -len(delimiter)]
+
+    parts = split_pattern.split(row, 2)
+    if len(parts) >= 2:
+        yield tuple(
+            unescape_md_breaks(part.strip().replace(escaped_delimiter, delimiter))
+            for part in parts[:2]
+        )
+
+
+def _get_json_backend(backend: Optional[str]) -> str:
+    if backend is None:
+        return "json" if orjson is None else "orjson"
+
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"{ConsoleStyle.RED}Unsupported JSON backend: {backend}. Use one of "
+            f"{', '.join(JSON_BACKENDS)}.{ConsoleStyle.END}"
+        )
+
+    if backend == "orjson" and orjson is None:
+        raise ValueError(
+            f"{ConsoleStyle.RED}The orjson backend requires the orjson package. "
+            f"Install it with `pip install orjson`.{ConsoleStyle.END}"
+        )
+
+    return backend
+
+
+def _write_json_records(strings: Iterable[Tuple[str, str]], file: BinaryIO) -> bool:
+    # Only the strings are encoded, the layout of `json.dump(indent=2)` is written as
+    # it is. The encoder is reused, since `json.dumps` creates one per call when
+    # `ensure_ascii` is False
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    separator = b"\n"
+
+    for name, value in strings:
+        file.write(
+            separator
+            + b'  {\n    "name": '
+            + encode(name).encode("utf-8")
+            + b',\n    "value": '
+            + encode(value).encode("utf-8")
+            + b"\n  }"
+        )
+        separator = b",\n"
+
+    return separator == b"\n"
+
+
+def _write_json_records_orjson(
+    strings: Iterable[Tuple[str, str]], file: BinaryIO
+) -> bool:
+    # Calling orjson once per string costs as much as the encoding itself, so the
+    # records are encoded in batches. With `OPT_INDENT_2`, orjson has the same layout
+    # as `json.dump(indent=2)`, so each batch is written without its brackets
+    strings = iter(strings)
+    is_empty = True
+
+    while True:
+        batch = [
+            {"name": name, "value": value}
+            for name, value in islice(strings, JSON_BATCH_SIZE)
+        ]
+
+        if not batch:
+            return is_empty
+
+        # orjson writes NaN as null and 1e20 as `1e20`, and rejects integers wider
+        # than 64 bits, so the batches with numbers, which the spreadsheet and .yaml
+        # readers can return, are written with the json module. Strip the leading
+        # `[` and the trailing `\n]`
+        if all(
+            isinstance(record["name"], str) and isinstance(record["value"], str)
+            for record in batch
+        ):
+            records = orjson.dumps(batch, option=orjson.OPT_INDENT_2)[1:-2]
+        else:
+            records = json.dumps(batch, ensure_ascii=False, indent=2)[1:-2].encode(
+                "utf-8"
+            )
+        file.write(records if is_empty else b"," + records)
+        is_empty = False
+
+
+def _iter_json_array(json_filepath: Path) -> Iterator[Any]:
+    """
+    Yields the elements of the top-level array of a JSON file while it is read in
+    chunks. Each element is decoded with the C scanner of the `json` module, and the
+    chunk is extended whenever an element is cut at its end.
+    """
+
+    scan_once = make_scanner(json.JSONDecoder())
+    buffer = ""
+    position = 0
+    is_eof = False
+    is_started = False
+    expects_value = True
+    # A `]` right after a `,` is a trailing comma, which JSON doesn't allow
+    is_after_separator = False
+
+    with open_file(json_filepath, "r", encoding="utf-8") as file:
+        while True:
+            position = JSON_WHITESPACE_PATTERN.match(buffer, position).end()
+
+            if position == len(buffer):
+                if is_eof:
+                    raise ValueError("The file provided is not a valid .json file.")
+
+                chunk = file.read(JSON_READ_CHUNK_SIZE)
+                is_eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            char = buffer[position]
+
+            if not is_started:
+                if char != "[":
+                    raise ValueError("The file provided is not a valid .json file.")
+                is_started = True
+                position += 1
+                continue
+
+            if char == "]":
+                if is_after_separator:
+                    raise ValueError("The file provided is not a valid .json file.")
+                return
+
+            if not expects_value:
+                if char != ",":
+                    raise ValueError("The file provided is not a valid .json file.")
+                expects_value = True
+                is_after_separator = True
+                position += 1
+                continue
+
+            # Decode the elements of the chunk until one is cut or the array ends
+            while True:
+                try:
+                    element, end = scan_once(buffer, position)
+                except (StopIteration, json.JSONDecodeError):
+                    if is_eof:
+                        raise ValueError("The file provided is not a valid .json file.")
+                    break
+
+                # A number at the end of the chunk may continue in the next one
+                if end == len(buffer) and not is_eof:
+                    break
+
+                yield element
+
+                separator = JSON_SEPARATOR_PATTERN.match(buffer, end)
+                if separator is None:
+                    position = end
+                    expects_value = False
+                    is_after_separator = False
+                    break
+
+                position = separator.end()
+                is_after_separator = True
+
+            if expects_value:
+                chunk = file.read(JSON_READ_CHUNK_SIZE)
+                is_eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+
+
+class _HtmlTableTarget:
+    """
+    Parser target that collects the text of the `<td>` cells of the first table of an
+    HTML document. The rows are added to `rows` as they end. The parser closes the
+    elements whose end tags are omitted, like `<tr>` and `<td>`, before calling `end`.
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple[str, str]] = []
+        self.is_table_read = False
+        self._is_in_table = False
+        self._cells: List[str] = []
+        self._cell: Optional[List[str]] = None
+
+    def start(self, tag: str, attrib: Dict[str, str]):
+        if self.is_table_read:
+            return
+
+        if tag == "table":
+            self._is_in_table = True
+        elif tag == "td" and self._is_in_table:
+            self._cell = []
+
+    def end(self, tag: str):
+        if not self._is_in_table:
+            return
+
+        if tag == "td" and self._cell is not None:
+            self._cells.append("".join(self._cell).strip())
+            self._cell = None
+        elif tag == "tr":
+            if len(self._cells) >= 2:
+                self.rows.append((self._cells[0], self._cells[1]))
+            self._cells = []
+        elif tag == "table":
+            self._is_in_table = False
+            self.is_table_read = True
+
+    def data(self, data: str):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def close(self):
+        pass
+
+
+def _get_yaml_scalar_event(dumper: yaml.SafeDumper, data: Any) -> yaml.ScalarEvent:
+    # Same events as the ones serialized by `yaml.dump` for the scalar nodes, so the
+    # strings that would be read as other types, like `yes` or `3`, are quoted
+    node = dumper.represent_data(data)
+
+    if not isinstance(node, yaml.ScalarNode):
+        raise ValueError("Only strings and numbers can be written to .yaml files.")
+
+    implicit = (
+        node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+        node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+    )
+
+    return yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+
+
+def _get_yaml_scalar(loader: yaml.SafeLoader) -> Any:
+    # Same tag resolution as the composer of `yaml.safe_load`
+    event = loader.get_event()
+
+    if not isinstance(event, yaml.ScalarEvent):
+        raise ValueError(
+            "The file provided is not a valid .yaml file. Only flat mappings of "
+            "strings are supported."
+        )
+
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+    # Most scalars are strings, which need no construction
+    if tag == "tag:yaml.org,2002:str":
+        return event.value
+
+    return loader.construct_document(
+        yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+    )
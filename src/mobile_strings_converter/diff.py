@@ -0,0 +1,176 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .catalog import DEFAULT_LOCALE, Catalog
+from .console_style import ConsoleStyle
+
+
+class StringsDiff:
+    """
+    Keys added, removed and changed between two versions of the same strings.
+
+    The added and changed keys are in the order of the new strings, and the removed
+    ones in the order of the old strings.
+    """
+
+    def __init__(self):
+        self.added: List[Tuple[str, str]] = []
+        self.removed: List[Tuple[str, str]] = []
+        self.changed: List[Tuple[str, str, str]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def to_strings(self, locale: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Formats the differences as strings, so they can be written with
+        `write_strings` to any supported file type. The name of each string is the
+        key, and the value describes the change, e.g. `changed: Hello -> Hi`.
+
+        :param locale: Locale added to the descriptions, e.g. `changed [es]: ...`
+        :type locale: Optional[str]
+        :return: A row per added, removed and changed key, in that order
+        :rtype: List[Tuple[str, str]]
+        """
+
+        suffix = f" [{locale}]" if locale else ""
+
+        return [
+            *((key, f"added{suffix}: {value}") for key, value in self.added),
+            *((key, f"removed{suffix}: {value}") for key, value in self.removed),
+            *(
+                (key, f"changed{suffix}: {old_value} -> {new_value}")
+                for key, old_value, new_value in self.changed
+            ),
+        ]
+
+
+def diff_strings(
+    old_strings: Iterable[Tuple[str, str]], new_strings: Iterable[Tuple[str, str]]
+) -> StringsDiff:
+    """
+    Compares two versions of the strings returned by `get_strings`.
+
+    Both versions are indexed in a dict by key and joined on it, so the comparison
+    takes linear time in the number of strings. If a key is repeated, its last value
+    is compared, like in `Catalog.add_locale`.
+
+    :param old_strings: Strings of the previous version
+    :type old_strings: Iterable[Tuple[str, str]]
+    :param new_strings: Strings of the current version
+    :type new_strings: Iterable[Tuple[str, str]]
+    :return: The keys added, removed and changed in `new_strings`
+    :rtype: StringsDiff
+    """
+
+    old_values = dict(old_strings)
+    new_values = dict(new_strings)
+    diff = StringsDiff()
+
+    for key, new_value in new_values.items():
+        if key not in old_values:
+            diff.added.append((key, new_value))
+        elif old_values[key] != new_value:
+            diff.changed.append((key, old_values[key], new_value))
+
+    diff.removed = [
+        (key, old_value)
+        for key, old_value in old_values.items()
+        if key not in new_values
+    ]
+
+    return diff
+
+
+def diff_catalogs(old_catalog: Catalog, new_catalog: Catalog) -> Dict[str, StringsDiff]:
+    """
+    Compares every locale of two versions of a catalog. A locale that only exists in
+    one of them is compared with an empty locale.
+
+    :param old_catalog: Catalog of the previous version
+    :type old_catalog: Catalog
+    :param new_catalog: Catalog of the current version
+    :type new_catalog: Catalog
+    :return: The differences of each locale, in the order of the new catalog followed
+        by the locales that were removed
+    :rtype: Dict[str, StringsDiff]
+    """
+
+    locales = new_catalog.locales + [
+        locale for locale in old_catalog.locales if locale not in new_catalog.columns
+    ]
+
+    return {
+        locale: diff_strings(
+            old_catalog.get_strings(locale) if locale in old_catalog.columns else [],
+            new_catalog.get_strings(locale) if locale in new_catalog.columns else [],
+        )
+        for locale in locales
+    }
+
+
+def get_missing_keys(
+    catalog: Catalog, reference_locale: str = DEFAULT_LOCALE
+) -> Dict[str, List[str]]:
+    """
+    Finds the keys of the reference locale that have no value in each of the other
+    locales of the catalog, e.g. the strings that are not translated yet.
+
+    :param catalog: Catalog to check
+    :type catalog: Catalog
+    :param reference_locale: Locale with every key, usually the default one
+    :type reference_locale: str
+    :return: The missing keys of each locale, in the order of the catalog. Locales
+        without missing keys are left out
+    :rtype: Dict[str, List[str]]
+    """
+
+    if reference_locale not in catalog.columns:
+        raise ValueError(
+            f"{ConsoleStyle.RED}The catalog has no {reference_locale} locale."
+            f"{ConsoleStyle.END}"
+        )
+
+    reference_column = catalog.columns[reference_locale]
+    missing_keys = {}
+
+    for locale, column in catalog.columns.items():
+        if locale == reference_locale:
+            continue
+
+        keys = [
+            catalog.keys[row]
+            for row, value in enumerate(reference_column)
+            if value is not None and (row >= len(column) or column[row] is None)
+        ]
+
+        if keys:
+            missing_keys[locale] = keys
+
+    return missing_keys
+
+
+def missing_keys_to_strings(
+    missing_keys: Dict[str, List[str]]
+) -> List[Tuple[str, str]]:
+    """
+    Formats the result of `get_missing_keys` as strings, with a row per key listing
+    the locales where it is missing, e.g. `missing: es, fr`.
+
+    :param missing_keys: Missing keys of each locale
+    :type missing_keys: Dict[str, List[str]]
+    :return: A row per missing key, in the order they are first found
+    :rtype: List[Tuple[str, str]]
+    """
+
+    key_locales: Dict[str, List[str]] = {}
+
+    for locale, keys in missing_keys.items():
+        for key in keys:
+            key_locales.setdefault(key, []).append(locale)
+
+    return [
+        (key, f"missing: {', '.join(locales)}") for key, locales in key_locales.items()
+    ]
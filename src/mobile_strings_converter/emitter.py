@@ -0,0 +1,298 @@
+import re
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, List, Tuple
+
+# Number of strings formatted and written at once by `RowEmitter.write`
+EMITTER_BLOCK_SIZE = 1024
+
+# Number of strings of the pieces a block is checked again in when it has to be
+# escaped, so that only the pieces with special characters are escaped
+EMITTER_PIECE_SIZE = 32
+
+# Characters that start markup in the text of a .html table. `>` is valid in text
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;"})
+
+# Characters that end a cell or a row of a .md table
+MD_ESCAPE_TABLE = str.maketrans({"|": "\\|", "\r": "<br>", "\n": "<br>"})
+
+# A `<br>`, which stands for a line break in a .md table, or a literal `<br>` as the
+# .md writer escapes it, with `&lt;` and as many `amp;` as times it was escaped. See
+# `escape_md` and `unescape_md_breaks`
+MD_BREAK_PATTERN = re.compile(r"(?:&(?:amp;)*lt;|<)br>")
+
+# Characters that end or break the `name` attribute of a .xml string
+XML_ATTRIBUTE_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", '"': "&quot;"})
+
+# A quote or a backslash, along with the escaped character if it is a backslash.
+# Escape sequences are kept, and anything else would end or break the quoted names and
+# values of a .strings file
+IOS_ESCAPE_PATTERN = re.compile(r'[\\"](?:(?<=\\).)?', re.DOTALL)
+
+# An ampersand that doesn't start an entity, or an angle bracket that doesn't start a
+# tag, comment or CDATA section. Android values may contain markup such as `<b>`,
+# which is kept as it is
+XML_TEXT_ESCAPE_PATTERN = re.compile(
+    r"&(?![a-zA-Z][a-zA-Z0-9]*;|#[0-9]+;|#x[0-9a-fA-F]+;)|<(?![a-zA-Z/!?])"
+)
+XML_TEXT_ESCAPES = {"&": "&amp;", "<": "&lt;"}
+
+
+class RowEmitter:
+    """
+    Writes the rows of a text file format, escaping the names and values so that they
+    can't break the structure of the file.
+
+    The strings are written in blocks, encoded to UTF-8 with a single `write` call per
+    block. Searching every name and value for characters to escape costs as much as
+    formatting them, so each block is formatted and encoded first, and every byte that
+    is not one of those characters is deleted with `bytes.translate`. If what is left
+    is the markup of the rows themselves, there is nothing to escape, which is the case
+    for most blocks. Otherwise, the block is formatted again with the names and values
+    escaped.
+    """
+
+    def __init__(
+        self,
+        format_rows: Callable[[List[Tuple[str, str]]], str],
+        special_characters: str,
+        escape_name: Callable[[str], str],
+        escape_value: Callable[[str], str],
+        block_size: int = EMITTER_BLOCK_SIZE,
+    ):
+        """
+        :param format_rows: Formats the rows of some strings
+        :type format_rows: Callable[[List[Tuple[str, str]]], str]
+        :param special_characters: ASCII characters of the names or values that may
+            have to be escaped. Names and values without any of them are written as
+            they are
+        :type special_characters: str
+        :param escape_name: Escapes a name
+        :type escape_name: Callable[[str], str]
+        :param escape_value: Escapes a value
+        :type escape_value: Callable[[str], str]
+        :param block_size: Number of strings per `write` call
+        :type block_size: int
+        """
+
+        self.format_rows = format_rows
+        self.special_characters = special_characters
+        self.escape_name = escape_name
+        self.escape_value = escape_value
+        self.block_size = block_size
+
+        # The bytes of ASCII characters never appear inside a multibyte UTF-8
+        # sequence, so the special characters can be looked for in the encoded rows
+        special_bytes = special_characters.encode("ascii")
+        self._other_bytes = bytes(b for b in range(256) if b not in special_bytes)
+        self._row_markup = (
+            format_rows([("", "")]).encode("utf-8").translate(None, self._other_bytes)
+        )
+
+    def write(self, file: BinaryIO, strings: Iterable[Tuple[str, str]]):
+        """
+        Writes the rows of the strings to a file.
+
+        :param file: File opened in binary mode
+        :type file: BinaryIO
+        :param strings: Names and values to write
+        :type strings: Iterable[Tuple[str, str]]
+        """
+
+        strings = iter(strings)
+
+        while True:
+            block = list(islice(strings, self.block_size))
+            if not block:
+                break
+
+            file.write(self.format_block(block))
+
+    def format_block(self, strings: List[Tuple[str, str]]) -> bytes:
+        """
+        Formats the rows of some strings, escaping the names and values if needed.
+
+        :param strings: Names and values to format
+        :type strings: List[Tuple[str, str]]
+        :return: The rows of the strings, encoded to UTF-8
+        :rtype: bytes
+        """
+
+        data = self.format_rows(strings).encode("utf-8")
+
+        if data.translate(None, self._other_bytes) == self._row_markup * len(strings):
+            return data
+
+        # Escaping costs several times more than formatting, so a single value with a
+        # special character doesn't make every string of the block be escaped
+        if len(strings) > EMITTER_PIECE_SIZE:
+            return b"".join(
+                [
+                    self.format_block(strings[i : i + EMITTER_PIECE_SIZE])
+                    for i in range(0, len(strings), EMITTER_PIECE_SIZE)
+                ]
+            )
+
+        return self.format_rows(
+            [
+                (self.escape_name(str(name)), self.escape_value(str(value)))
+                for name, value in strings
+            ]
+        ).encode("utf-8")
+
+
+def escape_html(text: str) -> str:
+    """
+    Escapes the text of a cell of a .html table.
+
+    :param text: Name or value of a string
+    :type text: str
+    :return: The text with `&` and `<` replaced by their entities
+    :rtype: str
+    """
+
+    if "&" in text or "<" in text:
+        return text.translate(HTML_ESCAPE_TABLE)
+
+    return text
+
+
+def escape_md(text: str) -> str:
+    """
+    Escapes the text of a cell of a .md table, so that pipes don't split the cell and
+    line breaks don't split the row. A literal `<br>` is written as `&lt;br>`, which
+    is also how it is displayed, so it isn't read back as a line break.
+
+    :param text: Name or value of a string
+    :type text: str
+    :return: The text with `|` escaped and line breaks replaced by `<br>`
+    :rtype: str
+    """
+
+    if "br>" in text:
+        text = MD_BREAK_PATTERN.sub(_escape_md_break, text)
+
+    if "|" in text or "\n" in text or "\r" in text:
+        return text.replace("\r\n", "\n").translate(MD_ESCAPE_TABLE)
+
+    return text
+
+
+def unescape_md_breaks(text: str) -> str:
+    """
+    Reverts the line breaks and literal `<br>` escaped by `escape_md`.
+
+    :param text: Text of a cell of a .md table
+    :type text: str
+    :return: The text with `<br>` replaced by line breaks and one level of escaping
+        removed from the escaped `<br>`
+    :rtype: str
+    """
+
+    if "br>" in text:
+        return MD_BREAK_PATTERN.sub(_unescape_md_break, text)
+
+    return text
+
+
+def escape_ios(text: str) -> str:
+    """
+    Escapes the quoted name or value of a .strings file. Values keep the escape
+    sequences of the file they were read from, e.g. `I\\'m`, so only the quotes and
+    backslashes that are not part of an escape sequence are escaped.
+
+    :param text: Name or value of a string
+    :type text: str
+    :return: The text, which can be written between double quotes
+    :rtype: str
+    """
+
+    if '"' in text or text.endswith("\\"):
+        return IOS_ESCAPE_PATTERN.sub(_escape_ios_match, text)
+
+    return text
+
+
+def escape_xml_text(text: str) -> str:
+    """
+    Escapes the text of a .xml string. Values keep the entities and markup of the file
+    they were read from, e.g. `&amp;` or `<b>`, so only the ampersands and angle
+    brackets that would make the file malformed are escaped.
+
+    :param text: Value of a string
+    :type text: str
+    :return: The text, which can be written inside a `<string>` element
+    :rtype: str
+    """
+
+    if "&" in text or "<" in text:
+        return XML_TEXT_ESCAPE_PATTERN.sub(
+            lambda match: XML_TEXT_ESCAPES[match.group()], text
+        )
+
+    return text
+
+
+def escape_xml_attribute(text: str) -> str:
+    """
+    Escapes the `name` attribute of a .xml string.
+
+    :param text: Name of a string
+    :type text: str
+    :return: The text with `&`, `<` and `"` replaced by their entities
+    :rtype: str
+    """
+
+    if "&" in text or "<" in text or '"' in text:
+        return text.translate(XML_ATTRIBUTE_ESCAPE_TABLE)
+
+    return text
+
+
+def _escape_md_break(match: re.Match) -> str:
+    # `<br>` becomes `&lt;br>`, and `&lt;br>` becomes `&amp;lt;br>`
+    sequence = match.group()
+    return ("&amp;" if sequence[0] == "&" else "&lt;") + sequence[1:]
+
+
+def _unescape_md_break(match: re.Match) -> str:
+    sequence = match.group()
+
+    if sequence == "<br>":
+        return "\n"
+
+    return ("<" + sequence[4:]) if sequence.startswith("&lt;") else "&" + sequence[5:]
+
+
+def _escape_ios_match(match: re.Match) -> str:
+    # Escape sequences are kept, a lone quote or backslash gets a backslash
+    sequence = match.group()
+    return sequence if len(sequence) == 2 else "\\" + sequence
+
+
+def _format_html_rows(strings: List[Tuple[str, str]]) -> str:
+    return "".join(
+        [
+            f"\t\t<tr>\n\t\t\t<td>{name}</td>\n\t\t\t<td>{value}</td>\n\t\t</tr>\n"
+            for name, value in strings
+        ]
+    )
+
+
+def _format_md_rows(strings: List[Tuple[str, str]]) -> str:
+    return "".join([f"| {name} | {value} |\n" for name, value in strings])
+
+
+def _format_ios_rows(strings: List[Tuple[str, str]]) -> str:
+    return "".join([f'"{name}" = "{value}";\n' for name, value in strings])
+
+
+def _format_xml_rows(strings: List[Tuple[str, str]]) -> str:
+    return "".join(
+        [f'\t<string name="{name}">{value}</string>\n' for name, value in strings]
+    )
+
+
+HTML_EMITTER = RowEmitter(_format_html_rows, "&<", escape_html, escape_html)
+MD_EMITTER = RowEmitter(_format_md_rows, "|\n\r>", escape_md, escape_md)
+IOS_EMITTER = RowEmitter(_format_ios_rows, '"\\', escape_ios, escape_ios)
+XML_EMITTER = RowEmitter(_format_xml_rows, '&<"', escape_xml_attribute, escape_xml_text)
@@ -0,0 +1,636 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import gspread
+from gspread.auth import DEFAULT_SERVICE_ACCOUNT_FILENAME
+from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.http_client import HTTPClient
+from gspread.utils import absolute_range_name
+from requests import Response, Session
+
+from .cache import StringsCache
+from .compression import strip_compression_suffix
+
+# Default number of rows sent in each request when uploading strings
+DEFAULT_CHUNK_SIZE = 1000
+
+# Default number of times a request is retried after hitting the API quota
+DEFAULT_MAX_RETRIES = 5
+
+# Default wait before the first retry, in seconds. It doubles after every retry
+DEFAULT_BACKOFF = 1.0
+
+# Maximum wait between two retries, in seconds
+MAX_BACKOFF = 64.0
+
+# Default quota of the Google Sheets API per user and minute
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+# Default number of spreadsheets or worksheets uploaded at the same time. It is kept
+# below the size of the connection pool of `requests`, which is 10
+DEFAULT_MAX_WORKERS = 8
+
+# Status codes of the errors that are worth retrying: the per-minute quota was
+# exceeded or the API is temporarily unavailable
+RETRY_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+HEADER_ROW = ["NAME", "VALUE"]
+
+# Prefix of the input paths that refer to a Google spreadsheet, e.g.
+# `gsheet://MyProject strings` or `gsheet://MyProject strings#es` for a worksheet
+GOOGLE_SHEETS_URL_PREFIX = "gsheet://"
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that allows at most `max_requests` calls to `acquire` in any
+    window of `period` seconds, so concurrent uploads share the same API quota.
+    """
+
+    def __init__(self, max_requests: int, period: float = 60.0):
+        """
+        :param max_requests: Maximum number of requests per period
+        :type max_requests: int
+        :param period: Length of the window, in seconds
+        :type period: float
+        """
+
+        if max_requests < 1:
+            raise ValueError("The maximum number of requests must be greater than 0.")
+
+        self.max_requests = max_requests
+        self.period = period
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a request can be sent without exceeding the rate limit."""
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+
+                # Forget the requests that are out of the window
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+
+                wait = self.period - (now - self._timestamps[0])
+
+            time.sleep(wait)
+
+
+class SheetsHTTPClient(HTTPClient):
+    """
+    HTTP client of gspread that retries the requests rejected because of the API quota
+    with exponential backoff, honoring the `Retry-After` header when the API sends it.
+    """
+
+    def __init__(
+        self,
+        auth: Any,
+        session: Optional[Session] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        :param auth: Credentials used to authorize the requests
+        :type auth: Any
+        :param session: Session used to send the requests. If provided, `auth` is
+            ignored
+        :type session: Optional[Session]
+        :param max_retries: Number of times a request is retried before giving up
+        :type max_retries: int
+        :param backoff: Wait before the first retry, in seconds. It doubles after every
+            retry
+        :type backoff: float
+        :param rate_limiter: Limiter shared by every request of the client, including
+            the retries
+        :type rate_limiter: Optional[RateLimiter]
+        """
+
+        super().__init__(auth, session)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter
+
+    def request(self, *args, **kwargs) -> Response:
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                return super().request(*args, **kwargs)
+            except APIError as e:
+                if e.code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    raise
+
+                time.sleep(self._get_retry_delay(e.response, attempt))
+
+    # Private methods
+
+    def _get_retry_delay(self, response: Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), MAX_BACKOFF)
+            except ValueError:
+                # It can also be an HTTP date, which is not worth parsing
+                pass
+
+        return min(self.backoff * 2**attempt, MAX_BACKOFF)
+
+
+def authorize(
+    credentials_filepath: Path,
+    requests_per_minute: Optional[int] = DEFAULT_REQUESTS_PER_MINUTE,
+) -> gspread.Client:
+    """
+    Returns a gspread client authorized with the given service account that retries the
+    requests rejected because of the API quota. The client and its HTTP session can be
+    shared by several threads, so create it once and reuse it for every upload.
+
+    :param credentials_filepath: Path to the service_account.json of the user's Google
+        account
+    :type credentials_filepath: Path
+    :param requests_per_minute: Maximum number of requests sent per minute by all the
+        threads using the client. None disables the limit
+    :type requests_per_minute: Optional[int]
+    :return: The authorized client
+    :rtype: gspread.Client
+    """
+
+    client = gspread.service_account(
+        filename=credentials_filepath, http_client=SheetsHTTPClient
+    )
+
+    if requests_per_minute is not None:
+        client.http_client.rate_limiter = RateLimiter(requests_per_minute)
+
+    return client
+
+
+@lru_cache(maxsize=None)
+def get_client(credentials_filepath: Optional[Path] = None) -> gspread.Client:
+    """
+    Returns the client authorized with the given service account, creating it only the
+    first time it is requested, so every spreadsheet read in the process shares it.
+
+    :param credentials_filepath: Path to the service_account.json of the user's Google
+        account. Defaults to the gspread default location,
+        `~/.config/gspread/service_account.json`
+    :type credentials_filepath: Optional[Path]
+    :return: The authorized client
+    :rtype: gspread.Client
+    """
+
+    return authorize(credentials_filepath or DEFAULT_SERVICE_ACCOUNT_FILENAME)
+
+
+def is_google_sheets_url(path: Union[str, Path]) -> bool:
+    """
+    Returns True if the input path refers to a Google spreadsheet.
+
+    :param path: Input path
+    :type path: Union[str, Path]
+    :return: True if the path starts with `gsheet://`
+    :rtype: bool
+    """
+
+    # A Path would have collapsed the double slash
+    return isinstance(path, str) and path.startswith(GOOGLE_SHEETS_URL_PREFIX)
+
+
+def parse_google_sheets_url(url: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits a `gsheet://<name>[#<worksheet>]` input path.
+
+    :param url: Input path referring to a Google spreadsheet
+    :type url: str
+    :return: The name of the spreadsheet and the title of the worksheet, or None for
+        the first worksheet
+    :rtype: Tuple[str, Optional[str]]
+    """
+
+    sheet_name, _, worksheet_title = url[len(GOOGLE_SHEETS_URL_PREFIX) :].partition("#")
+
+    if not sheet_name:
+        raise ValueError(f"The spreadsheet name is missing in {url}.")
+
+    return sheet_name, worksheet_title or None
+
+
+def get_input_stem(input_filepath: Union[str, Path]) -> str:
+    """
+    Returns the name used for the outputs of an input file: the stem of the file, or
+    the worksheet or spreadsheet name of a `gsheet://` path.
+
+    :param input_filepath: Path to the input file, or a `gsheet://` path
+    :type input_filepath: Union[str, Path]
+    :return: The name of the input
+    :rtype: str
+    """
+
+    if is_google_sheets_url(input_filepath):
+        sheet_name, worksheet_title = parse_google_sheets_url(input_filepath)
+        return worksheet_title or sheet_name
+
+    return strip_compression_suffix(input_filepath).stem
+
+
+def get_strings_from_google_sheets(
+    client: gspread.Client,
+    sheet_name: str,
+    worksheet_title: Optional[str] = None,
+    cache: Optional[StringsCache] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Extract data from a worksheet with NAME and VALUE columns, like the ones written by
+    `upload_strings`, and return it as a list of tuples.
+
+    The spreadsheet is looked up with one Drive API request, which also returns its
+    modification time. If the strings of that revision are cached they are returned
+    right away, otherwise the whole NAME/VALUE range is fetched with one `values.get`
+    request and cached.
+
+    :param client: Authorized gspread client. See `authorize`
+    :type client: gspread.Client
+    :param sheet_name: Name of the spreadsheet
+    :type sheet_name: str
+    :param worksheet_title: Title of the worksheet. Defaults to the first worksheet
+    :type worksheet_title: Optional[str]
+    :param cache: Cache of the extracted strings, keyed by the spreadsheet revision
+    :type cache: Optional[StringsCache]
+    :return: A list of tuples where each tuple contains a NAME and VALUE.
+    :rtype: List[Tuple[str, str]]
+    """
+
+    spreadsheet_files = client.list_spreadsheet_files(title=sheet_name)
+
+    if not spreadsheet_files:
+        raise ValueError(f"The spreadsheet {sheet_name} was not found.")
+
+    spreadsheet_file = spreadsheet_files[0]
+
+    if cache is not None:
+        cache_key = cache.get_key(
+            GOOGLE_SHEETS_URL_PREFIX,
+            spreadsheet_file["id"],
+            spreadsheet_file["modifiedTime"],
+            worksheet_title=worksheet_title,
+        )
+        strings = cache.get(cache_key)
+
+        if strings is not None:
+            return strings
+
+    # A range without a sheet name refers to the first worksheet
+    if worksheet_title is None:
+        range_name = "A:B"
+    else:
+        range_name = absolute_range_name(worksheet_title, "A:B")
+
+    response = client.http_client.values_get(spreadsheet_file["id"], range_name)
+
+    # Skip the header row
+    strings = [tuple(_pad_row(row)) for row in response.get("values", [])[1:]]
+
+    if cache is not None:
+        cache.set(cache_key, strings)
+
+    return strings
+
+
+def upload_strings(
+    client: gspread.Client,
+    sheet_name: str,
+    strings: Sequence[Tuple[str, str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    worksheet_title: Optional[str] = None,
+):
+    """
+    Replaces the content of a worksheet of the spreadsheet with the strings.
+
+    The worksheet is cleared and the rows are written with one `values.update` request
+    per `chunk_size` rows, instead of one request per string, so large files don't
+    exceed the API quota.
+
+    :param client: Authorized gspread client. See `authorize`
+    :type client: gspread.Client
+    :param sheet_name: Name of the existing spreadsheet to write the strings to
+    :type sheet_name: str
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Sequence[Tuple[str, str]]
+    :param chunk_size: Maximum number of rows sent in each request
+    :type chunk_size: int
+    :param worksheet_title: Title of the worksheet to write the strings to. It is
+        created if it does not exist. Defaults to the first worksheet
+    :type worksheet_title: Optional[str]
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be greater than 0.")
+
+    worksheet = _open_worksheet(client.open(sheet_name), worksheet_title)
+    _upload_to_worksheet(worksheet, strings, chunk_size)
+
+
+def _upload_to_worksheet(
+    worksheet: gspread.Worksheet, strings: Sequence[Tuple[str, str]], chunk_size: int
+):
+    rows = [HEADER_ROW, *_get_rows(strings)]
+
+    worksheet.clear()
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        worksheet.spreadsheet.values_update(
+            absolute_range_name(worksheet.title, f"A{start + 1}:B{start + len(chunk)}"),
+            params={"valueInputOption": "RAW"},
+            body={"values": chunk},
+        )
+
+
+def sync_strings(
+    client: gspread.Client,
+    sheet_name: str,
+    strings: Sequence[Tuple[str, str]],
+    worksheet_title: Optional[str] = None,
+) -> Tuple[int, int, int]:
+    """
+    Updates a worksheet of the spreadsheet so it contains the strings, writing only the
+    cells that changed.
+
+    The current rows are read with one `values.get` request and compared with the
+    strings by name. The changes are then sent in one `batchUpdate` request: changed
+    values are updated in place, rows of removed strings are deleted and new strings
+    are appended at the end of the worksheet. Unlike `upload_strings`, the rows that
+    did not change keep their notes and formatting.
+
+    :param client: Authorized gspread client. See `authorize`
+    :type client: gspread.Client
+    :param sheet_name: Name of the existing spreadsheet to write the strings to
+    :type sheet_name: str
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Sequence[Tuple[str, str]]
+    :param worksheet_title: Title of the worksheet to write the strings to. It is
+        created if it does not exist. Defaults to the first worksheet
+    :type worksheet_title: Optional[str]
+    :return: Number of inserted, updated and deleted rows
+    :rtype: Tuple[int, int, int]
+    """
+
+    worksheet = _open_worksheet(client.open(sheet_name), worksheet_title)
+
+    return _sync_worksheet(worksheet, strings)
+
+
+def _sync_worksheet(
+    worksheet: gspread.Worksheet, strings: Sequence[Tuple[str, str]]
+) -> Tuple[int, int, int]:
+    response = worksheet.spreadsheet.values_get(
+        absolute_range_name(worksheet.title, "A:B")
+    )
+    current_rows = response.get("values", [])
+
+    updates, deletes, inserts = get_sheet_diff(current_rows, strings)
+
+    requests = []
+
+    for row_index, column_index, value in updates:
+        requests.append(
+            {
+                "updateCells": {
+                    "rows": [{"values": [_get_cell_data(value)]}],
+                    "fields": "userEnteredValue",
+                    "start": {
+                        "sheetId": worksheet.id,
+                        "rowIndex": row_index,
+                        "columnIndex": column_index,
+                    },
+                }
+            }
+        )
+
+    # Delete from the bottom up so the indexes of the remaining rows don't shift
+    for start_index, end_index in reversed(_get_index_ranges(deletes)):
+        requests.append(
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": start_index,
+                        "endIndex": end_index,
+                    }
+                }
+            }
+        )
+
+    if inserts:
+        requests.append(
+            {
+                "appendCells": {
+                    "sheetId": worksheet.id,
+                    "rows": [
+                        {"values": [_get_cell_data(cell) for cell in row]}
+                        for row in inserts
+                    ],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+
+    if requests:
+        worksheet.spreadsheet.batch_update({"requests": requests})
+
+    return len(inserts), len(updates), len(deletes)
+
+
+def upload_many(
+    client: gspread.Client,
+    uploads: Sequence[Tuple[str, Optional[str], Sequence[Tuple[str, str]]]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sync: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+):
+    """
+    Writes several sets of strings to their worksheets concurrently with one shared
+    client.
+
+    Every spreadsheet is opened only once, even if several worksheets of it are
+    written. Then the worksheets are written on a thread pool. Uploads to the same
+    worksheet run one after the other in the given order, so the last one wins as if
+    they were run serially. The requests of every thread go through the rate limiter
+    of the client, if any.
+
+    :param client: Authorized gspread client. See `authorize`
+    :type client: gspread.Client
+    :param uploads: Spreadsheet name, worksheet title and strings of each upload. A
+        None worksheet title stands for the first worksheet of the spreadsheet
+    :type uploads: Sequence[Tuple[str, Optional[str], Sequence[Tuple[str, str]]]]
+    :param chunk_size: Maximum number of rows sent in each request. See
+        `upload_strings`
+    :type chunk_size: int
+    :param sync: True to write only the cells that changed. See `sync_strings`
+    :type sync: bool
+    :param max_workers: Maximum number of worksheets written at the same time
+    :type max_workers: int
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be greater than 0.")
+
+    # Group the uploads by spreadsheet and then by worksheet, keeping their order
+    spreadsheets: Dict[str, Dict[Optional[str], List[Sequence[Tuple[str, str]]]]] = {}
+    for sheet_name, worksheet_title, strings in uploads:
+        worksheets = spreadsheets.setdefault(sheet_name, {})
+        worksheets.setdefault(worksheet_title, []).append(strings)
+
+    def open_worksheets(sheet_name):
+        spreadsheet = client.open(sheet_name)
+        return [
+            (_open_worksheet(spreadsheet, worksheet_title), strings_list)
+            for worksheet_title, strings_list in spreadsheets[sheet_name].items()
+        ]
+
+    def write_worksheet(worksheet, strings_list):
+        for strings in strings_list:
+            if sync:
+                _sync_worksheet(worksheet, strings)
+            else:
+                _upload_to_worksheet(worksheet, strings, chunk_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        opened = executor.map(open_worksheets, spreadsheets)
+
+        futures = [
+            executor.submit(write_worksheet, worksheet, strings_list)
+            for worksheets in opened
+            for worksheet, strings_list in worksheets
+        ]
+
+        # Raise the first exception thrown by an upload, if any
+        for future in futures:
+            future.result()
+
+
+def get_sheet_diff(
+    current_rows: Sequence[Sequence[str]], strings: Sequence[Tuple[str, str]]
+) -> Tuple[List[Tuple[int, int, str]], List[int], List[List[str]]]:
+    """
+    Compares the rows of a worksheet, including the header row, with the strings.
+
+    The rows are matched by name. Repeated names are matched in order of appearance, so
+    the n-th row named "a" is compared with the n-th string named "a".
+
+    :param current_rows: Rows of the worksheet as returned by the Google Sheets API,
+        which omits the trailing empty cells
+    :type current_rows: Sequence[Sequence[str]]
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Sequence[Tuple[str, str]]
+    :return: The cells to update as (row index, column index, value) tuples, the
+        indexes of the rows to delete in ascending order and the rows to append
+    :rtype: Tuple[List[Tuple[int, int, str]], List[int], List[List[str]]]
+    """
+
+    updates = []
+    deletes = []
+    inserts = []
+
+    current_rows = [_pad_row(row) for row in current_rows]
+
+    if not current_rows:
+        inserts.append(HEADER_ROW)
+    else:
+        updates.extend(
+            (0, column_index, value)
+            for column_index, value in enumerate(HEADER_ROW)
+            if current_rows[0][column_index] != value
+        )
+
+    current_row_indexes: Dict[Tuple[str, int], int] = {}
+    occurrences: Dict[str, int] = {}
+
+    for row_index, (name, _) in enumerate(current_rows[1:], start=1):
+        occurrence = occurrences.get(name, 0)
+        occurrences[name] = occurrence + 1
+        current_row_indexes[(name, occurrence)] = row_index
+
+    occurrences.clear()
+
+    for name, value in _get_rows(strings):
+        occurrence = occurrences.get(name, 0)
+        occurrences[name] = occurrence + 1
+
+        row_index = current_row_indexes.pop((name, occurrence), None)
+
+        if row_index is None:
+            inserts.append([name, value])
+        elif current_rows[row_index][1] != value:
+            updates.append((row_index, 1, value))
+
+    # The rows left are the ones whose string no longer exists
+    deletes.extend(sorted(current_row_indexes.values()))
+
+    return updates, deletes, inserts
+
+
+def _open_worksheet(
+    spreadsheet: gspread.Spreadsheet, worksheet_title: Optional[str]
+) -> gspread.Worksheet:
+    if worksheet_title is None:
+        return spreadsheet.sheet1
+
+    try:
+        return spreadsheet.worksheet(worksheet_title)
+    except WorksheetNotFound:
+        return spreadsheet.add_worksheet(worksheet_title, rows=1000, cols=2)
+
+
+def _get_rows(strings: Sequence[Tuple[str, str]]) -> List[List[str]]:
+    # Empty cells are read as None and numbers as int or float from some file types
+    return [
+        ["" if cell is None else str(cell) for cell in (name, value)]
+        for name, value in strings
+    ]
+
+
+def _pad_row(row: Sequence[str]) -> List[str]:
+    return [*row[:2], *[""] * (2 - len(row[:2]))]
+
+
+def _get_cell_data(value: str) -> Dict[str, Any]:
+    return {"userEnteredValue": {"stringValue": value}}
+
+
+def _get_index_ranges(indexes: Sequence[int]) -> List[Tuple[int, int]]:
+    # Groups consecutive indexes, e.g. [1, 2, 3, 7] -> [(1, 4), (7, 8)]
+    ranges = []
+
+    for index in indexes:
+        if ranges and ranges[-1][1] == index:
+            ranges[-1] = (ranges[-1][0], index + 1)
+        else:
+            ranges.append((index, index + 1))
+
+    return ranges
@@ -0,0 +1,263 @@
+import json
+import re
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional, TextIO, Tuple
+
+from .console_style import ConsoleStyle
+from .emitter import RowEmitter, escape_html, escape_xml_attribute
+
+# Number of strings written to each page of a report
+DEFAULT_PAGE_SIZE = 1000
+
+# Name of the JSON file with the keys of every page, saved in the pages directory
+SEARCH_INDEX_FILENAME = "search-index.json"
+
+# Name of the pages of a report, with their number
+PAGE_FILENAME_PATTERN = re.compile(r"page-([0-9]+)\.html")
+
+# Looks up the keys of the search index and links to the pages that have them. The
+# index is fetched, so the report has to be served over HTTP for the search to work
+SEARCH_SCRIPT = """<script>
+\tconst input = document.getElementById("search");
+\tconst results = document.getElementById("results");
+\tlet index = null;
+
+\tinput.addEventListener("input", async () => {
+\t\tif (index === null) {
+\t\t\tindex = await (await fetch("%(search_index)s")).json();
+\t\t}
+\t\tconst query = input.value.trim().toLowerCase();
+\t\tresults.replaceChildren();
+\t\tif (!query) {
+\t\t\treturn;
+\t\t}
+\t\tfor (let page = 0; page < index.length; page++) {
+\t\t\tfor (const key of index[page]) {
+\t\t\t\tif (results.childElementCount >= 50) {
+\t\t\t\t\treturn;
+\t\t\t\t}
+\t\t\t\tif (key.toLowerCase().includes(query)) {
+\t\t\t\t\tconst link = document.createElement("a");
+\t\t\t\t\tlink.href = `%(pages_dir)s/page-${page + 1}.html#${encodeURIComponent(key)}`;
+\t\t\t\t\tlink.textContent = key;
+\t\t\t\t\tconst item = document.createElement("li");
+\t\t\t\t\titem.append(link);
+\t\t\t\t\tresults.append(item);
+\t\t\t\t}
+\t\t\t}
+\t\t}
+\t});
+</script>
+"""
+
+
+def to_html_report(
+    strings: Iterable[Tuple[str, str]],
+    output_filepath: Path,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    search_index: bool = False,
+) -> int:
+    """
+    Formats strings to a paginated .html report, so that catalogs too large for a
+    single table can be opened in a browser.
+
+    The strings are split into pages of `page_size` rows, saved in a `<name>-pages`
+    directory next to `output_filepath` as `page-1.html`, `page-2.html`, etc. The
+    file at `output_filepath` is an index with the first and last key of every page.
+    Each page is written as soon as its strings are read, so no more than two pages
+    are held in memory at a time.
+
+    The pages and the search index left by a previous report that are not part of
+    the new one are removed, so the directory always matches the index.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Iterable[Tuple[str, str]]
+    :param output_filepath: The path where the index page will be saved
+    :type output_filepath: Path
+    :param page_size: Number of strings per page
+    :type page_size: int
+    :param search_index: True to also save a `search-index.json` file with the keys
+        of every page, and a search box in the index page that looks them up. The
+        search only works if the report is served over HTTP, since browsers don't
+        let pages opened from disk fetch other files
+    :type search_index: bool
+    :return: The number of strings written
+    :rtype: int
+    """
+
+    if page_size < 1:
+        raise ValueError(
+            f"{ConsoleStyle.RED}The page size must be greater than 0."
+            f"{ConsoleStyle.END}"
+        )
+
+    pages_dir = output_filepath.with_name(f"{output_filepath.stem}-pages")
+    pages_dir.mkdir(parents=True, exist_ok=True)
+
+    # First key, last key and number of strings of every page
+    page_ranges: List[Tuple[str, str, int]] = []
+    search_index_file: Optional[TextIO] = None
+
+    if search_index:
+        search_index_file = open(
+            pages_dir / SEARCH_INDEX_FILENAME, "w", encoding="utf-8"
+        )
+
+    try:
+        strings = iter(strings)
+        page = list(islice(strings, page_size))
+
+        while page:
+            # Read ahead to know whether the page links to a next one
+            next_page = list(islice(strings, page_size))
+            page_number = len(page_ranges) + 1
+
+            with open(pages_dir / f"page-{page_number}.html", "wb") as file:
+                _write_page(
+                    file, page, page_number, output_filepath.name, not next_page
+                )
+
+            page_ranges.append((str(page[0][0]), str(page[-1][0]), len(page)))
+
+            if search_index_file is not None:
+                search_index_file.write("[" if page_number == 1 else ",\n")
+                search_index_file.write(
+                    json.dumps(
+                        [str(name) for name, _ in page],
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                )
+
+            page = next_page
+    finally:
+        if search_index_file is not None:
+            search_index_file.write("]\n" if page_ranges else "[]\n")
+            search_index_file.close()
+
+    _remove_stale_files(pages_dir, len(page_ranges), search_index)
+
+    with open(output_filepath, "wb") as file:
+        _write_index(file, page_ranges, pages_dir.name, search_index)
+
+    return sum(count for _, _, count in page_ranges)
+
+
+def _write_page(
+    file: BinaryIO,
+    strings: List[Tuple[str, str]],
+    page_number: int,
+    index_filename: str,
+    is_last_page: bool,
+):
+    links = [f'<a href="../{escape_xml_attribute(index_filename)}">Index</a>']
+    if page_number > 1:
+        links.insert(0, f'<a href="page-{page_number - 1}.html">Previous</a>')
+    if not is_last_page:
+        links.append(f'<a href="page-{page_number + 1}.html">Next</a>')
+
+    file.write(
+        (
+            "<head>\n"
+            '\t<meta charset="UTF-8">\n'
+            f"\t<title>Page {page_number}</title>\n"
+            "</head>\n"
+            f"<nav>{' | '.join(links)}</nav>\n"
+            "<table>\n"
+            "\t<thead>\n"
+            "\t\t<tr>\n"
+            "\t\t\t<th>NAME</th>\n"
+            "\t\t\t<th>VALUE</th>\n"
+            "\t\t</tr>\n"
+            "\t</thead>\n"
+            "\t<tbody>\n"
+        ).encode("utf-8")
+    )
+    PAGE_EMITTER.write(file, strings)
+    file.write(b"\t</tbody>\n</table>\n")
+
+
+def _write_index(
+    file: BinaryIO,
+    page_ranges: List[Tuple[str, str, int]],
+    pages_dirname: str,
+    search_index: bool,
+):
+    pages_href = escape_xml_attribute(pages_dirname)
+    total = sum(count for _, _, count in page_ranges)
+
+    file.write(
+        (
+            "<head>\n"
+            '\t<meta charset="UTF-8">\n'
+            "</head>\n"
+            f"<p>{total} strings in {len(page_ranges)} pages</p>\n"
+        ).encode("utf-8")
+    )
+
+    if search_index:
+        file.write(
+            (
+                '<input id="search" type="search" placeholder="Search keys">\n'
+                '<ul id="results"></ul>\n'
+                + SEARCH_SCRIPT
+                % {
+                    "search_index": f"{pages_href}/{SEARCH_INDEX_FILENAME}",
+                    "pages_dir": pages_href,
+                }
+            ).encode("utf-8")
+        )
+
+    file.write(
+        b"<table>\n"
+        b"\t<thead>\n"
+        b"\t\t<tr>\n"
+        b"\t\t\t<th>PAGE</th>\n"
+        b"\t\t\t<th>FIRST KEY</th>\n"
+        b"\t\t\t<th>LAST KEY</th>\n"
+        b"\t\t\t<th>STRINGS</th>\n"
+        b"\t\t</tr>\n"
+        b"\t</thead>\n"
+        b"\t<tbody>\n"
+    )
+    file.write(
+        "".join(
+            [
+                "\t\t<tr>\n"
+                f'\t\t\t<td><a href="{pages_href}/page-{number}.html">{number}</a></td>\n'
+                f"\t\t\t<td>{escape_html(first_key)}</td>\n"
+                f"\t\t\t<td>{escape_html(last_key)}</td>\n"
+                f"\t\t\t<td>{count}</td>\n"
+                "\t\t</tr>\n"
+                for number, (first_key, last_key, count) in enumerate(page_ranges, 1)
+            ]
+        ).encode("utf-8")
+    )
+    file.write(b"\t</tbody>\n</table>\n")
+
+
+def _remove_stale_files(pages_dir: Path, page_count: int, search_index: bool):
+    # Only the files the report writes are removed, anything else saved in the
+    # directory is kept
+    for filepath in pages_dir.iterdir():
+        match = PAGE_FILENAME_PATTERN.fullmatch(filepath.name)
+        if match and int(match.group(1)) > page_count:
+            filepath.unlink()
+
+    if not search_index:
+        (pages_dir / SEARCH_INDEX_FILENAME).unlink(missing_ok=True)
+
+
+def _format_page_rows(strings: List[Tuple[str, str]]) -> str:
+    # The rows are anchored by key so that the search results can link to them
+    return "".join(
+        [
+            f'\t\t<tr id="{name}">\n\t\t\t<td>{name}</td>\n\t\t\t<td>{value}</td>\n'
+            "\t\t</tr>\n"
+            for name, value in strings
+        ]
+    )
+
+
+PAGE_EMITTER = RowEmitter(_format_page_rows, '&<"', escape_xml_attribute, escape_html)
@@ -0,0 +1,174 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .compression import get_compression_suffix, get_format_suffix
+
+# Name of the manifest file stored in the output directory
+MANIFEST_FILENAME = ".mobile-strings-converter-manifest.json"
+
+
+class Manifest:
+    """
+    Keeps track of the conversions written to an output directory so that the ones
+    whose input, converter version and options have not changed can be skipped.
+
+    Every output file is recorded with the hash of the input file it was generated
+    from, the converter version and the options used to generate it.
+    """
+
+    def __init__(self, output_dir: Path, version: str):
+        """
+        :param output_dir: Directory where the output files and the manifest are saved
+        :type output_dir: Path
+        :param version: Version of the converter generating the output files
+        :type version: str
+        """
+
+        self.output_dir = output_dir
+        self.filepath = output_dir / MANIFEST_FILENAME
+        self.version = version
+        self.entries = self._load()
+
+    def is_up_to_date(
+        self,
+        input_filepath: Path,
+        output_filepath: Path,
+        input_hash: str,
+        with_comments: bool,
+        duplicates: Optional[str] = None,
+        patch: bool = False,
+    ) -> bool:
+        """
+        Checks whether the output file was generated from the same input content with
+        the same converter version and options.
+
+        :param input_filepath: File the strings are extracted from
+        :type input_filepath: Path
+        :param output_filepath: File generated from `input_filepath`
+        :type output_filepath: Path
+        :param input_hash: Current hash of the content of `input_filepath`
+        :type input_hash: str
+        :param with_comments: True if the comments are included in the output file
+        :type with_comments: bool
+        :param duplicates: Policy applied to the repeated keys. See
+            `resolve_duplicates`
+        :type duplicates: Optional[str]
+        :param patch: True if the output file is patched instead of overwritten. See
+            `patch_strings`
+        :type patch: bool
+        :return: True if the output file does not need to be generated again
+        :rtype: bool
+        """
+
+        if not output_filepath.exists():
+            return False
+
+        return self.entries.get(self._get_key(output_filepath)) == self._get_entry(
+            input_filepath,
+            output_filepath,
+            input_hash,
+            with_comments,
+            duplicates,
+            patch,
+        )
+
+    def record(
+        self,
+        input_filepath: Path,
+        output_filepath: Path,
+        input_hash: str,
+        with_comments: bool,
+        duplicates: Optional[str] = None,
+        patch: bool = False,
+    ):
+        """
+        Records that the output file has been generated from the input file.
+
+        :param input_filepath: File the strings were extracted from
+        :type input_filepath: Path
+        :param output_filepath: File generated from `input_filepath`
+        :type output_filepath: Path
+        :param input_hash: Hash of the content of `input_filepath`
+        :type input_hash: str
+        :param with_comments: True if the comments were included in the output file
+        :type with_comments: bool
+        :param duplicates: Policy applied to the repeated keys. See
+            `resolve_duplicates`
+        :type duplicates: Optional[str]
+        :param patch: True if the output file was patched instead of overwritten. See
+            `patch_strings`
+        :type patch: bool
+        """
+
+        self.entries[self._get_key(output_filepath)] = self._get_entry(
+            input_filepath,
+            output_filepath,
+            input_hash,
+            with_comments,
+            duplicates,
+            patch,
+        )
+
+    def save(self):
+        """
+        Writes the manifest to the output directory. The file is replaced atomically,
+        so an interrupted run never leaves a corrupt manifest behind.
+        """
+
+        temp_filepath = self.filepath.with_name(f"{self.filepath.name}.tmp")
+
+        with open(temp_filepath, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, ensure_ascii=False, indent=2, sort_keys=True)
+
+        os.replace(temp_filepath, self.filepath)
+
+    # Private methods
+
+    def _load(self) -> dict:
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            # A missing or corrupt manifest means that everything must be rebuilt
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _get_key(self, output_filepath: Path) -> str:
+        try:
+            return (
+                output_filepath.resolve()
+                .relative_to(self.output_dir.resolve())
+                .as_posix()
+            )
+        except ValueError:
+            return output_filepath.resolve().as_posix()
+
+    def _get_entry(
+        self,
+        input_filepath: Path,
+        output_filepath: Path,
+        input_hash: str,
+        with_comments: bool,
+        duplicates: Optional[str] = None,
+        patch: bool = False,
+    ) -> dict:
+        entry = {
+            "input": Path(input_filepath).resolve().as_posix(),
+            "input_hash": input_hash,
+            "version": self.version,
+            "with_comments": with_comments,
+            "target_type": get_format_suffix(output_filepath)
+            + get_compression_suffix(output_filepath),
+        }
+
+        # Only recorded when used, so the entries written before it was an option
+        # are still up to date
+        if duplicates is not None:
+            entry["duplicates"] = duplicates
+        if patch:
+            entry["patch"] = patch
+
+        return entry
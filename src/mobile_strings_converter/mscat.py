@@ -0,0 +1,265 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .compression import (
+    get_compression_suffix,
+    is_stream_path,
+    open_file,
+    read_seekable,
+)
+
+# Start of every .mscat file, followed by the version of the format
+MSCAT_MAGIC = b"MSCAT\x00\x00\x00"
+MSCAT_VERSION = 1
+
+# Magic, version, reserved, number of strings and size of the data section. Every
+# number is little-endian
+MSCAT_HEADER = struct.Struct("<8sIIQQ")
+
+
+class MscatReader:
+    """
+    Reads a .mscat file without loading it: the file is memory-mapped, and the names
+    and values are decoded from it only when they are accessed.
+
+    A .mscat file has five sections:
+
+    - The header: see `MSCAT_HEADER`.
+    - The offsets: `2 * count + 1` unsigned 64-bit integers. The name of the string
+      `i` spans from `offsets[2 * i]` to `offsets[2 * i + 1]` in the data section, and
+      its value from `offsets[2 * i + 1]` to `offsets[2 * i + 2]`.
+    - The text offsets: the same offsets counted in characters instead of bytes, so
+      `read` decodes the whole data section at once and slices it.
+    - The index: `count` unsigned 32-bit integers, the positions of the strings sorted
+      by the UTF-8 bytes of their names, so a name is looked up with a binary search.
+    - The data: the UTF-8 encoded names and values, one after the other, in the order
+      of the strings.
+
+    Opening the file takes constant time, looking up a name takes logarithmic time and
+    iterating over the strings doesn't copy the file.
+    """
+
+    def __init__(self, filepath: Union[str, Path]):
+        """
+        :param filepath: Path of the .mscat file. A compressed file or a stream is read in
+            memory, since it can't be memory-mapped
+        :type filepath: Union[str, Path]
+        """
+
+        self._mmap: Optional[mmap.mmap] = None
+
+        if get_compression_suffix(filepath) or is_stream_path(filepath):
+            buffer = memoryview(read_seekable(filepath).getbuffer())
+        else:
+            with open(filepath, "rb") as file:
+                try:
+                    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files can't be mapped
+                    raise ValueError(
+                        "The file provided is not a valid .mscat file."
+                    ) from None
+
+            buffer = memoryview(self._mmap)
+
+        self._buffer = buffer
+
+        if len(buffer) < MSCAT_HEADER.size:
+            self._invalid()
+
+        magic, version, _, count, data_size = MSCAT_HEADER.unpack_from(buffer)
+        if magic != MSCAT_MAGIC:
+            self._invalid()
+        if version != MSCAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Unsupported .mscat version {version}. Expected {MSCAT_VERSION}."
+            )
+
+        offsets_start = MSCAT_HEADER.size
+        text_offsets_start = offsets_start + 8 * (2 * count + 1)
+        index_start = text_offsets_start + 8 * (2 * count + 1)
+        data_start = index_start + 4 * count
+
+        if len(buffer) != data_start + data_size:
+            self._invalid()
+
+        self._count = count
+        self._data = buffer[data_start:]
+        self._offsets = _cast(buffer[offsets_start:text_offsets_start], "Q")
+        self._text_offsets = _cast(buffer[text_offsets_start:index_start], "Q")
+        self._index = _cast(buffer[index_start:data_start], "I")
+
+    def __enter__(self) -> "MscatReader":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        data = self._data
+        offsets = self._offsets
+
+        for i in range(0, 2 * self._count, 2):
+            yield (
+                str(data[offsets[i] : offsets[i + 1]], "utf-8"),
+                str(data[offsets[i + 1] : offsets[i + 2]], "utf-8"),
+            )
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def __getitem__(self, name: str) -> str:
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+
+        return value
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Looks up the value of a name without reading the other strings. If the name is
+        repeated, the value of its first string is returned.
+
+        :param name: Name of the string
+        :type name: str
+        :param default: Value returned if there is no string with the name
+        :type default: Optional[str]
+        :return: The value of the string, or `default`
+        :rtype: Optional[str]
+        """
+
+        position = self._find(name)
+        if position is None:
+            return default
+
+        offsets = self._offsets
+        return str(
+            self._data[offsets[2 * position + 1] : offsets[2 * position + 2]], "utf-8"
+        )
+
+    def read(self) -> List[Tuple[str, str]]:
+        """
+        Decodes every string at once. It is faster than iterating over the reader, but
+        it holds a decoded copy of the whole data section while it runs.
+
+        :return: A list of tuples where each tuple contains a NAME and VALUE.
+        :rtype: List[Tuple[str, str]]
+        """
+
+        text = str(self._data, "utf-8")
+        text_offsets = self._text_offsets
+        fields = map(text.__getitem__, map(slice, text_offsets[:-1], text_offsets[1:]))
+
+        return list(zip(fields, fields))
+
+    def close(self):
+        """
+        Unmaps the file. The reader can't be used afterwards.
+        """
+
+        for view in ("_index", "_text_offsets", "_offsets", "_data", "_buffer"):
+            if isinstance(getattr(self, view, None), memoryview):
+                getattr(self, view).release()
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _find(self, name: str) -> Optional[int]:
+        key = name.encode("utf-8")
+        data = self._data
+        offsets = self._offsets
+        index = self._index
+
+        # Leftmost position whose name is not less than the key
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = index[middle]
+            if bytes(data[offsets[2 * position] : offsets[2 * position + 1]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._count:
+            position = index[low]
+            if data[offsets[2 * position] : offsets[2 * position + 1]] == key:
+                return position
+
+        return None
+
+    def _invalid(self):
+        self.close()
+        raise ValueError("The file provided is not a valid .mscat file.")
+
+
+def to_mscat(strings: Iterable[Tuple[Any, Any]], output_filepath: Path):
+    """
+    Formats strings to a .mscat file, a binary format that can be reopened without
+    parsing it. See `MscatReader`. Names and values that are not strings are written
+    as their string representation.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Iterable[Tuple[Any, Any]]
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    texts = [
+        field if isinstance(field, str) else str(field)
+        for field in chain.from_iterable(strings)
+    ]
+    fields = [text.encode("utf-8") for text in texts]
+    count = len(fields) // 2
+
+    offsets = array("Q", accumulate(map(len, fields), initial=0))
+    text_offsets = array("Q", accumulate(map(len, texts), initial=0))
+    names = fields[::2]
+    index = array("I", sorted(range(count), key=names.__getitem__))
+    header = MSCAT_HEADER.pack(MSCAT_MAGIC, MSCAT_VERSION, 0, count, offsets[-1])
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        text_offsets.byteswap()
+        index.byteswap()
+
+    with open_file(output_filepath, "wb") as file:
+        file.write(header)
+        file.write(offsets)
+        file.write(text_offsets)
+        file.write(index)
+        file.writelines(fields)
+
+
+def get_strings_from_mscat(mscat_filepath: Path) -> List[Tuple[str, str]]:
+    """
+    Extract the strings of a .mscat file and return them as a list of tuples.
+
+    :param mscat_filepath: The path to the input .mscat file.
+    :type mscat_filepath: Path
+    :return: A list of tuples where each tuple contains a NAME and VALUE.
+    :rtype: List[Tuple[str, str]]
+    """
+
+    with MscatReader(mscat_filepath) as reader:
+        return reader.read()
+
+
+def _cast(view: memoryview, format: str) -> Union[memoryview, array]:
+    # Views of the little-endian integers of the file, copied only on big-endian
+    # machines, where they have to be swapped
+    if sys.byteorder == "little":
+        return view.cast(format)
+
+    integers = array(format, view)
+    integers.byteswap()
+    return integers
@@ -0,0 +1,216 @@
+import io
+import os
+import re
+import shutil
+import tempfile
+from itertools import accumulate, repeat
+from pathlib import Path
+from typing import Container, Dict, Iterable, List, Pattern, Tuple, Union
+
+from .compression import get_compression_suffix, get_format_suffix, open_file
+from .emitter import (
+    IOS_EMITTER,
+    XML_EMITTER,
+    RowEmitter,
+    escape_ios,
+    escape_xml_attribute,
+    escape_xml_text,
+)
+
+# Start of a string of a .xml file and its name, on a line of its own like
+# `get_strings_from_xml` expects, so commented strings are skipped
+XML_HEAD_PATTERN = re.compile(rb'(\n[ \t]*<string name="([^"\n]*)">)')
+
+# Value of a .xml string, from its start to the closing tag
+XML_TAIL_PATTERN = re.compile(rb"(.*?)</string>(?!\s*-->)")
+
+# Start of a string of a .strings file and its name, on a line of its own like
+# `get_strings_from_ios` expects, so commented strings are skipped
+IOS_HEAD_PATTERN = re.compile(rb'(\n[ \t]*"([^\n]+?)"\s*=\s*")')
+
+# Value of a .strings string, from its start to the semicolon
+IOS_TAIL_PATTERN = re.compile(rb'((?:[^"\\]|\\.)*)"\s*;')
+
+
+def is_patchable(filepath: Union[str, Path]) -> bool:
+    """
+    :param filepath: Path of a file
+    :type filepath: Union[str, Path]
+    :return: True if the file is a .xml or .strings file that already exists, so it
+        can be patched with `patch_strings`
+    :rtype: bool
+    """
+
+    return get_format_suffix(filepath) in (".xml", ".strings") and os.path.isfile(
+        filepath
+    )
+
+
+def patch_strings(
+    strings: Iterable[Tuple[str, str]], target_filepath: Path
+) -> Tuple[int, int]:
+    """
+    Updates an existing .xml or .strings file with the strings instead of writing it
+    again, so the comments, the order and the formatting of the file are kept.
+
+    The file is scanned once to find the span of the value of every key, and only the
+    values that changed are replaced. The bytes in between are copied as they are.
+    The keys that are not in the file are added after its last string: before the
+    closing `</resources>` tag of a .xml file, or at the end of a .strings file. The
+    patched file is written next to the target and then moved over it, so the target
+    is never left half written. Nothing is written if no value changed.
+
+    If a key is repeated in the file, its last string is patched. Commented strings
+    are ignored, like the readers do by default.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Iterable[Tuple[str, str]]
+    :param target_filepath: .xml or .strings file to patch
+    :type target_filepath: Path
+    :return: The number of changed values and the number of added strings
+    :rtype: Tuple[int, int]
+    """
+
+    suffix = get_format_suffix(target_filepath)
+
+    if suffix == ".xml":
+        head_pattern, tail_pattern = XML_HEAD_PATTERN, XML_TAIL_PATTERN
+        emitter = XML_EMITTER
+        escape_name, escape_value = escape_xml_attribute, escape_xml_text
+    elif suffix == ".strings":
+        head_pattern, tail_pattern = IOS_HEAD_PATTERN, IOS_TAIL_PATTERN
+        emitter = IOS_EMITTER
+        escape_name, escape_value = escape_ios, escape_ios
+    else:
+        raise ValueError(f"Only .xml and .strings files can be patched: {suffix}")
+
+    # Names and values as they are written in the file, the last value of a repeated
+    # key winning
+    new_values: Dict[bytes, Tuple[str, str, bytes]] = {}
+    for name, value in strings:
+        text = value if isinstance(value, str) else str(value)
+        new_values[escape_name(name).encode("utf-8")] = (
+            name,
+            value,
+            escape_value(text).encode("utf-8"),
+        )
+
+    with open_file(target_filepath, "rb") as file:
+        data = file.read()
+
+    value_spans = _find_value_spans(data, head_pattern, tail_pattern, new_values)
+
+    replacements: List[Tuple[int, int, bytes]] = []
+    added_strings: List[Tuple[str, str]] = []
+
+    for escaped_name, (name, value, escaped_value) in new_values.items():
+        span = value_spans.get(escaped_name)
+
+        if span is None:
+            added_strings.append((name, value))
+        elif data[span[0] : span[1]] != escaped_value:
+            replacements.append((span[0], span[1], escaped_value))
+
+    if not replacements and not added_strings:
+        return 0, 0
+
+    changed_count = len(replacements)
+
+    if added_strings:
+        replacements.append(_get_insertion(data, suffix, added_strings, emitter))
+
+    replacements.sort()
+    _write_patched(target_filepath, data, replacements)
+
+    return changed_count, len(added_strings)
+
+
+def _find_value_spans(
+    data: bytes,
+    head_pattern: Pattern[bytes],
+    tail_pattern: Pattern[bytes],
+    names: Container[bytes],
+) -> Dict[bytes, Tuple[int, int]]:
+    # Matching a pattern with groups for the whole string in Python is several times
+    # slower than splitting the file with a pattern of its start, which runs in C.
+    # The pieces are the text between the starts, the starts and the names, so the
+    # offset of every start is the sum of the lengths of the pieces before it, not
+    # counting the names, which are inside the starts. The end of the value is only
+    # looked for if the name is one of the wanted ones
+    pieces = head_pattern.split(b"\n" + data)
+    lengths = list(map(len, pieces))
+    lengths[2::3] = repeat(0, len(lengths) // 3)
+    # The offsets are shifted by the line break added before the data
+    offsets = list(accumulate(lengths, initial=-1))
+
+    value_spans = {}
+
+    for i in range(2, len(pieces), 3):
+        if pieces[i] in names:
+            match = tail_pattern.match(data, offsets[i])
+            if match:
+                value_spans[pieces[i]] = match.span(1)
+
+    return value_spans
+
+
+def _get_insertion(
+    data: bytes,
+    suffix: str,
+    added_strings: List[Tuple[str, str]],
+    emitter: RowEmitter,
+) -> Tuple[int, int, bytes]:
+    # The strings are added after the last one: before the closing tag of a .xml file
+    # and at the end of a .strings file, on a line of their own
+    if suffix == ".xml":
+        position = data.rfind(b"</resources>")
+        if position == -1:
+            raise ValueError("The file provided is not a valid .xml file.")
+    else:
+        position = len(data)
+
+    line_start = data.rfind(b"\n", 0, position) + 1
+    buffer = io.BytesIO()
+
+    if data[line_start:position].strip():
+        buffer.write(b"\n")
+    else:
+        position = line_start
+
+    emitter.write(buffer, added_strings)
+
+    return position, position, buffer.getvalue()
+
+
+def _write_patched(
+    target_filepath: Path, data: bytes, replacements: List[Tuple[int, int, bytes]]
+):
+    target_filepath = Path(target_filepath)
+    view = memoryview(data)
+
+    # The temporary file keeps the compression suffix of the target, so it is
+    # compressed the same way
+    file_descriptor, temp_path = tempfile.mkstemp(
+        prefix=f".{target_filepath.name}.",
+        suffix=get_compression_suffix(target_filepath),
+        dir=target_filepath.parent,
+    )
+    os.close(file_descriptor)
+
+    try:
+        with open_file(temp_path, "wb") as file:
+            position = 0
+
+            # Everything but the replaced spans is copied as it is
+            for start, end, replacement in replacements:
+                file.write(view[position:start])
+                file.write(replacement)
+                position = end
+
+            file.write(view[position:])
+
+        shutil.copymode(target_filepath, temp_path)
+        os.replace(temp_path, target_filepath)
+    except BaseException:
+        os.remove(temp_path)
+        raise
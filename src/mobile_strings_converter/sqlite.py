@@ -0,0 +1,153 @@
+import os
+import shutil
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .compression import get_compression_suffix, is_stream_path, open_file
+
+# Table of the strings. Their order is the order of the rowids. The locale is NULL
+# for the strings converted from a single file
+SQLITE_SCHEMA = """
+CREATE TABLE strings (
+    locale TEXT,
+    name TEXT NOT NULL,
+    value
+);
+"""
+
+# Index created after the rows are inserted, since building it at once is faster
+# than updating it on every insert
+SQLITE_INDEX = "CREATE INDEX strings_name ON strings (name, locale);"
+
+
+def to_sqlite(
+    strings: Iterable[Tuple[Any, Any]],
+    output_filepath: Path,
+    locale: Optional[str] = None,
+):
+    """
+    Formats strings to a SQLite database with a `strings` table. See `SQLITE_SCHEMA`.
+    An existing file is replaced.
+
+    :param strings: Strings extracted with `get_strings`
+    :type strings: Iterable[Tuple[Any, Any]]
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    :param locale: Locale stored along with the strings
+    :type locale: Optional[str]
+    """
+
+    write_sqlite(((locale, name, value) for name, value in strings), output_filepath)
+
+
+def write_sqlite(rows: Iterable[Tuple[Optional[str], Any, Any]], output_filepath: Path):
+    """
+    Writes (locale, name, value) rows to a new SQLite database. The rows are inserted
+    with a single `executemany` in one transaction, and the file is not journaled
+    while it is being created, since a failed write leaves nothing worth recovering.
+
+    :param rows: Rows of the `strings` table
+    :type rows: Iterable[Tuple[Optional[str], Any, Any]]
+    :param output_filepath: The path where the generated file will be saved.
+    :type output_filepath: Path
+    """
+
+    with _local_path(output_filepath, "w") as database_path:
+        if os.path.exists(database_path):
+            os.remove(database_path)
+
+        with closing(sqlite3.connect(database_path)) as connection:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+
+            with connection:
+                connection.execute(SQLITE_SCHEMA)
+                connection.executemany(
+                    "INSERT INTO strings (locale, name, value) VALUES (?, ?, ?)", rows
+                )
+                connection.execute(SQLITE_INDEX)
+
+
+def iter_strings_from_sqlite(
+    sqlite_filepath: Path, locale: Optional[str] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the strings of a SQLite database written by `to_sqlite` one at a time, as
+    the cursor steps through the table, so the rows are never loaded at once.
+
+    :param sqlite_filepath: The path to the input database.
+    :type sqlite_filepath: Path
+    :param locale: Locale of the strings. Defaults to the locale of the first row,
+        which is NULL for the strings converted from a single file
+    :type locale: Optional[str]
+    :return: Iterator of tuples where each tuple contains a NAME and VALUE.
+    :rtype: Iterator[Tuple[str, Any]]
+    """
+
+    with _local_path(sqlite_filepath, "r") as database_path, closing(
+        sqlite3.connect(f"{Path(database_path).resolve().as_uri()}?mode=ro", uri=True)
+    ) as connection:
+        try:
+            if locale is None:
+                first_row = connection.execute(
+                    "SELECT locale FROM strings ORDER BY rowid LIMIT 1"
+                ).fetchone()
+                locale = first_row[0] if first_row else None
+
+            cursor = connection.execute(
+                "SELECT name, value FROM strings WHERE locale IS ? ORDER BY rowid",
+                (locale,),
+            )
+        except sqlite3.DatabaseError:
+            raise ValueError(
+                "The file provided is not a valid SQLite database of strings."
+            ) from None
+
+        yield from cursor
+
+
+def get_strings_from_sqlite(
+    sqlite_filepath: Path, locale: Optional[str] = None
+) -> List[Tuple[str, Any]]:
+    """
+    Extract the strings of a SQLite database and return them as a list of tuples.
+    See `iter_strings_from_sqlite`.
+
+    :param sqlite_filepath: The path to the input database.
+    :type sqlite_filepath: Path
+    :param locale: Locale of the strings. Defaults to the locale of the first row
+    :type locale: Optional[str]
+    :return: A list of tuples where each tuple contains a NAME and VALUE.
+    :rtype: List[Tuple[str, Any]]
+    """
+
+    return list(iter_strings_from_sqlite(sqlite_filepath, locale))
+
+
+@contextmanager
+def _local_path(filepath: Union[str, Path], mode: str) -> Iterator[Path]:
+    # SQLite only opens uncompressed files on disk, so compressed databases and
+    # streams are copied to, or from, a temporary file
+    if not get_compression_suffix(filepath) and not is_stream_path(filepath):
+        yield Path(filepath)
+        return
+
+    with TemporaryDirectory() as temp_dir:
+        database_path = Path(temp_dir) / "strings.db"
+
+        if mode == "r":
+            with open_file(filepath, "rb") as source, open(
+                database_path, "wb"
+            ) as target:
+                shutil.copyfileobj(source, target)
+
+        yield database_path
+
+        if mode == "w":
+            with open(database_path, "rb") as source, open_file(
+                filepath, "wb"
+            ) as target:
+                shutil.copyfileobj(source, target)
@@ -0,0 +1,213 @@
+import fnmatch
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+# Size of the blocks read when hashing files, so big files are never fully loaded
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_file_hash(filepath: Path) -> str:
+    """
+    Computes the SHA-256 hash of the content of a file.
+
+    :param filepath: Path of the file to hash
+    :type filepath: Path
+    :return: Hexadecimal digest of the file content
+    :rtype: str
+    """
+
+    file_hash = hashlib.sha256()
+
+    with open(filepath, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+# Directories that never contain strings files worth converting: VCS metadata, build
+# outputs and dependency folders
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".gradle",
+        ".hg",
+        ".idea",
+        ".svn",
+        ".venv",
+        "__pycache__",
+        "build",
+        "DerivedData",
+        "node_modules",
+        "Pods",
+        "venv",
+    }
+)
+
+
+class PathFilter:
+    """
+    Decides which files and directories are discovered under an input directory.
+
+    Glob patterns are matched against both the path relative to the input directory
+    (using `/` as separator) and the file or directory name, so `*.xml` matches every
+    .xml file and `values-*/strings.xml` only the ones in `values-*` directories at the
+    top level.
+    """
+
+    def __init__(
+        self,
+        extensions: Iterable[str],
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+    ):
+        """
+        :param extensions: Extensions of the files to discover
+        :type extensions: Iterable[str]
+        :param include: Glob patterns that the files must match. If not provided,
+            every file with a matching extension is included
+        :type include: Optional[Iterable[str]]
+        :param exclude: Glob patterns of the files and directories to skip
+        :type exclude: Optional[Iterable[str]]
+        :param excluded_dirs: Names of the directories that are never visited
+        :type excluded_dirs: Iterable[str]
+        """
+
+        self.extensions = tuple(extensions)
+        self.excluded_dirs = frozenset(excluded_dirs)
+        self._include = _compile_globs(include)
+        self._exclude = _compile_globs(exclude)
+
+    def is_dir_included(self, relative_path: str, name: str) -> bool:
+        """
+        :param relative_path: Path of the directory relative to the input directory
+        :type relative_path: str
+        :param name: Name of the directory
+        :type name: str
+        :return: True if the directory must be visited
+        :rtype: bool
+        """
+
+        if name in self.excluded_dirs:
+            return False
+
+        return not (
+            self._exclude
+            and (self._exclude.match(relative_path) or self._exclude.match(name))
+        )
+
+    def is_file_included(self, relative_path: str, name: str) -> bool:
+        """
+        :param relative_path: Path of the file relative to the input directory
+        :type relative_path: str
+        :param name: Name of the file
+        :type name: str
+        :return: True if the file must be discovered. Its directories are not checked
+        :rtype: bool
+        """
+
+        if not name.endswith(self.extensions):
+            return False
+
+        if self._include and not (
+            self._include.match(relative_path) or self._include.match(name)
+        ):
+            return False
+
+        return not (
+            self._exclude
+            and (self._exclude.match(relative_path) or self._exclude.match(name))
+        )
+
+    def is_included(self, relative_path: str) -> bool:
+        """
+        Checks the file and every directory between the input directory and the file.
+
+        :param relative_path: Path of the file relative to the input directory, using
+            `/` as separator
+        :type relative_path: str
+        :return: True if the file would be discovered by `get_filepaths_from_dir`
+        :rtype: bool
+        """
+
+        parts = relative_path.split("/")
+
+        for i, name in enumerate(parts[:-1], start=1):
+            if not self.is_dir_included("/".join(parts[:i]), name):
+                return False
+
+        return self.is_file_included(relative_path, parts[-1])
+
+
+def get_filepaths_from_dir(
+    directory: Union[str, Path],
+    extensions: Iterable[str],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+) -> Iterator[Path]:
+    """
+    Yields the filepaths in the directory and its subdirectories matching the given
+    extensions and glob patterns. The paths are yielded as soon as they are found, so
+    the files can be processed before the whole tree has been walked. The directories
+    in `excluded_dirs` and the ones matching `exclude` are not visited at all.
+
+    :param directory: Directory to search
+    :type directory: Union[str, Path]
+    :param extensions: Extensions of the files to discover
+    :type extensions: Iterable[str]
+    :param include: Glob patterns that the files must match. See `PathFilter`
+    :type include: Optional[Iterable[str]]
+    :param exclude: Glob patterns of the files and directories to skip. See
+        `PathFilter`
+    :type exclude: Optional[Iterable[str]]
+    :param excluded_dirs: Names of the directories that are never visited
+    :type excluded_dirs: Iterable[str]
+    :return: Iterator of the matching filepaths
+    :rtype: Iterator[Path]
+    """
+
+    path_filter = PathFilter(extensions, include, exclude, excluded_dirs)
+
+    # (absolute path, path relative to `directory`) of the directories left to visit
+    pending_dirs = [(os.fspath(directory), "")]
+
+    while pending_dirs:
+        current_dir, relative_dir = pending_dirs.pop()
+        subdirs = []
+
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    relative_path = f"{relative_dir}{entry.name}"
+
+                    try:
+                        # Symlinked directories are not followed, like `os.walk`
+                        if entry.is_dir(follow_symlinks=False):
+                            if path_filter.is_dir_included(relative_path, entry.name):
+                                subdirs.append((entry.path, f"{relative_path}/"))
+                        elif (
+                            path_filter.is_file_included(relative_path, entry.name)
+                            and entry.is_file()
+                        ):
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable directories are skipped, like `os.walk`
+            continue
+
+        # Visit the subdirectories in the order they were listed
+        pending_dirs.extend(reversed(subdirs))
+
+
+def _compile_globs(patterns: Optional[Iterable[str]]) -> Optional[re.Pattern]:
+    if not patterns:
+        return None
+
+    # A single regular expression is much faster than matching each pattern
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
@@ -0,0 +1,161 @@
+import re
+from typing import Dict, List, Tuple
+
+from .catalog import DEFAULT_LOCALE, Catalog
+from .console_style import ConsoleStyle
+
+# printf-style specifiers of Android and iOS, e.g. `%s`, `%@`, `%1$d` or `%.2f`, and
+# named or numbered placeholders, e.g. `{name}` or `{0}`. `%%` is matched so that it
+# is skipped, and the space flag is left out so that `50 % de` is not read as `% d`
+PLACEHOLDER_PATTERN = re.compile(
+    r"%%"
+    r"|%(?:(\d+)\$)?[-+0#']*(?:\d+|\*)?(?:\.(?:\d+|\*))?"
+    r"((?:hh|h|ll|l|q|z|t|j|L)?[@dDiuUxXoOfFeEgGcCsSpaA])"
+    r"|\{(\w+)(?:[,:][^{}]*)?\}"
+)
+
+# A placeholder violation: key, expected placeholders and found placeholders
+Violation = Tuple[str, List[str], List[str]]
+
+
+def get_placeholders(value: str) -> List[str]:
+    """
+    Extracts the placeholders of a value in a normalized form, so that two values can
+    be compared regardless of the order of their placeholders:
+    - The flags, width and precision of printf-style specifiers are dropped, since
+      they don't change the type of the argument.
+    - The specifiers without an explicit position are numbered in order, so `%s %d`
+      and `%1$s %2$d` are the same, but not `%d %s`.
+
+    :param value: Value of a string
+    :type value: str
+    :return: The sorted placeholders, e.g. `['%1$s', '%2$d', '{name}']`
+    :rtype: List[str]
+    """
+
+    # Most values have no placeholders, and `in` is much cheaper than the scanner
+    if "%" not in value and "{" not in value:
+        return []
+
+    return _normalize_placeholders(PLACEHOLDER_PATTERN.findall(value))
+
+
+def validate_placeholders(
+    catalog: Catalog, reference_locale: str = DEFAULT_LOCALE
+) -> Dict[str, List[Violation]]:
+    """
+    Compares the placeholders of every value of the catalog with the ones of the same
+    key in the reference locale. A translation with different placeholders makes the
+    app crash or show the wrong argument when the string is formatted.
+
+    The placeholders of each reference value are extracted once and compared with
+    the ones of each translation as sorted lists, so the validation takes linear time
+    in the number of values. Missing translations and keys that are not in the
+    reference locale are skipped.
+
+    :param catalog: Catalog to validate
+    :type catalog: Catalog
+    :param reference_locale: Locale with the placeholders that every translation must
+        use, usually the default one
+    :type reference_locale: str
+    :return: The violations of each locale, in the order of the catalog. Locales
+        without violations are left out
+    :rtype: Dict[str, List[Violation]]
+    """
+
+    if reference_locale not in catalog.columns:
+        raise ValueError(
+            f"{ConsoleStyle.RED}The catalog has no {reference_locale} locale."
+            f"{ConsoleStyle.END}"
+        )
+
+    # The raw matches of each reference value, along with their normalized form
+    references = [
+        _get_reference(value) if value is not None else None
+        for value in catalog.columns[reference_locale]
+    ]
+    violations = {}
+
+    for locale, column in catalog.columns.items():
+        if locale == reference_locale:
+            continue
+
+        locale_violations = []
+
+        for key, reference, value in zip(catalog.keys, references, column):
+            if value is None or reference is None:
+                continue
+
+            expected_matches, expected = reference
+
+            # Same check as in `get_placeholders`, without the cost of the call
+            if "%" not in value and "{" not in value:
+                if expected:
+                    locale_violations.append((key, expected, []))
+                continue
+
+            matches = PLACEHOLDER_PATTERN.findall(value)
+
+            # The placeholders are usually copied as they are, so they only have to
+            # be normalized when they are written differently
+            if matches == expected_matches:
+                continue
+
+            found = _normalize_placeholders(matches)
+
+            if found != expected:
+                locale_violations.append((key, expected, found))
+
+        if locale_violations:
+            violations[locale] = locale_violations
+
+    return violations
+
+
+def violations_to_strings(
+    violations: Dict[str, List[Violation]]
+) -> List[Tuple[str, str]]:
+    """
+    Formats the result of `validate_placeholders` as strings, so it can be written
+    with `write_strings` to any supported file type, e.g.
+    `[es] expected %1$s, %2$d but found %1$d`.
+
+    :param violations: Violations of each locale
+    :type violations: Dict[str, List[Violation]]
+    :return: A row per violation
+    :rtype: List[Tuple[str, str]]
+    """
+
+    return [
+        (
+            key,
+            f"[{locale}] expected {', '.join(expected) or 'no placeholders'} but "
+            f"found {', '.join(found) or 'none'}",
+        )
+        for locale, locale_violations in violations.items()
+        for key, expected, found in locale_violations
+    ]
+
+
+def _get_reference(value: str) -> Tuple[list, List[str]]:
+    matches = PLACEHOLDER_PATTERN.findall(value)
+    return matches, _normalize_placeholders(matches)
+
+
+def _normalize_placeholders(matches: List[Tuple[str, str, str]]) -> List[str]:
+    placeholders = []
+    implicit_position = 0
+
+    for position, conversion, name in matches:
+        if name:
+            placeholders.append(f"{{{name}}}")
+        elif conversion:
+            if not position:
+                implicit_position += 1
+                position = str(implicit_position)
+
+            placeholders.append(f"%{position}${conversion}")
+
+    placeholders.sort()
+
+    return placeholders
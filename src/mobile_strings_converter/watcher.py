@@ -0,0 +1,389 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from threading import Event
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .utils import DEFAULT_EXCLUDED_DIRS, get_filepaths_from_dir
+
+# Default time without new changes before the changed files are reported, in seconds
+DEFAULT_DEBOUNCE = 0.3
+
+# Default interval between two scans of the polling watcher, in seconds
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+INOTIFY_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+# wd, mask, cookie, len
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """
+    Detects changes by comparing the size and modification time of the watched files
+    between two scans. Works on every platform.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        extensions: Iterable[str],
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        :param paths: Files and directories to watch. Directories are watched
+            recursively
+        :type paths: Iterable[Path]
+        :param extensions: Extensions of the files to watch
+        :type extensions: Iterable[str]
+        :param excluded_dirs: Names of the directories that are not watched
+        :type excluded_dirs: Iterable[str]
+        :param interval: Interval between two scans, in seconds
+        :type interval: float
+        """
+
+        self.paths = [Path(path) for path in paths]
+        self.extensions = tuple(extensions)
+        self.excluded_dirs = frozenset(excluded_dirs)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def read_changes(self, timeout: Optional[float]) -> Set[Path]:
+        """
+        Waits up to `timeout` seconds and returns the files created or modified since
+        the previous call.
+
+        :param timeout: Maximum time to wait for changes, in seconds. None waits
+            until there is a change
+        :type timeout: Optional[float]
+        :return: Paths of the changed files
+        :rtype: Set[Path]
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            snapshot = self._take_snapshot()
+            changes = {
+                Path(path)
+                for path, stat in snapshot.items()
+                if self._snapshot.get(path) != stat
+            }
+            self._snapshot = snapshot
+
+            if changes:
+                return changes
+
+            if deadline is None:
+                time.sleep(self.interval)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        """Releases the resources of the watcher."""
+
+    # Private methods
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+
+        for filepath in _get_watched_filepaths(
+            self.paths, self.extensions, self.excluded_dirs
+        ):
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                # Deleted between the directory listing and the `stat` call
+                continue
+
+            snapshot[filepath] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+
+class InotifyWatcher:
+    """
+    Detects changes with the Linux inotify API, so the kernel notifies the writes
+    instead of rescanning the watched directories.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        extensions: Iterable[str],
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+    ):
+        """
+        :param paths: Files and directories to watch. Directories are watched
+            recursively
+        :type paths: Iterable[Path]
+        :param extensions: Extensions of the files to watch
+        :type extensions: Iterable[str]
+        :param excluded_dirs: Names of the directories that are not watched
+        :type excluded_dirs: Iterable[str]
+        :raises OSError: If inotify is not available
+        """
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self.extensions = tuple(extensions)
+        self.excluded_dirs = frozenset(excluded_dirs)
+        self._directories: Dict[int, str] = {}
+        # Files watched through their parent directory, since editors usually replace
+        # files instead of writing them in place
+        self._files: Set[str] = set()
+        self._recursive_dirs: Set[str] = set()
+
+        for path in paths:
+            path = os.path.abspath(path)
+
+            if os.path.isdir(path):
+                self._recursive_dirs.add(path)
+                self._add_directory(path, recursive=True)
+            else:
+                self._files.add(path)
+                self._add_watch(os.path.dirname(path))
+
+    def read_changes(self, timeout: Optional[float]) -> Set[Path]:
+        """
+        Waits up to `timeout` seconds and returns the files created or modified since
+        the previous call.
+
+        :param timeout: Maximum time to wait for changes, in seconds. None waits
+            until there is a change
+        :type timeout: Optional[float]
+        :return: Paths of the changed files
+        :rtype: Set[Path]
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+
+            # Events that don't change any watched file are skipped, so keep waiting
+            if changes := self._read_events():
+                return changes
+
+    def close(self):
+        """Releases the inotify file descriptor."""
+
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    # Private methods
+
+    def _read_events(self) -> Set[Path]:
+        changes = set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changes
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                # Some events were dropped, so every watched file may have changed
+                changes.update(
+                    Path(filepath)
+                    for filepath in _get_watched_filepaths(
+                        [*self._recursive_dirs, *self._files],
+                        self.extensions,
+                        self.excluded_dirs,
+                    )
+                )
+                continue
+
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+
+            if mask & IN_IGNORED:
+                del self._directories[wd]
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name))
+
+            if mask & IN_ISDIR:
+                if (
+                    mask & (IN_CREATE | IN_MOVED_TO)
+                    and self._is_recursive(path)
+                    and os.path.basename(path) not in self.excluded_dirs
+                ):
+                    # Files may have been written before the watch was added
+                    self._add_directory(path, recursive=True)
+                    changes.update(
+                        Path(filepath)
+                        for filepath in _get_watched_filepaths(
+                            [path], self.extensions, self.excluded_dirs
+                        )
+                    )
+            elif mask & (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO):
+                if self._is_watched_file(path) and os.path.isfile(path):
+                    changes.add(Path(path))
+
+        return changes
+
+    def _add_directory(self, directory: str, recursive: bool):
+        self._add_watch(directory)
+
+        if recursive:
+            for root, dirnames, _ in os.walk(directory):
+                # Prune the excluded directories in place so they are not walked
+                dirnames[:] = [d for d in dirnames if d not in self.excluded_dirs]
+                for dirname in dirnames:
+                    self._add_watch(os.path.join(root, dirname))
+
+    def _add_watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), INOTIFY_MASK
+        )
+
+        if wd >= 0:
+            self._directories[wd] = directory
+
+    def _is_recursive(self, path: str) -> bool:
+        return any(
+            path == directory or path.startswith(directory + os.sep)
+            for directory in self._recursive_dirs
+        )
+
+    def _is_watched_file(self, path: str) -> bool:
+        if path in self._files:
+            return True
+
+        return path.endswith(self.extensions) and self._is_recursive(path)
+
+
+def create_watcher(
+    paths: Iterable[Path],
+    extensions: Iterable[str],
+    excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+):
+    """
+    Creates an inotify watcher if the platform supports it, or a polling watcher
+    otherwise.
+
+    :param paths: Files and directories to watch. Directories are watched recursively
+    :type paths: Iterable[Path]
+    :param extensions: Extensions of the files to watch
+    :type extensions: Iterable[str]
+    :param excluded_dirs: Names of the directories that are not watched
+    :type excluded_dirs: Iterable[str]
+    :return: The watcher
+    :rtype: InotifyWatcher | PollingWatcher
+    """
+
+    paths = list(paths)
+    extensions = list(extensions)
+
+    try:
+        return InotifyWatcher(paths, extensions, excluded_dirs)
+    except (OSError, AttributeError, TypeError):
+        # AttributeError/TypeError: the C library does not expose inotify
+        return PollingWatcher(paths, extensions, excluded_dirs)
+
+
+def watch(
+    watcher,
+    on_change: Callable[[List[Path]], None],
+    debounce: float = DEFAULT_DEBOUNCE,
+    stop_event: Optional[Event] = None,
+):
+    """
+    Calls `on_change` with the files changed since the previous call until
+    `stop_event` is set. Bursts of writes are debounced, so the callback is not
+    called until no change has been detected for `debounce` seconds.
+
+    :param watcher: Watcher created with `create_watcher`
+    :type watcher: InotifyWatcher | PollingWatcher
+    :param on_change: Function called with the sorted paths of the changed files
+    :type on_change: Callable[[List[Path]], None]
+    :param debounce: Time without new changes before calling `on_change`, in seconds
+    :type debounce: float
+    :param stop_event: Event that stops watching when set. If not provided, it
+        watches until the process is interrupted
+    :type stop_event: Optional[Event]
+    """
+
+    # Check the stop event periodically even if there are no changes
+    timeout = 0.5 if stop_event is not None else None
+
+    while stop_event is None or not stop_event.is_set():
+        changes = watcher.read_changes(timeout)
+        if not changes:
+            continue
+
+        # Wait until the writes settle
+        while more_changes := watcher.read_changes(debounce):
+            changes.update(more_changes)
+
+        on_change(sorted(changes))
+
+
+def _get_watched_filepaths(
+    paths: Iterable[Path], extensions: Tuple[str, ...], excluded_dirs: Iterable[str]
+) -> Iterable[str]:
+    for path in paths:
+        path = os.path.abspath(path)
+
+        if os.path.isdir(path):
+            for filepath in get_filepaths_from_dir(
+                path, extensions, excluded_dirs=excluded_dirs
+            ):
+                yield str(filepath)
+        elif os.path.isfile(path):
+            yield path
@@ -0,0 +1,427 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import gspread
+from requests import Session
+
+from mobile_strings_converter.google_sheets import SheetsHTTPClient
+
+GOOGLE_API_URLS = ("https://sheets.googleapis.com", "https://www.googleapis.com")
+
+
+class FakeGoogleAPI:
+    """
+    Local stand-in for the subset of the Google Sheets and Drive APIs used by the
+    package. It keeps the spreadsheets in memory and records every request it receives,
+    so the tests can check both the resulting cells and the number of requests sent.
+    """
+
+    def __init__(self, latency=0.0):
+        """
+        :param latency: Time each request takes, in seconds, to simulate a network
+        """
+
+        self.spreadsheets = {}
+        self.requests = []
+        self.latency = latency
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._failures = []
+        self._revision = 0
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(self))
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        host, port = self._server.server_address
+        self.url = f"http://{host}:{port}"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def create_client(self, **kwargs) -> gspread.Client:
+        """Returns a gspread client that sends its requests to this server."""
+
+        url = self.url
+
+        class FakeSheetsHTTPClient(SheetsHTTPClient):
+            def __init__(self, auth, session=None):
+                super().__init__(auth, session, **{"backoff": 0, **kwargs})
+
+            def request(self, method, endpoint, *args, **request_kwargs):
+                for google_api_url in GOOGLE_API_URLS:
+                    endpoint = endpoint.replace(google_api_url, url)
+
+                return super().request(method, endpoint, *args, **request_kwargs)
+
+        return gspread.Client(None, session=Session(), http_client=FakeSheetsHTTPClient)
+
+    def add_spreadsheet(self, name, values=None, sheet_titles=("Sheet1",)):
+        """Adds a spreadsheet whose first worksheet contains `values`."""
+
+        with self._lock:
+            spreadsheet_id = f"spreadsheet{len(self.spreadsheets)}"
+            self.spreadsheets[spreadsheet_id] = {
+                "name": name,
+                "modifiedTime": self._next_modified_time(),
+                "sheets": [
+                    {"sheetId": i, "title": title, "values": []}
+                    for i, title in enumerate(sheet_titles)
+                ],
+            }
+            self.spreadsheets[spreadsheet_id]["sheets"][0]["values"] = [
+                list(row) for row in values or []
+            ]
+
+        return spreadsheet_id
+
+    def get_values(self, name, sheet_index=0, sheet_title=None):
+        """Returns the cells of a worksheet without the trailing empty cells."""
+
+        with self._lock:
+            sheets = self._find_spreadsheet(name)["sheets"]
+
+            if sheet_title is not None:
+                sheet = next(sheet for sheet in sheets if sheet["title"] == sheet_title)
+            else:
+                sheet = sheets[sheet_index]
+
+            return _trim(sheet["values"])
+
+    def fail_next_requests(self, count, status=429):
+        """Makes the next `count` requests fail with the given status code."""
+
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def count_requests(self, method=None, path_pattern=None):
+        with self._lock:
+            return sum(
+                1
+                for request_method, path in self.requests
+                if (method is None or request_method == method)
+                and (path_pattern is None or re.search(path_pattern, path))
+            )
+
+    # Request handling
+
+    def handle(self, method, path, query, body):
+        with self._lock:
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests, self._concurrent_requests
+            )
+
+        try:
+            time.sleep(self.latency)
+            return self._handle(method, path, query, body)
+        finally:
+            with self._lock:
+                self._concurrent_requests -= 1
+
+    def _handle(self, method, path, query, body):
+        with self._lock:
+            self.requests.append((method, path))
+
+            if self._failures:
+                status = self._failures.pop(0)
+                return status, {"error": {"code": status, "message": "Quota exceeded"}}
+
+            match = re.fullmatch(r"/drive/v3/files", path)
+            if match and method == "GET":
+                return 200, self._list_files(query)
+
+            match = re.fullmatch(r"/v4/spreadsheets/([^/:]+)", path)
+            if match and method == "GET":
+                return 200, self._get_metadata(match.group(1))
+
+            match = re.fullmatch(r"/v4/spreadsheets/([^/:]+):batchUpdate", path)
+            if match and method == "POST":
+                return 200, self._batch_update(match.group(1), body)
+
+            match = re.fullmatch(r"/v4/spreadsheets/([^/:]+)/values/(.+?)(:\w+)?", path)
+            if match:
+                spreadsheet_id, range_name, action = match.groups()
+                range_name = unquote(range_name)
+
+                if method == "GET" and action is None:
+                    return 200, self._get_values(spreadsheet_id, range_name)
+                if method == "PUT" and action is None:
+                    return 200, self._update_values(spreadsheet_id, range_name, body)
+                if method == "POST" and action == ":clear":
+                    return 200, self._clear_values(spreadsheet_id, range_name)
+
+            return 404, {"error": {"code": 404, "message": f"Not found: {path}"}}
+
+    def _list_files(self, query):
+        name = re.search(r'name = "(.*?)"', query.get("q", [""])[0])
+
+        return {
+            "files": [
+                {
+                    "id": spreadsheet_id,
+                    "name": spreadsheet["name"],
+                    "createdTime": "2024-01-01T00:00:00.000Z",
+                    "modifiedTime": spreadsheet["modifiedTime"],
+                }
+                for spreadsheet_id, spreadsheet in self.spreadsheets.items()
+                if name is None or spreadsheet["name"] == name.group(1)
+            ]
+        }
+
+    def _get_metadata(self, spreadsheet_id):
+        spreadsheet = self.spreadsheets[spreadsheet_id]
+
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "properties": {"title": spreadsheet["name"]},
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": sheet["sheetId"],
+                        "title": sheet["title"],
+                        "index": i,
+                        "sheetType": "GRID",
+                        "gridProperties": {
+                            "rowCount": max(1000, len(sheet["values"])),
+                            "columnCount": 26,
+                        },
+                    }
+                }
+                for i, sheet in enumerate(spreadsheet["sheets"])
+            ],
+        }
+
+    def _get_values(self, spreadsheet_id, range_name):
+        sheet, (first_row, first_col, last_row, last_col) = self._get_range(
+            spreadsheet_id, range_name
+        )
+
+        values = [
+            row[first_col : None if last_col is None else last_col + 1]
+            for row in sheet["values"][
+                first_row : None if last_row is None else last_row + 1
+            ]
+        ]
+
+        response = {"range": range_name, "majorDimension": "ROWS"}
+        if values := _trim(values):
+            response["values"] = values
+
+        return response
+
+    def _update_values(self, spreadsheet_id, range_name, body):
+        sheet, (first_row, first_col, _, _) = self._get_range(
+            spreadsheet_id, range_name
+        )
+
+        for i, row in enumerate(body["values"]):
+            for j, value in enumerate(row):
+                _set_cell(sheet["values"], first_row + i, first_col + j, value)
+
+        self._touch(spreadsheet_id)
+
+        return {"spreadsheetId": spreadsheet_id, "updatedRows": len(body["values"])}
+
+    def _clear_values(self, spreadsheet_id, range_name):
+        sheet, (first_row, first_col, last_row, last_col) = self._get_range(
+            spreadsheet_id, range_name
+        )
+
+        for i, row in enumerate(sheet["values"]):
+            if i < first_row or (last_row is not None and i > last_row):
+                continue
+
+            for j in range(first_col, len(row)):
+                if last_col is None or j <= last_col:
+                    row[j] = ""
+
+        self._touch(spreadsheet_id)
+
+        return {"spreadsheetId": spreadsheet_id, "clearedRange": range_name}
+
+    def _batch_update(self, spreadsheet_id, body):
+        spreadsheet = self.spreadsheets[spreadsheet_id]
+        sheets = {sheet["sheetId"]: sheet for sheet in spreadsheet["sheets"]}
+        replies = []
+
+        for request in body["requests"]:
+            ((kind, params),) = request.items()
+
+            if kind == "addSheet":
+                properties = {
+                    **params["properties"],
+                    "sheetId": max(sheets) + 1,
+                    "index": len(sheets),
+                }
+                sheet = {
+                    "sheetId": properties["sheetId"],
+                    "title": properties["title"],
+                    "values": [],
+                }
+                spreadsheet["sheets"].append(sheet)
+                sheets[sheet["sheetId"]] = sheet
+                replies.append({"addSheet": {"properties": properties}})
+                continue
+            elif kind == "updateCells":
+                start = params["start"]
+                values = sheets[start["sheetId"]]["values"]
+
+                for i, row in enumerate(params["rows"]):
+                    for j, cell in enumerate(row["values"]):
+                        _set_cell(
+                            values,
+                            start["rowIndex"] + i,
+                            start["columnIndex"] + j,
+                            _get_cell_value(cell),
+                        )
+            elif kind == "appendCells":
+                values = sheets[params["sheetId"]]["values"]
+                # Rows are appended after the last row with data
+                values[:] = _trim(values)
+                values.extend(
+                    [_get_cell_value(cell) for cell in row["values"]]
+                    for row in params["rows"]
+                )
+            elif kind == "deleteDimension":
+                dimension_range = params["range"]
+                assert dimension_range["dimension"] == "ROWS"
+                values = sheets[dimension_range["sheetId"]]["values"]
+                del values[dimension_range["startIndex"] : dimension_range["endIndex"]]
+            else:
+                raise ValueError(f"Unsupported request: {kind}")
+
+            replies.append({})
+
+        self._touch(spreadsheet_id)
+
+        return {"spreadsheetId": spreadsheet_id, "replies": replies}
+
+    # Helpers
+
+    def _find_spreadsheet(self, name):
+        for spreadsheet in self.spreadsheets.values():
+            if spreadsheet["name"] == name:
+                return spreadsheet
+
+        raise KeyError(name)
+
+    def _get_range(self, spreadsheet_id, range_name):
+        spreadsheet = self.spreadsheets[spreadsheet_id]
+        sheet_title, _, cells = range_name.rpartition("!")
+
+        sheets = spreadsheet["sheets"]
+
+        if not sheet_title:
+            if any(sheet["title"] == cells.strip("'") for sheet in sheets):
+                # A range without cells, e.g. 'Sheet1', refers to the whole sheet
+                sheet_title, cells = cells, ""
+            else:
+                # A range without a sheet name, e.g. A:B, refers to the first sheet
+                sheet_title = sheets[0]["title"]
+
+        sheet_title = sheet_title.strip("'").replace("''", "'")
+        sheet = next(s for s in sheets if s["title"] == sheet_title)
+
+        return sheet, _parse_a1_range(cells)
+
+    def _touch(self, spreadsheet_id):
+        self.spreadsheets[spreadsheet_id]["modifiedTime"] = self._next_modified_time()
+
+    def _next_modified_time(self):
+        self._revision += 1
+        return f"2024-01-01T00:00:{self._revision:02d}.000Z"
+
+
+def _create_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+        def log_message(self, *args):
+            pass
+
+        def _handle(self, method):
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+
+            status, response = api.handle(method, url.path, parse_qs(url.query), body)
+            data = json.dumps(response).encode("utf-8")
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def _parse_a1_range(cells):
+    """Returns the zero-based first row, first column, last row and last column."""
+
+    if not cells:
+        return 0, 0, None, None
+
+    start, _, end = cells.partition(":")
+    first_row, first_col = _parse_a1_cell(start)
+
+    if not end:
+        return first_row or 0, first_col or 0, first_row, first_col
+
+    last_row, last_col = _parse_a1_cell(end)
+
+    return first_row or 0, first_col or 0, last_row, last_col
+
+
+def _parse_a1_cell(cell):
+    letters, digits = re.fullmatch(r"([A-Z]*)(\d*)", cell).groups()
+
+    column = None
+    if letters:
+        column = 0
+        for letter in letters:
+            column = column * 26 + ord(letter) - ord("A") + 1
+        column -= 1
+
+    return (int(digits) - 1 if digits else None), column
+
+
+def _set_cell(values, row, column, value):
+    while len(values) <= row:
+        values.append([])
+
+    values[row].extend([""] * (column + 1 - len(values[row])))
+    values[row][column] = value
+
+
+def _get_cell_value(cell):
+    return next(iter(cell.get("userEnteredValue", {"stringValue": ""}).values()))
+
+
+def _trim(values):
+    # The API omits the trailing empty cells and rows
+    rows = [list(row) for row in values]
+
+    for row in rows:
+        while row and row[-1] in ("", None):
+            row.pop()
+
+    while rows and not rows[-1]:
+        rows.pop()
+
+    return rows
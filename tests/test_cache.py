@@ -0,0 +1,84 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from mobile_strings_converter.cache import StringsCache
+from mobile_strings_converter.converter import get_strings
+
+
+class TestStringsCache(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+        self.xlsx_filepath = self.files_path / "template-without-comments/strings.xlsx"
+        self.xml_filepath = self.files_path / "input/strings.xml"
+
+        self.temp_dir = TemporaryDirectory()
+        self.cache = StringsCache(Path(self.temp_dir.name) / "cache")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cached_strings_are_equal_to_parsed_strings(self):
+        expected_output = get_strings(self.xlsx_filepath, with_comments=False)
+
+        self.assertEqual(
+            expected_output, get_strings(self.xlsx_filepath, False, self.cache)
+        )
+        self.assertEqual(
+            expected_output, get_strings(self.xlsx_filepath, False, self.cache)
+        )
+
+    def test_second_read_does_not_parse_the_file(self):
+        get_strings(self.xlsx_filepath, False, self.cache)
+
+        with patch(
+            "mobile_strings_converter.converter.get_strings_from_xlsx"
+        ) as get_strings_from_xlsx:
+            get_strings(self.xlsx_filepath, False, self.cache)
+
+        get_strings_from_xlsx.assert_not_called()
+
+    def test_reader_options_are_part_of_the_key(self):
+        with_comments = get_strings(self.xml_filepath, True, self.cache)
+        without_comments = get_strings(self.xml_filepath, False, self.cache)
+
+        self.assertGreater(len(with_comments), len(without_comments))
+
+    def test_modified_file_is_parsed_again(self):
+        csv_filepath = Path(self.temp_dir.name) / "strings.csv"
+        csv_filepath.write_text("name,value\na,A\n", encoding="utf-8")
+        get_strings(csv_filepath, False, self.cache)
+
+        csv_filepath.write_text("name,value\na,B\n", encoding="utf-8")
+
+        self.assertEqual([("a", "B")], get_strings(csv_filepath, False, self.cache))
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = self.cache.get_file_key(self.xlsx_filepath)
+        self.cache.set(key, [("a", "A")])
+        self.cache._get_entry_filepath(key).write_bytes(b"corrupt")
+
+        self.assertIsNone(self.cache.get(key))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.set("first", [("a", "A" * 100)])
+        self.cache.set("second", [("b", "B" * 100)])
+
+        # Make "first" the most recently used entry
+        first_filepath = self.cache._get_entry_filepath("first")
+        second_filepath = self.cache._get_entry_filepath("second")
+        os.utime(second_filepath, ns=(1, 1))
+        self.cache.get("first")
+
+        self.cache.max_size = first_filepath.stat().st_size * 2
+        self.cache.set("third", [("c", "C" * 100)])
+
+        self.assertIsNotNone(self.cache.get("first"))
+        self.assertIsNone(self.cache.get("second"))
+        self.assertIsNotNone(self.cache.get("third"))
+
+
+if __name__ == "__main__":
+    unittest.main()
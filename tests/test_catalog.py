@@ -0,0 +1,205 @@
+import csv
+import gzip
+import io
+import json
+import lzma
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import openpyxl
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.catalog import (
+    DEFAULT_LOCALE,
+    Catalog,
+    discover_locale_files,
+    get_locale_from_dir,
+    load_catalog,
+    write_catalog,
+)
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+        self._write_xml("res/values/strings.xml", [("hello", "Hello"), ("bye", "Bye")])
+        self._write_xml("res/values-es/strings.xml", [("hello", "Hola")])
+        self._write_xml("res/values-pt-rBR/strings.xml", [("bye", "Tchau")])
+        self._write_xml("res/values-night/strings.xml", [("hello", "Night")])
+        self._write_ios("ios/fr.lproj/Localizable.strings", [("hello", "Bonjour")])
+        self._write_ios("ios/es.lproj/Localizable.strings", [("ios_only", "Solo iOS")])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_locale_directories(self):
+        self.assertEqual(DEFAULT_LOCALE, get_locale_from_dir("values"))
+        self.assertEqual("es", get_locale_from_dir("values-es"))
+        self.assertEqual("pt-BR", get_locale_from_dir("values-pt-rBR"))
+        self.assertEqual("sr-Latn", get_locale_from_dir("values-b+sr+Latn"))
+        self.assertEqual("zh-Hans", get_locale_from_dir("zh-Hans.lproj"))
+        self.assertIsNone(get_locale_from_dir("values-night"))
+        self.assertIsNone(get_locale_from_dir("values-v21"))
+        self.assertIsNone(get_locale_from_dir("layout"))
+
+    def test_discover_locale_files(self):
+        locale_files = discover_locale_files(self.root)
+
+        self.assertEqual([DEFAULT_LOCALE, "es", "fr", "pt-BR"], list(locale_files))
+        self.assertEqual(2, len(locale_files["es"]))
+
+    def test_catalog_has_a_row_per_key_and_a_column_per_locale(self):
+        catalog = load_catalog(discover_locale_files(self.root), max_workers=1)
+
+        self.assertEqual(["hello", "bye", "ios_only"], catalog.keys)
+        self.assertEqual(
+            [
+                ("hello", ["Hello", "Hola", "Bonjour", None]),
+                ("bye", ["Bye", None, None, "Tchau"]),
+                ("ios_only", [None, "Solo iOS", None, None]),
+            ],
+            list(catalog.iter_rows()),
+        )
+        self.assertEqual("Tchau", catalog.get("bye", "pt-BR"))
+        self.assertIsNone(catalog.get("bye", "fr"))
+        self.assertEqual(
+            [("hello", "Hola"), ("ios_only", "Solo iOS")], catalog.get_strings("es")
+        )
+
+    def test_parallel_loading_gives_the_same_catalog(self):
+        locale_files = discover_locale_files(self.root)
+
+        self.assertEqual(
+            list(load_catalog(locale_files, max_workers=1).iter_rows()),
+            list(load_catalog(locale_files, max_workers=2).iter_rows()),
+        )
+
+    def test_write_csv(self):
+        output_filepath = self.root / "catalog.csv"
+        write_catalog(self._get_catalog(), output_filepath)
+
+        with open(output_filepath, encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+
+        self.assertEqual([["name", "en", "es"], ["a", "A", ""], ["b", "B", "Bé"]], rows)
+
+    def test_write_xlsx(self):
+        output_filepath = self.root / "catalog.xlsx"
+        write_catalog(self._get_catalog(), output_filepath)
+
+        sheet = openpyxl.load_workbook(output_filepath).active
+
+        self.assertEqual(
+            [("NAME", "en", "es"), ("a", "A", None), ("b", "B", "Bé")],
+            list(sheet.iter_rows(values_only=True)),
+        )
+
+    def test_write_json(self):
+        output_filepath = self.root / "catalog.json"
+        catalog = self._get_catalog()
+        write_catalog(catalog, output_filepath)
+
+        expected_output = [
+            {"name": "a", "en": "A", "es": None},
+            {"name": "b", "en": "B", "es": "Bé"},
+        ]
+        self.assertEqual(
+            json.dumps(expected_output, ensure_ascii=False, indent=2),
+            output_filepath.read_text(encoding="utf-8"),
+        )
+
+    def test_write_compressed_outputs(self):
+        catalog = self._get_catalog()
+        write_catalog(catalog, self.root / "catalog.csv.gz")
+        write_catalog(catalog, self.root / "catalog.json.xz")
+        write_catalog(catalog, self.root / "catalog.xlsx.gz")
+
+        rows = list(
+            csv.reader(
+                io.StringIO(
+                    gzip.decompress((self.root / "catalog.csv.gz").read_bytes())
+                    .decode("utf-8")
+                    .replace("\r\n", "\n")
+                )
+            )
+        )
+        self.assertEqual([["name", "en", "es"], ["a", "A", ""], ["b", "B", "Bé"]], rows)
+
+        self.assertEqual(
+            [
+                {"name": "a", "en": "A", "es": None},
+                {"name": "b", "en": "B", "es": "Bé"},
+            ],
+            json.loads(lzma.decompress((self.root / "catalog.json.xz").read_bytes())),
+        )
+
+        sheet = openpyxl.load_workbook(
+            io.BytesIO(gzip.decompress((self.root / "catalog.xlsx.gz").read_bytes()))
+        ).active
+        self.assertEqual(
+            [("NAME", "en", "es"), ("a", "A", None), ("b", "B", "Bé")],
+            list(sheet.iter_rows(values_only=True)),
+        )
+
+    def test_unsupported_output_raises_error(self):
+        with self.assertRaises(ValueError):
+            write_catalog(self._get_catalog(), self.root / "catalog.yaml")
+
+    def test_catalog_command(self):
+        output_filepath = self.root / "output/catalog.csv"
+
+        main(["catalog", str(self.root / "res"), "-f", str(output_filepath)])
+
+        with open(output_filepath, encoding="utf-8", newline="") as file:
+            self.assertEqual(
+                ["name", DEFAULT_LOCALE, "es", "pt-BR"], next(csv.reader(file))
+            )
+
+    def test_catalog_command_writes_to_stdout(self):
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+        with mock.patch.object(sys, "stdout", stdout):
+            main(["catalog", str(self.root / "res"), "-f", "-", "-t", ".json"])
+            stdout.flush()
+
+        rows = json.loads(stdout.buffer.getvalue())
+        self.assertEqual(["name", DEFAULT_LOCALE, "es", "pt-BR"], list(rows[0]))
+
+    def test_catalog_command_to_stdout_without_target_type_raises_error(self):
+        with self.assertRaises(ValueError):
+            main(["catalog", str(self.root / "res"), "-f", "-"])
+
+    # Private methods
+
+    @staticmethod
+    def _get_catalog():
+        catalog = Catalog()
+        catalog.add_locale("en", [("a", "A"), ("b", "B")])
+        catalog.add_locale("es", [("b", "Bé")])
+        return catalog
+
+    def _write_xml(self, relative_path, strings):
+        lines = [f'\t<string name="{name}">{value}</string>' for name, value in strings]
+        self._write(
+            relative_path, "<resources>\n" + "\n".join(lines) + "\n</resources>"
+        )
+
+    def _write_ios(self, relative_path, strings):
+        self._write(
+            relative_path,
+            "".join(f'"{name}" = "{value}";\n' for name, value in strings),
+        )
+
+    def _write(self, relative_path, content):
+        filepath = self.root / relative_path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import gzip
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.compression import (
+    add_compression_suffixes,
+    get_compression_suffix,
+    get_format_suffix,
+    open_file,
+    strip_compression_suffix,
+    zstd,
+)
+from mobile_strings_converter.converter import get_strings, write_strings
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+        self.template_dir = self.files_path / "template-without-comments"
+
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        # Sorted by key, like the .yaml writer sorts them
+        self.strings = [
+            ("greeting", "Hello, world"),
+            ("markup", "Tom & Jerry <3"),
+            ("unicode", "欢迎 ✓"),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_suffixes(self):
+        filepath = Path("dir/strings.json.gz")
+
+        self.assertEqual(".gz", get_compression_suffix(filepath))
+        self.assertEqual(".json", get_format_suffix(filepath))
+        self.assertEqual(Path("dir/strings.json"), strip_compression_suffix(filepath))
+        self.assertEqual("", get_compression_suffix("strings.json"))
+        self.assertEqual(".json", get_format_suffix("strings.json"))
+        self.assertEqual(
+            [".csv", ".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zst"],
+            add_compression_suffixes([".csv"]),
+        )
+
+    def test_strings_round_trip_through_every_codec(self):
+        compression_suffixes = [".gz", ".bz2", ".xz"]
+        if zstd is not None:
+            compression_suffixes.append(".zst")
+
+        for compression_suffix in compression_suffixes:
+            for format_suffix in (".csv", ".md", ".json", ".yaml", ".html", ".xlsx"):
+                filepath = self.root / f"strings{format_suffix}{compression_suffix}"
+
+                with self.subTest(filepath=filepath.name):
+                    write_strings(self.strings, filepath)
+
+                    self.assertEqual(self.strings, get_strings(filepath, False))
+
+    def test_compressed_file_has_the_content_of_the_format(self):
+        filepath = self.root / "strings.json.gz"
+        write_strings(self.strings, filepath)
+        write_strings(self.strings, self.root / "strings.json")
+
+        with gzip.open(filepath, "rb") as file:
+            self.assertEqual((self.root / "strings.json").read_bytes(), file.read())
+
+    def test_compressed_inputs_are_converted(self):
+        input_filepath = self.root / "input" / "strings.xml.gz"
+        input_filepath.parent.mkdir()
+        with gzip.open(input_filepath, "wb") as file:
+            file.write((self.files_path / "input/strings.xml").read_bytes())
+
+        output_dir = self.root / "output"
+        main([str(input_filepath.parent), "-d", str(output_dir), "-t", ".csv,.md.xz"])
+
+        self.assertEqual(
+            (self.template_dir / "strings.csv").read_text(encoding="utf-8"),
+            (output_dir / "strings.csv").read_text(encoding="utf-8"),
+        )
+        with open_file(output_dir / "strings.md.xz", "r", encoding="utf-8") as file:
+            self.assertEqual(
+                (self.template_dir / "strings.md").read_text(encoding="utf-8"),
+                file.read(),
+            )
+
+    def test_missing_zstd_raises_error(self):
+        with patch.dict(
+            "mobile_strings_converter.compression.COMPRESSION_OPENERS", {".zst": None}
+        ):
+            with self.assertRaises(ValueError):
+                write_strings(self.strings, self.root / "strings.json.zst")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import csv
+import io
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.catalog import Catalog
+from mobile_strings_converter.diff import (
+    diff_catalogs,
+    diff_strings,
+    get_missing_keys,
+    missing_keys_to_strings,
+)
+
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_added_removed_and_changed_keys(self):
+        diff = diff_strings(
+            [("a", "A"), ("b", "B"), ("c", "C")],
+            [("c", "C"), ("b", "Changed"), ("d", "D")],
+        )
+
+        self.assertEqual([("d", "D")], diff.added)
+        self.assertEqual([("a", "A")], diff.removed)
+        self.assertEqual([("b", "B", "Changed")], diff.changed)
+        self.assertEqual(
+            [
+                ("d", "added: D"),
+                ("a", "removed: A"),
+                ("b", "changed: B -> Changed"),
+            ],
+            diff.to_strings(),
+        )
+
+    def test_identical_strings_have_no_differences(self):
+        strings = [("a", "A"), ("b", "")]
+
+        self.assertFalse(diff_strings(strings, list(reversed(strings))))
+
+    def test_last_value_of_repeated_keys_is_compared(self):
+        diff = diff_strings([("a", "1"), ("a", "2")], [("a", "2")])
+
+        self.assertFalse(diff)
+
+    def test_catalogs_are_compared_per_locale(self):
+        old_catalog = Catalog()
+        old_catalog.add_locale("en", [("a", "A"), ("b", "B")])
+        old_catalog.add_locale("fr", [("a", "A fr")])
+        new_catalog = Catalog()
+        new_catalog.add_locale("en", [("a", "A"), ("b", "B2")])
+        new_catalog.add_locale("es", [("a", "A es")])
+
+        diffs = diff_catalogs(old_catalog, new_catalog)
+
+        self.assertEqual(["en", "es", "fr"], list(diffs))
+        self.assertEqual([("b", "changed [en]: B -> B2")], diffs["en"].to_strings("en"))
+        self.assertEqual([("a", "A es")], diffs["es"].added)
+        self.assertEqual([("a", "A fr")], diffs["fr"].removed)
+
+    def test_missing_keys_per_locale(self):
+        catalog = Catalog()
+        catalog.add_locale("en", [("a", "A"), ("b", "B"), ("c", "C")])
+        catalog.add_locale("es", [("a", "A es")])
+        catalog.add_locale("fr", [("a", "A fr"), ("b", "B fr"), ("c", "C fr")])
+        catalog.add_locale("de", [("c", "C de"), ("extra", "Extra")])
+
+        missing_keys = get_missing_keys(catalog, "en")
+
+        self.assertEqual({"es": ["b", "c"], "de": ["a", "b"]}, missing_keys)
+        self.assertEqual(
+            [("b", "missing: es, de"), ("c", "missing: es"), ("a", "missing: de")],
+            missing_keys_to_strings(missing_keys),
+        )
+
+    def test_missing_reference_locale_raises_error(self):
+        with self.assertRaises(ValueError):
+            get_missing_keys(Catalog(), "en")
+
+    def test_diff_command_writes_report(self):
+        old_filepath = self._write("old.strings", '"a" = "A";\n"b" = "B";\n')
+        new_filepath = self._write("new.strings", '"a" = "A2";\n"c" = "C";\n')
+        output_filepath = self.root / "report/diff.csv"
+
+        main(["diff", str(old_filepath), str(new_filepath), "-f", str(output_filepath)])
+
+        with open(output_filepath, encoding="utf-8", newline="") as file:
+            self.assertEqual(
+                [
+                    ["name", "value"],
+                    ["c", "added: C"],
+                    ["b", "removed: B"],
+                    ["a", "changed: A -> A2"],
+                ],
+                list(csv.reader(file)),
+            )
+
+    def test_diff_command_compares_resource_directories(self):
+        self._write("old/values/strings.xml", self._get_xml(a="A", b="B"))
+        self._write("new/values/strings.xml", self._get_xml(a="A", b="B2"))
+        self._write("new/values-es/strings.xml", self._get_xml(a="A es"))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(
+                [
+                    "diff",
+                    str(self.root / "old"),
+                    str(self.root / "new"),
+                    "--missing",
+                    "-j",
+                    "1",
+                ]
+            )
+
+        self.assertIn("b: changed [default]: B -> B2", output.getvalue())
+        self.assertIn("a: added [es]: A es", output.getvalue())
+        self.assertIn("b: missing: es", output.getvalue())
+
+    def test_file_and_directory_cannot_be_compared(self):
+        filepath = self._write("strings.strings", '"a" = "A";\n')
+
+        with self.assertRaises(ValueError):
+            main(["diff", str(filepath), str(self.root)])
+
+    # Private methods
+
+    @staticmethod
+    def _get_xml(**strings):
+        lines = [
+            f'\t<string name="{name}">{value}</string>'
+            for name, value in strings.items()
+        ]
+        return "<resources>\n" + "\n".join(lines) + "\n</resources>"
+
+    def _write(self, relative_path, content):
+        filepath = self.root / relative_path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content, encoding="utf-8")
+        return filepath
+
+
+if __name__ == "__main__":
+    unittest.main()
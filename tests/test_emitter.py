@@ -0,0 +1,153 @@
+import io
+import re
+import unittest
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.converter import get_strings, write_strings
+from mobile_strings_converter.emitter import (
+    EMITTER_PIECE_SIZE,
+    MD_EMITTER,
+    RowEmitter,
+    escape_html,
+    escape_ios,
+    escape_md,
+    escape_xml_attribute,
+    escape_xml_text,
+)
+
+
+class TestEmitter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_text_without_special_characters_is_unchanged(self):
+        text = "I\\'m happy to be here"
+        for escape in (
+            escape_html,
+            escape_ios,
+            escape_md,
+            escape_xml_attribute,
+            escape_xml_text,
+        ):
+            self.assertIs(text, escape(text))
+
+    def test_html_and_md_escapes(self):
+        self.assertEqual("a &lt;b> &amp; c", escape_html("a <b> & c"))
+        self.assertEqual("a \\| b<br>c", escape_md("a | b\r\nc"))
+
+    def test_ios_escapes_keep_escape_sequences(self):
+        self.assertEqual('Say \\"hi\\"', escape_ios('Say "hi"'))
+        self.assertEqual('Say \\"hi\\"', escape_ios('Say \\"hi\\"'))
+        self.assertEqual('I\\\'m \\"ok\\"', escape_ios('I\\\'m "ok"'))
+        self.assertEqual("C:\\\\", escape_ios("C:\\"))
+
+    def test_xml_escapes_keep_entities_and_markup(self):
+        self.assertEqual(
+            "<b>Tom</b> &amp; Jerry &lt; 3 &amp; &#169;",
+            escape_xml_text("<b>Tom</b> & Jerry < 3 &amp; &#169;"),
+        )
+        self.assertEqual("a&quot;&lt;b", escape_xml_attribute('a"<b'))
+
+    def test_rows_are_written_in_blocks(self):
+        emitter = RowEmitter(
+            MD_EMITTER.format_rows,
+            MD_EMITTER.special_characters,
+            escape_md,
+            escape_md,
+            block_size=10,
+        )
+        strings = [
+            (f"key_{i}", f"a | {i}" if i % 7 == 0 else str(i)) for i in range(25)
+        ]
+        file = _WriteCounter()
+        emitter.write(file, iter(strings))
+
+        self.assertEqual(3, file.writes)
+        self.assertEqual(
+            "".join(f"| {n} | {escape_md(v)} |\n" for n, v in strings).encode(),
+            file.getvalue(),
+        )
+
+    def test_only_pieces_with_special_characters_are_escaped(self):
+        escaped_texts = []
+
+        def escape(text):
+            escaped_texts.append(text)
+            return escape_md(text)
+
+        emitter = RowEmitter(
+            MD_EMITTER.format_rows, MD_EMITTER.special_characters, escape, escape
+        )
+        strings = [(f"key_{i}", "a | b" if i == 100 else str(i)) for i in range(1000)]
+
+        self.assertEqual(
+            "".join(f"| {n} | {escape_md(v)} |\n" for n, v in strings).encode(),
+            emitter.format_block(strings),
+        )
+        self.assertEqual(2 * EMITTER_PIECE_SIZE, len(escaped_texts))
+
+    def test_md_line_breaks_and_literal_br_round_trip(self):
+        strings = [
+            ("break", "Line 1\nLine 2"),
+            ("literal", "Use <br> here"),
+            ("escaped", "Already &lt;br> and &amp;lt;br>"),
+            ("both", "a<br>\nb|c"),
+        ]
+        filepath = self.root / "strings.md"
+        write_strings(strings, filepath)
+
+        self.assertIn("Use &lt;br> here", filepath.read_text(encoding="utf-8"))
+        self.assertEqual(strings, get_strings(filepath, with_comments=False))
+
+    def test_special_characters_round_trip(self):
+        strings = [
+            ("pipe", "Yes | No"),
+            ("markup", "Tom & Jerry <3"),
+            ("quote", 'Say "hi"'),
+        ]
+
+        for file_name in ("strings.html", "strings.md", "Localizable.strings"):
+            with self.subTest(file_name=file_name):
+                filepath = self.root / file_name
+                write_strings(strings, filepath)
+                read_strings = get_strings(filepath, with_comments=False)
+
+                if file_name.endswith(".strings"):
+                    # The .strings format keeps the escape sequences of the values
+                    read_strings = [
+                        (name, value.replace('\\"', '"'))
+                        for name, value in read_strings
+                    ]
+
+                self.assertEqual(strings, read_strings)
+
+    def test_xml_output_is_well_formed(self):
+        strings = [("markup", "<b>Tom</b> & Jerry < 3"), ('a"b', "&amp;")]
+        filepath = self.root / "strings.xml"
+        write_strings(strings, filepath)
+
+        root = ElementTree.parse(filepath).getroot()
+
+        self.assertEqual(["markup", 'a"b'], [e.get("name") for e in root])
+        self.assertEqual(
+            "Tom & Jerry < 3", re.sub(r"\s+", " ", "".join(root[0].itertext()))
+        )
+        self.assertEqual("&", root[1].text)
+
+
+class _WriteCounter(io.BytesIO):
+    writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
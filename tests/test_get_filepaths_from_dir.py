@@ -0,0 +1,107 @@
+import types
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.utils import PathFilter, get_filepaths_from_dir
+
+
+class TestGetFilepathsFromDir(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+        for relative_path in [
+            "values/strings.xml",
+            "values-es/strings.xml",
+            "values-es/colors.xml",
+            "en.lproj/Localizable.strings",
+            "docs/notes.txt",
+            "build/values/strings.xml",
+            ".git/strings.xml",
+            "node_modules/package/strings.xml",
+            "ios/Pods/Localizable.strings",
+            "legacy/values/strings.xml",
+        ]:
+            filepath = self.root / relative_path
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_text("")
+
+        self.extensions = [".xml", ".strings"]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_paths_are_yielded_lazily(self):
+        self.assertIsInstance(
+            get_filepaths_from_dir(self.root, self.extensions), types.GeneratorType
+        )
+
+    def test_default_excluded_dirs_are_pruned(self):
+        self.assertEqual(
+            {
+                "values/strings.xml",
+                "values-es/strings.xml",
+                "values-es/colors.xml",
+                "en.lproj/Localizable.strings",
+                "legacy/values/strings.xml",
+            },
+            self._get_relative_paths(),
+        )
+
+    def test_default_excluded_dirs_can_be_disabled(self):
+        self.assertEqual(9, len(self._get_relative_paths(excluded_dirs=frozenset())))
+
+    def test_include_globs(self):
+        self.assertEqual(
+            {"values/strings.xml", "values-es/strings.xml"},
+            self._get_relative_paths(include=["values*/strings.xml"]),
+        )
+
+    def test_include_globs_match_file_names(self):
+        self.assertEqual(
+            {"en.lproj/Localizable.strings"},
+            self._get_relative_paths(include=["*.strings"]),
+        )
+
+    def test_exclude_globs_prune_directories(self):
+        self.assertEqual(
+            {
+                "values/strings.xml",
+                "values-es/strings.xml",
+                "values-es/colors.xml",
+                "en.lproj/Localizable.strings",
+            },
+            self._get_relative_paths(exclude=["legacy"]),
+        )
+
+    def test_exclude_globs_skip_files(self):
+        self.assertEqual(
+            {
+                "values/strings.xml",
+                "values-es/strings.xml",
+                "en.lproj/Localizable.strings",
+                "legacy/values/strings.xml",
+            },
+            self._get_relative_paths(exclude=["colors.xml"]),
+        )
+
+    def test_path_filter_checks_every_directory(self):
+        path_filter = PathFilter(self.extensions, exclude=["legacy"])
+
+        self.assertTrue(path_filter.is_included("values/strings.xml"))
+        self.assertFalse(path_filter.is_included("legacy/values/strings.xml"))
+        self.assertFalse(path_filter.is_included("build/values/strings.xml"))
+        self.assertFalse(path_filter.is_included("docs/notes.txt"))
+
+    # Private methods
+
+    def _get_relative_paths(self, **kwargs):
+        return {
+            path.relative_to(self.root).as_posix()
+            for path in get_filepaths_from_dir(self.root, self.extensions, **kwargs)
+        }
+
+
+if __name__ == "__main__":
+    unittest.main()
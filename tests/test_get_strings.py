@@ -1,7 +1,13 @@
+import io
 import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from base_tests import BaseTests
 
+from mobile_strings_converter.converter import get_strings, resolve_duplicates
+
 
 class TestGetStringsIos(BaseTests.GetStringsTest):
     def setUp(self):
@@ -29,5 +35,56 @@ class TestGetStringsAndroid(BaseTests.GetStringsTest):
         self.extension = ".xml"
 
 
+class TestResolveDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.strings = [("a", "1"), ("b", "B"), ("a", "2"), ("c", "C"), ("a", "3")]
+
+    def test_every_string_is_kept_by_default(self):
+        self.assertEqual(self.strings, resolve_duplicates(self.strings, None))
+
+    def test_first_value_wins(self):
+        self.assertEqual(
+            [("a", "1"), ("b", "B"), ("c", "C")],
+            resolve_duplicates(self.strings, "first"),
+        )
+
+    def test_last_value_wins_at_the_first_position(self):
+        self.assertEqual(
+            [("a", "3"), ("b", "B"), ("c", "C")],
+            resolve_duplicates(self.strings, "last"),
+        )
+
+    def test_error_lists_the_repeated_keys(self):
+        with self.assertRaisesRegex(ValueError, r"a \(3 times\)"):
+            resolve_duplicates(self.strings, "error")
+
+    def test_report_keeps_every_string(self):
+        output = io.StringIO()
+        with redirect_stderr(output):
+            strings = resolve_duplicates(self.strings, "report")
+
+        self.assertEqual(self.strings, strings)
+        self.assertIn("a (3 times)", output.getvalue())
+
+    def test_strings_without_duplicates_are_unchanged(self):
+        strings = [("a", "A"), ("b", "B")]
+
+        for policy in ("error", "first", "last", "report"):
+            self.assertEqual(strings, resolve_duplicates(strings, policy))
+
+    def test_unsupported_policy_raises_error(self):
+        with self.assertRaises(ValueError):
+            resolve_duplicates(self.strings, "merge")
+
+    def test_policy_is_applied_by_get_strings(self):
+        with TemporaryDirectory() as temp_dir:
+            filepath = Path(temp_dir) / "Localizable.strings"
+            filepath.write_text('"a" = "1";\n"a" = "2";\n', encoding="utf-8")
+
+            self.assertEqual(
+                [("a", "1")], get_strings(filepath, False, duplicates="first")
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
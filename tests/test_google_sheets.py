@@ -0,0 +1,343 @@
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from fake_google_api import FakeGoogleAPI
+from gspread.exceptions import APIError
+
+from mobile_strings_converter.cache import StringsCache
+from mobile_strings_converter.converter import get_strings, to_google_sheets_many
+from mobile_strings_converter.google_sheets import (
+    HEADER_ROW,
+    RateLimiter,
+    get_sheet_diff,
+    get_strings_from_google_sheets,
+    sync_strings,
+    upload_many,
+    upload_strings,
+)
+
+
+class TestUploadStrings(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.client = self.api.create_client()
+        self.strings = [(f"name_{i}", f"Value {i}") for i in range(25)]
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_strings_are_uploaded(self):
+        self.api.add_spreadsheet("strings")
+
+        upload_strings(self.client, "strings", self.strings)
+
+        self.assertEqual(
+            [HEADER_ROW, *map(list, self.strings)], self.api.get_values("strings")
+        )
+
+    def test_previous_content_is_replaced(self):
+        self.api.add_spreadsheet("strings", [["old", "Old"]] * 100)
+
+        upload_strings(self.client, "strings", self.strings)
+
+        self.assertEqual(len(self.strings) + 1, len(self.api.get_values("strings")))
+
+    def test_rows_are_sent_in_chunks(self):
+        self.api.add_spreadsheet("strings")
+
+        upload_strings(self.client, "strings", self.strings, chunk_size=10)
+
+        # 26 rows including the header
+        self.assertEqual(3, self.api.count_requests("PUT", "/values/"))
+        self.assertEqual(
+            [HEADER_ROW, *map(list, self.strings)], self.api.get_values("strings")
+        )
+
+    def test_request_count_does_not_depend_on_the_number_of_strings(self):
+        self.api.add_spreadsheet("strings")
+        upload_strings(self.client, "strings", self.strings[:1])
+        requests_for_one_string = len(self.api.requests)
+
+        self.api.requests.clear()
+        upload_strings(self.client, "strings", self.strings)
+
+        self.assertEqual(requests_for_one_string, len(self.api.requests))
+
+    def test_quota_errors_are_retried(self):
+        self.api.add_spreadsheet("strings")
+        self.api.fail_next_requests(2)
+
+        upload_strings(self.client, "strings", self.strings)
+
+        self.assertEqual(
+            [HEADER_ROW, *map(list, self.strings)], self.api.get_values("strings")
+        )
+
+    def test_quota_errors_are_raised_after_the_last_retry(self):
+        client = self.api.create_client(max_retries=1)
+        self.api.add_spreadsheet("strings")
+        self.api.fail_next_requests(2)
+
+        with self.assertRaises(APIError):
+            upload_strings(client, "strings", self.strings)
+
+        self.assertEqual(2, len(self.api.requests))
+
+    def test_other_errors_are_not_retried(self):
+        self.api.add_spreadsheet("strings")
+        self.api.fail_next_requests(1, status=403)
+
+        with self.assertRaises(APIError):
+            upload_strings(self.client, "strings", self.strings)
+
+        self.assertEqual(1, len(self.api.requests))
+
+
+class TestSyncStrings(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.client = self.api.create_client()
+        self.rows = [HEADER_ROW, *[[f"name_{i}", f"Value {i}"] for i in range(10)]]
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_changes_are_sent_in_one_batch_update(self):
+        self.api.add_spreadsheet("strings", self.rows)
+        strings = [tuple(row) for row in self.rows[1:]]
+        strings[2] = ("name_2", "Changed")
+        del strings[5:7]
+        strings.append(("name_new", "New"))
+
+        inserted, updated, deleted = sync_strings(self.client, "strings", strings)
+
+        self.assertEqual((1, 1, 2), (inserted, updated, deleted))
+        self.assertEqual(
+            [HEADER_ROW, *map(list, strings)], self.api.get_values("strings")
+        )
+        self.assertEqual(1, self.api.count_requests("GET", "/values/"))
+        self.assertEqual(1, self.api.count_requests("POST", ":batchUpdate"))
+        self.assertEqual(0, self.api.count_requests("POST", ":clear"))
+
+    def test_unchanged_sheet_is_not_written(self):
+        self.api.add_spreadsheet("strings", self.rows)
+
+        result = sync_strings(
+            self.client, "strings", [tuple(row) for row in self.rows[1:]]
+        )
+
+        self.assertEqual((0, 0, 0), result)
+        self.assertEqual(0, self.api.count_requests("POST"))
+        self.assertEqual(0, self.api.count_requests("PUT"))
+
+    def test_empty_sheet_is_filled(self):
+        self.api.add_spreadsheet("strings")
+        strings = [("a", "A"), ("b", "B")]
+
+        sync_strings(self.client, "strings", strings)
+
+        self.assertEqual(
+            [HEADER_ROW, *map(list, strings)], self.api.get_values("strings")
+        )
+
+    def test_repeated_names_are_matched_in_order(self):
+        self.assertEqual(
+            ([(2, 1, "Changed")], [3], []),
+            get_sheet_diff(
+                [HEADER_ROW, ["a", "1"], ["a", "2"], ["a", "3"]],
+                [("a", "1"), ("a", "Changed")],
+            ),
+        )
+
+    def test_missing_cells_are_treated_as_empty(self):
+        self.assertEqual(
+            ([(0, 1, "VALUE")], [], []),
+            get_sheet_diff([["NAME"], ["a"]], [("a", "")]),
+        )
+
+
+class TestUploadMany(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeGoogleAPI(latency=0.02)
+        self.client = self.api.create_client()
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_spreadsheets_are_uploaded_concurrently(self):
+        uploads = []
+        for i in range(6):
+            self.api.add_spreadsheet(f"strings-{i}")
+            uploads.append((f"strings-{i}", None, [("name", f"Value {i}")]))
+
+        upload_many(self.client, uploads)
+
+        for i in range(6):
+            self.assertEqual(
+                [HEADER_ROW, ["name", f"Value {i}"]],
+                self.api.get_values(f"strings-{i}"),
+            )
+        self.assertGreater(self.api.max_concurrent_requests, 1)
+
+    def test_worksheets_of_one_spreadsheet(self):
+        self.api.add_spreadsheet("catalog")
+
+        upload_many(
+            self.client,
+            [
+                ("catalog", "en", [("name", "Name")]),
+                ("catalog", "es", [("name", "Nombre")]),
+            ],
+            sync=True,
+        )
+
+        self.assertEqual(
+            [HEADER_ROW, ["name", "Name"]],
+            self.api.get_values("catalog", sheet_title="en"),
+        )
+        self.assertEqual(
+            [HEADER_ROW, ["name", "Nombre"]],
+            self.api.get_values("catalog", sheet_title="es"),
+        )
+        # The spreadsheet is looked up only once
+        self.assertEqual(1, self.api.count_requests("GET", "^/drive/"))
+
+    def test_uploads_to_the_same_worksheet_keep_their_order(self):
+        self.api.add_spreadsheet("strings")
+
+        upload_many(
+            self.client,
+            [("strings", None, [("name", str(i))]) for i in range(5)],
+        )
+
+        self.assertEqual([HEADER_ROW, ["name", "4"]], self.api.get_values("strings"))
+
+    def test_credentials_are_loaded_once(self):
+        files_path = Path(__file__).parent / "files/input"
+        input_filepaths = [
+            files_path / "strings.xml",
+            files_path / "Localizable.strings",
+        ]
+        self.api.add_spreadsheet("strings")
+        self.api.add_spreadsheet("Localizable")
+
+        with patch(
+            "mobile_strings_converter.converter.authorize", return_value=self.client
+        ) as authorize:
+            to_google_sheets_many(
+                input_filepaths, Path("service_account.json"), with_comments=False
+            )
+
+        authorize.assert_called_once()
+        for input_filepath in input_filepaths:
+            self.assertEqual(
+                [HEADER_ROW, *map(list, get_strings(input_filepath, False))],
+                self.api.get_values(input_filepath.stem),
+            )
+
+
+class TestGetStringsFromGoogleSheets(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeGoogleAPI()
+        self.client = self.api.create_client()
+        self.temp_dir = TemporaryDirectory()
+        self.cache = StringsCache(Path(self.temp_dir.name))
+        self.strings = [("a", "A"), ("b", "B"), ("c", "")]
+        self.api.add_spreadsheet(
+            "strings", [HEADER_ROW, *map(list, self.strings)], ("en", "es")
+        )
+
+    def tearDown(self):
+        self.api.close()
+        self.temp_dir.cleanup()
+
+    def test_strings_are_fetched_in_one_values_request(self):
+        self.assertEqual(
+            self.strings, get_strings_from_google_sheets(self.client, "strings")
+        )
+        self.assertEqual(1, self.api.count_requests("GET", "^/drive/"))
+        self.assertEqual(1, self.api.count_requests("GET", "/values/"))
+        self.assertEqual(2, len(self.api.requests))
+
+    def test_unchanged_spreadsheet_is_read_from_the_cache(self):
+        get_strings_from_google_sheets(self.client, "strings", cache=self.cache)
+        self.api.requests.clear()
+
+        self.assertEqual(
+            self.strings,
+            get_strings_from_google_sheets(self.client, "strings", cache=self.cache),
+        )
+        # Only the metadata request
+        self.assertEqual([("GET", "/drive/v3/files")], self.api.requests)
+
+    def test_modified_spreadsheet_is_fetched_again(self):
+        get_strings_from_google_sheets(self.client, "strings", cache=self.cache)
+        upload_strings(self.client, "strings", [("a", "Changed")])
+
+        self.assertEqual(
+            [("a", "Changed")],
+            get_strings_from_google_sheets(self.client, "strings", cache=self.cache),
+        )
+
+    def test_worksheet_is_read(self):
+        upload_strings(self.client, "strings", [("a", "Á")], worksheet_title="es")
+
+        self.assertEqual(
+            [("a", "Á")],
+            get_strings_from_google_sheets(self.client, "strings", "es", self.cache),
+        )
+        self.assertEqual(
+            self.strings,
+            get_strings_from_google_sheets(self.client, "strings", cache=self.cache),
+        )
+
+    def test_missing_spreadsheet(self):
+        with self.assertRaises(ValueError):
+            get_strings_from_google_sheets(self.client, "missing")
+
+    def test_get_strings_reads_google_sheets_urls(self):
+        with patch(
+            "mobile_strings_converter.converter.get_client", return_value=self.client
+        ):
+            self.assertEqual(
+                self.strings, get_strings("gsheet://strings", False, self.cache)
+            )
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_requests_over_the_limit_wait_for_the_next_window(self):
+        rate_limiter = RateLimiter(3, period=0.2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            rate_limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_requests_within_the_limit_do_not_wait(self):
+        rate_limiter = RateLimiter(3, period=10)
+
+        start = time.monotonic()
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_client_requests_are_rate_limited(self):
+        api = FakeGoogleAPI()
+        self.addCleanup(api.close)
+        api.add_spreadsheet("strings")
+        client = api.create_client(rate_limiter=RateLimiter(2, period=0.2))
+
+        start = time.monotonic()
+        upload_strings(client, "strings", [("name", "Value")])
+
+        # 5 requests need 3 windows of 2 requests
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+
+if __name__ == "__main__":
+    unittest.main()
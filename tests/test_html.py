@@ -1,7 +1,15 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from base_tests import BaseTests
 
+from mobile_strings_converter.converter import (
+    get_strings_from_html,
+    iter_strings_from_html,
+)
+
 
 class TestToHtml(BaseTests.ConvertToTest):
     def setUp(self):
@@ -15,5 +23,102 @@ class TestFromHtml(BaseTests.ConvertFromTest):
         self.file_name = "strings.html"
 
 
+class TestHtmlReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.html_filepath = Path(self.temp_dir.name) / "strings.html"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cells_are_unescaped_and_markup_is_dropped(self):
+        self.html_filepath.write_text(
+            "<table>\n"
+            "<tr><th>NAME</th><th>VALUE</th></tr>\n"
+            '<tr class="row"><td> a </td><td><b>Tom</b> &amp; Jerry &lt;3</td></tr>\n'
+            "<tr><td>b</td><td>&#169; &copy; &quot;x&quot; > y</td></tr>\n"
+            "<tr><td>only one cell</td></tr>\n"
+            "</table>",
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            [("a", "Tom & Jerry <3"), ("b", '© © "x" > y')],
+            get_strings_from_html(self.html_filepath),
+        )
+
+    def test_rows_without_end_tags_are_read(self):
+        self.html_filepath.write_text(
+            "<table><tr><td>a<td>A<tr><td>b<td>B</table>", encoding="utf-8"
+        )
+
+        self.assertEqual(
+            [("a", "A"), ("b", "B")], get_strings_from_html(self.html_filepath)
+        )
+
+    def test_only_the_first_table_is_read(self):
+        self.html_filepath.write_text(
+            "<p><td>x</td><td>y</td></p>"
+            "<table><tr><td>a</td><td>A</td></tr></table>"
+            "<table><tr><td>b</td><td>B</td></tr></table>",
+            encoding="utf-8",
+        )
+
+        self.assertEqual([("a", "A")], get_strings_from_html(self.html_filepath))
+
+    def test_tables_after_the_first_one_are_ignored(self):
+        self.html_filepath.write_text(
+            "<table><tr><th>NAME</th><th>VALUE</th></tr>"
+            "<tr><td>a</td><td>A</td></tr><tr><td>b</td><td>B</td></tr></table>"
+            "<p>Other locale</p>"
+            "<table><tr><td>a</td><td>A es</td></tr><tr><td>c</td><td>C</td></tr>"
+            "</table>",
+            encoding="utf-8",
+        )
+
+        for chunk_size in (8, 1 << 16):
+            with self.subTest(chunk_size=chunk_size), patch(
+                "mobile_strings_converter.converter.HTML_READ_CHUNK_SIZE", chunk_size
+            ):
+                self.assertEqual(
+                    [("a", "A"), ("b", "B")],
+                    list(iter_strings_from_html(self.html_filepath)),
+                )
+
+    def test_rows_cut_between_chunks_are_read(self):
+        strings = [(f"name_{i}", f"Valeur &amp; {i} ✓") for i in range(100)]
+        self.html_filepath.write_text(
+            "<table>"
+            + "".join(f"<tr><td>{n}</td><td>{v}</td></tr>\n" for n, v in strings)
+            + "</table>",
+            encoding="utf-8",
+        )
+
+        for chunk_size in (1, 7, 64):
+            with self.subTest(chunk_size=chunk_size), patch(
+                "mobile_strings_converter.converter.HTML_READ_CHUNK_SIZE", chunk_size
+            ):
+                self.assertEqual(
+                    [(n, v.replace("&amp;", "&")) for n, v in strings],
+                    get_strings_from_html(self.html_filepath),
+                )
+
+    def test_rows_are_yielded_while_parsing(self):
+        self.html_filepath.write_text(
+            "<table><tr><td>a</td><td>A</td></tr>" + "<tr><td>b</td><td>B</td></tr>",
+            encoding="utf-8",
+        )
+
+        with patch("mobile_strings_converter.converter.HTML_READ_CHUNK_SIZE", 36):
+            strings = iter_strings_from_html(self.html_filepath)
+            self.assertEqual(("a", "A"), next(strings))
+            self.assertEqual([("b", "B")], list(strings))
+
+    def test_file_without_table_has_no_strings(self):
+        self.html_filepath.write_text("<p>No table</p>", encoding="utf-8")
+
+        self.assertEqual([], get_strings_from_html(self.html_filepath))
+
+
 if __name__ == "__main__":
     unittest.main()
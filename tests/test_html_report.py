@@ -0,0 +1,173 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.converter import get_strings
+from mobile_strings_converter.html_report import SEARCH_INDEX_FILENAME, to_html_report
+
+
+class TestHtmlReport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.strings = [(f"key_{i}", f"Value {i}") for i in range(25)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_strings_are_split_into_pages(self):
+        index_filepath = self.root / "report.html"
+        count = to_html_report(iter(self.strings), index_filepath, page_size=10)
+
+        self.assertEqual(25, count)
+        pages_dir = self.root / "report-pages"
+        page_filepaths = sorted(pages_dir.glob("page-*.html"))
+        self.assertEqual(
+            ["page-1.html", "page-2.html", "page-3.html"],
+            [path.name for path in page_filepaths],
+        )
+
+        # Each page is a table that can be read back like any other .html file
+        read_strings = []
+        for number in range(1, 4):
+            read_strings.extend(get_strings(pages_dir / f"page-{number}.html", False))
+        self.assertEqual(self.strings, read_strings)
+
+        self.assertFalse((pages_dir / SEARCH_INDEX_FILENAME).exists())
+
+    def test_index_lists_the_key_range_of_every_page(self):
+        index_filepath = self.root / "report.html"
+        to_html_report(self.strings, index_filepath, page_size=10)
+
+        index = index_filepath.read_text(encoding="utf-8")
+
+        self.assertIn("25 strings in 3 pages", index)
+        self.assertIn('<a href="report-pages/page-3.html">3</a>', index)
+        self.assertIn(
+            "<td>key_10</td>\n\t\t\t<td>key_19</td>\n\t\t\t<td>10</td>", index
+        )
+        self.assertNotIn("<script>", index)
+
+    def test_pages_link_to_their_neighbours(self):
+        index_filepath = self.root / "report.html"
+        to_html_report(self.strings[:20], index_filepath, page_size=10)
+
+        first_page = (self.root / "report-pages" / "page-1.html").read_text("utf-8")
+        last_page = (self.root / "report-pages" / "page-2.html").read_text("utf-8")
+
+        self.assertIn('href="page-2.html"', first_page)
+        self.assertNotIn("Previous", first_page)
+        self.assertIn('href="page-1.html"', last_page)
+        self.assertNotIn("Next", last_page)
+        self.assertIn('href="../report.html"', last_page)
+
+    def test_search_index_has_the_keys_of_every_page(self):
+        index_filepath = self.root / "report.html"
+        to_html_report(self.strings, index_filepath, page_size=10, search_index=True)
+
+        search_index_filepath = self.root / "report-pages" / SEARCH_INDEX_FILENAME
+        search_index = json.loads(search_index_filepath.read_text(encoding="utf-8"))
+
+        self.assertEqual(
+            [[name for name, _ in self.strings[i : i + 10]] for i in (0, 10, 20)],
+            search_index,
+        )
+        self.assertIn(
+            "report-pages/search-index.json", index_filepath.read_text("utf-8")
+        )
+
+    def test_special_characters_are_escaped(self):
+        strings = [('a"b', "Tom & Jerry <3")]
+        index_filepath = self.root / "report.html"
+        to_html_report(strings, index_filepath)
+
+        page = (self.root / "report-pages" / "page-1.html").read_text("utf-8")
+
+        self.assertIn('<tr id="a&quot;b">', page)
+        self.assertIn("<td>Tom &amp; Jerry &lt;3</td>", page)
+        self.assertEqual(
+            strings, get_strings(self.root / "report-pages" / "page-1.html", False)
+        )
+
+    def test_empty_strings_write_an_empty_index(self):
+        index_filepath = self.root / "report.html"
+        to_html_report([], index_filepath, search_index=True)
+
+        self.assertIn("0 strings in 0 pages", index_filepath.read_text("utf-8"))
+        self.assertEqual(
+            [],
+            json.loads(
+                (self.root / "report-pages" / SEARCH_INDEX_FILENAME).read_text("utf-8")
+            ),
+        )
+
+    def test_pages_of_a_previous_report_are_removed(self):
+        index_filepath = self.root / "report.html"
+        to_html_report(self.strings, index_filepath, page_size=5, search_index=True)
+        notes_filepath = self.root / "report-pages" / "notes.txt"
+        notes_filepath.write_text("Kept", encoding="utf-8")
+
+        to_html_report(self.strings, index_filepath, page_size=10)
+
+        self.assertEqual(
+            ["notes.txt", "page-1.html", "page-2.html", "page-3.html"],
+            sorted(path.name for path in (self.root / "report-pages").iterdir()),
+        )
+
+    def test_invalid_page_size_raises_error(self):
+        with self.assertRaises(ValueError):
+            to_html_report(self.strings, self.root / "report.html", page_size=0)
+
+    def test_report_command(self):
+        input_filepath = self.root / "strings.json"
+        input_filepath.write_text(
+            json.dumps(
+                [{"name": name, "value": value} for name, value in self.strings]
+            ),
+            encoding="utf-8",
+        )
+        index_filepath = self.root / "out" / "report.html"
+
+        with redirect_stdout(io.StringIO()):
+            main(
+                [
+                    "report",
+                    str(input_filepath),
+                    "-f",
+                    str(index_filepath),
+                    "--page-size",
+                    "20",
+                    "--search-index",
+                ]
+            )
+
+        pages_dir = self.root / "out" / "report-pages"
+        self.assertTrue(index_filepath.is_file())
+        self.assertEqual(
+            ["page-1.html", "page-2.html", SEARCH_INDEX_FILENAME],
+            sorted(path.name for path in pages_dir.iterdir()),
+        )
+
+    def test_report_command_pages_the_strings_as_they_are_read(self):
+        input_filepath = self.root / "strings.csv"
+        input_filepath.write_text(
+            "name,value\n" + "".join(f"{n},{v}\n" for n, v in self.strings),
+            encoding="utf-8",
+        )
+
+        with mock.patch(
+            "mobile_strings_converter.__main__.get_strings",
+            side_effect=AssertionError("The strings were loaded at once"),
+        ), redirect_stdout(io.StringIO()) as stdout:
+            main(["report", str(input_filepath), "-f", str(self.root / "r.html")])
+
+        self.assertIn("Report of 25 strings", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
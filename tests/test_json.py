@@ -1,7 +1,17 @@
+import json
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from base_tests import BaseTests
 
+from mobile_strings_converter.converter import (
+    get_strings_from_json,
+    iter_strings_from_json,
+    to_json,
+)
+
 
 class TestToJson(BaseTests.ConvertToTest):
     def setUp(self):
@@ -15,5 +25,130 @@ class TestFromJson(BaseTests.ConvertFromTest):
         self.file_name = "strings.json"
 
 
+class TestJsonBackends(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.json_filepath = Path(self.temp_dir.name) / "strings.json"
+        self.strings = [
+            ("quote", 'Say "hi"'),
+            ("unicode", "欢迎 ✓ \\ \t"),
+            ("empty", ""),
+            *((f"name_{i}", f"Value {i}") for i in range(2500)),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writers_match_json_dump(self):
+        records = [{"name": name, "value": value} for name, value in self.strings]
+        expected_output = json.dumps(records, ensure_ascii=False, indent=2)
+
+        for backend in ("json", "orjson"):
+            with self.subTest(backend=backend):
+                to_json(iter(self.strings), self.json_filepath, backend)
+
+                self.assertEqual(
+                    expected_output, self.json_filepath.read_text(encoding="utf-8")
+                )
+
+    def test_numeric_values_match_json_dump(self):
+        # Spreadsheet and .yaml cells can be numbers, which orjson encodes
+        # differently. They are mixed with strings in the last batch only
+        strings = [
+            *self.strings,
+            ("float", 1e20),
+            ("nan", float("nan")),
+            ("big", 2**70),
+            ("int", 3),
+        ]
+        records = [{"name": name, "value": value} for name, value in strings]
+        expected_output = json.dumps(records, ensure_ascii=False, indent=2)
+
+        for backend in ("json", "orjson"):
+            with self.subTest(backend=backend):
+                to_json(iter(strings), self.json_filepath, backend)
+
+                self.assertEqual(
+                    expected_output, self.json_filepath.read_text(encoding="utf-8")
+                )
+
+    def test_empty_strings(self):
+        for backend in ("json", "orjson"):
+            with self.subTest(backend=backend):
+                to_json([], self.json_filepath, backend)
+
+                self.assertEqual("[]", self.json_filepath.read_text(encoding="utf-8"))
+                self.assertEqual([], get_strings_from_json(self.json_filepath))
+
+    def test_readers_match_the_written_strings(self):
+        to_json(self.strings, self.json_filepath)
+
+        for backend in ("json", "orjson"):
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    self.strings, get_strings_from_json(self.json_filepath, backend)
+                )
+
+    def test_records_cut_between_chunks_are_read(self):
+        self.json_filepath.write_text(
+            '[{"name": "a", "value": "A"}, 12345, {"name": "b", "value": "B"},'
+            '\n  "text", {"name": "c", "value": 3}  ]',
+            encoding="utf-8",
+        )
+
+        for chunk_size in (1, 2, 7, 1 << 16):
+            with self.subTest(chunk_size=chunk_size), patch(
+                "mobile_strings_converter.converter.JSON_READ_CHUNK_SIZE", chunk_size
+            ):
+                self.assertEqual(
+                    [("a", "A"), ("b", "B"), ("c", 3)],
+                    get_strings_from_json(self.json_filepath),
+                )
+
+    def test_records_are_yielded_while_parsing(self):
+        self.json_filepath.write_text(
+            '[{"name": "a", "value": "A"}, {"name": "b"', encoding="utf-8"
+        )
+
+        strings = iter_strings_from_json(self.json_filepath)
+
+        self.assertEqual(("a", "A"), next(strings))
+        with self.assertRaises(ValueError):
+            next(strings)
+
+    def test_invalid_json_raises_error(self):
+        for content in ("", "{}", '[{"name": "a"} {"name": "b"}]', "[1, 2", "[,]"):
+            with self.subTest(content=content):
+                self.json_filepath.write_text(content, encoding="utf-8")
+
+                with self.assertRaises(ValueError):
+                    get_strings_from_json(self.json_filepath)
+
+    def test_trailing_comma_raises_error_with_every_backend(self):
+        self.json_filepath.write_text(
+            '[{"name": "a", "value": "A"},\n]', encoding="utf-8"
+        )
+
+        for backend, chunk_size in (("json", 1), ("json", 1 << 16), ("orjson", 1)):
+            with self.subTest(backend=backend, chunk_size=chunk_size), patch(
+                "mobile_strings_converter.converter.JSON_READ_CHUNK_SIZE", chunk_size
+            ):
+                with self.assertRaises(ValueError):
+                    get_strings_from_json(self.json_filepath, backend)
+
+    def test_unsupported_backend_raises_error(self):
+        with self.assertRaises(ValueError):
+            to_json(self.strings, self.json_filepath, "simplejson")
+
+    def test_missing_orjson_raises_error(self):
+        with patch("mobile_strings_converter.converter.orjson", None):
+            with self.assertRaises(ValueError):
+                to_json(self.strings, self.json_filepath, "orjson")
+
+            # The default backend falls back to the json module
+            to_json(self.strings, self.json_filepath)
+            self.assertEqual(self.strings, get_strings_from_json(self.json_filepath))
+
+
 if __name__ == "__main__":
     unittest.main()
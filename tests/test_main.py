@@ -0,0 +1,248 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.converter import convert_strings_to_many
+from mobile_strings_converter.manifest import MANIFEST_FILENAME
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+        self.input_filepath = self.files_path / "input/strings.xml"
+        self.template_dir = self.files_path / "template-without-comments"
+
+        self.temp_dir = TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_multiple_target_types_write_every_file(self):
+        main(
+            [
+                str(self.input_filepath),
+                "-d",
+                str(self.output_dir),
+                "-t",
+                ".csv, .json,.md",
+            ]
+        )
+
+        for extension in [".csv", ".json", ".md"]:
+            output_filepath = self.output_dir / f"strings{extension}"
+            self._assert_same_content(
+                output_filepath, self.template_dir / f"strings{extension}"
+            )
+
+    def test_multiple_target_types_parse_input_once(self):
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(
+                [
+                    str(self.input_filepath),
+                    "-d",
+                    str(self.output_dir),
+                    "-t",
+                    ".csv,.json,.yaml",
+                ]
+            )
+
+        get_strings.assert_called_once()
+
+    def test_output_dir_inside_input_dir_is_not_converted(self):
+        input_dir = self.output_dir / "res"
+        (input_dir / "values").mkdir(parents=True)
+        (input_dir / "values" / "strings.xml").write_bytes(
+            self.input_filepath.read_bytes()
+        )
+        args = [str(input_dir), "-d", str(input_dir / "out"), "-t", ".csv"]
+
+        # The second run finds the output of the first one while walking the input
+        for _ in range(2):
+            with patch(
+                "mobile_strings_converter.__main__.convert_strings_to_many",
+                wraps=convert_strings_to_many,
+            ) as convert:
+                main(args)
+
+            self.assertEqual(
+                [input_dir / "values" / "strings.xml"],
+                [call.args[0] for call in convert.call_args_list],
+            )
+
+        self.assertEqual(
+            ["strings.csv"], [path.name for path in (input_dir / "out").iterdir()]
+        )
+
+    def test_unsupported_target_type_raises_error(self):
+        with self.assertRaises(ValueError):
+            main(
+                [
+                    str(self.input_filepath),
+                    "-d",
+                    str(self.output_dir),
+                    "-t",
+                    ".csv,.docx",
+                ]
+            )
+
+    def test_output_file_with_multiple_target_types_raises_error(self):
+        with self.assertRaises(ValueError):
+            main(
+                [
+                    str(self.input_filepath),
+                    "-f",
+                    str(self.output_dir / "strings.csv"),
+                    "-t",
+                    ".csv,.json",
+                ]
+            )
+
+    def test_convert_strings_to_many_rejects_unsupported_output(self):
+        with patch("mobile_strings_converter.converter.get_strings") as get_strings:
+            with self.assertRaises(ValueError):
+                convert_strings_to_many(
+                    self.input_filepath,
+                    [self.output_dir / "strings.csv", self.output_dir / "strings.doc"],
+                )
+
+        # The input is not parsed if any of the outputs is not supported
+        get_strings.assert_not_called()
+
+    def test_incremental_skips_up_to_date_outputs(self):
+        args = self._get_incremental_args()
+        main(args)
+
+        with patch("mobile_strings_converter.converter.get_strings") as get_strings:
+            main(args)
+
+        get_strings.assert_not_called()
+        self.assertTrue((self.output_dir / MANIFEST_FILENAME).exists())
+
+    def test_incremental_rebuilds_outputs_with_force(self):
+        args = self._get_incremental_args()
+        main(args)
+
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(args + ["--force"])
+
+        get_strings.assert_called_once()
+
+    def test_incremental_rebuilds_outputs_when_options_change(self):
+        args = self._get_incremental_args()
+        main(args)
+
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(args + ["--print-comments"])
+
+        get_strings.assert_called_once()
+
+    def test_incremental_rebuilds_outputs_when_duplicates_policy_changes(self):
+        args = self._get_incremental_args()
+        main(args)
+
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(args + ["--duplicates", "last"])
+
+        get_strings.assert_called_once()
+
+    def test_incremental_rebuilds_outputs_when_patch_option_changes(self):
+        args = self._get_incremental_args()
+        main(args)
+
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(args + ["--patch"])
+
+        get_strings.assert_called_once()
+
+    def test_incremental_rebuilds_outputs_when_input_changes(self):
+        input_filepath = self.output_dir / "input" / "strings.xml"
+        input_filepath.parent.mkdir()
+        input_filepath.write_text(
+            '<resources>\n\t<string name="a">A</string>\n</resources>',
+            encoding="utf-8",
+        )
+        args = self._get_incremental_args(input_filepath)
+        main(args)
+
+        input_filepath.write_text(
+            '<resources>\n\t<string name="a">B</string>\n</resources>',
+            encoding="utf-8",
+        )
+        main(args)
+
+        self.assertEqual(
+            (self.output_dir / "strings.csv").read_text(encoding="utf-8"),
+            "name,value\na,B\n",
+        )
+
+    def test_incremental_rebuilds_deleted_outputs(self):
+        args = self._get_incremental_args()
+        main(args)
+        (self.output_dir / "strings.json").unlink()
+
+        main(args)
+
+        self.assertTrue((self.output_dir / "strings.json").exists())
+
+    def test_google_sheets_url_is_converted(self):
+        with patch(
+            "mobile_strings_converter.converter.get_strings",
+            return_value=[("name", "value")],
+        ) as get_strings:
+            main(
+                [
+                    "gsheet://MyProject strings#es",
+                    "-d",
+                    str(self.output_dir),
+                    "-t",
+                    ".csv",
+                    "--cache-dir",
+                    str(self.output_dir / "cache"),
+                ]
+            )
+
+        self.assertEqual("gsheet://MyProject strings#es", get_strings.call_args[0][0])
+        self.assertTrue((self.output_dir / "es.csv").is_file())
+
+    # Private methods
+
+    def _get_incremental_args(self, input_filepath=None):
+        return [
+            str(input_filepath or self.input_filepath),
+            "-d",
+            str(self.output_dir),
+            "-t",
+            ".csv,.json",
+            "--incremental",
+        ]
+
+    def _assert_same_content(self, output_filepath: Path, template_filepath: Path):
+        with open(output_filepath, "rb") as test_file, open(
+            template_filepath, "rb"
+        ) as template_file:
+            self.assertEqual(
+                test_file.read().decode("utf-8").replace("\r\n", "\n"),
+                template_file.read().decode("utf-8").replace("\r\n", "\n"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
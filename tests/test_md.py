@@ -1,7 +1,11 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from base_tests import BaseTests
 
+from mobile_strings_converter.converter import get_strings_from_md, iter_strings_from_md
+
 
 class TestToMd(BaseTests.ConvertToTest):
     def setUp(self):
@@ -15,5 +19,70 @@ class TestFromMd(BaseTests.ConvertFromTest):
         self.file_name = "strings.md"
 
 
+class TestMdReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.md_filepath = Path(self.temp_dir.name) / "strings.md"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_escaped_delimiters_and_line_breaks_are_read(self):
+        self.md_filepath.write_text(
+            "| NAME | VALUE |\n"
+            "| :--- | ---: |\n"
+            "| a | Yes \\| No |\n"
+            "| b | Line 1<br>Line 2 |\n"
+            "| c | Ends with \\| |\n"
+            "| d |  |\n",
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            [
+                ("a", "Yes | No"),
+                ("b", "Line 1\nLine 2"),
+                ("c", "Ends with |"),
+                ("d", ""),
+            ],
+            get_strings_from_md(self.md_filepath),
+        )
+
+    def test_every_table_is_read(self):
+        self.md_filepath.write_text(
+            "# Strings\n\n"
+            "| NAME | VALUE |\n"
+            "| --- | --- |\n"
+            "| a | A |\n"
+            "\nSome text | with a pipe\n\n"
+            "| NAME | VALUE |\n"
+            "|---|---|\n"
+            "| b | B |\n",
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            [("a", "A"), ("b", "B")], get_strings_from_md(self.md_filepath)
+        )
+
+    def test_table_without_header_is_read(self):
+        self.md_filepath.write_text("| a | A |\n| b | B |", encoding="utf-8")
+
+        self.assertEqual(
+            [("a", "A"), ("b", "B")], get_strings_from_md(self.md_filepath)
+        )
+
+    def test_rows_are_yielded_while_reading(self):
+        self.md_filepath.write_text(
+            "| NAME | VALUE |\n| --- | --- |\n| a | A |\n| b | B |\n",
+            encoding="utf-8",
+        )
+
+        strings = iter_strings_from_md(self.md_filepath)
+
+        self.assertEqual(("a", "A"), next(strings))
+        self.assertEqual([("b", "B")], list(strings))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.converter import get_strings, write_strings
+from mobile_strings_converter.mscat import (
+    MSCAT_HEADER,
+    MscatReader,
+    get_strings_from_mscat,
+    to_mscat,
+)
+
+
+class TestMscat(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.mscat_filepath = self.root / "strings.mscat"
+        self.strings = [
+            ("zeta", "Last"),
+            ("alpha", "Tom & Jerry <3"),
+            ("unicode", '欢迎 ✓\n"quoted"'),
+            ("empty", ""),
+            ("alpha", "Repeated"),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_strings_round_trip_in_order(self):
+        to_mscat(self.strings, self.mscat_filepath)
+
+        self.assertEqual(self.strings, get_strings_from_mscat(self.mscat_filepath))
+        with MscatReader(self.mscat_filepath) as reader:
+            self.assertEqual(self.strings, list(reader))
+
+    def test_names_are_looked_up(self):
+        to_mscat(self.strings, self.mscat_filepath)
+
+        with MscatReader(self.mscat_filepath) as reader:
+            self.assertEqual(5, len(reader))
+            self.assertEqual("Last", reader["zeta"])
+            self.assertEqual('欢迎 ✓\n"quoted"', reader.get("unicode"))
+            self.assertEqual("", reader.get("empty"))
+            # The first string with a repeated name wins
+            self.assertEqual("Tom & Jerry <3", reader.get("alpha"))
+            self.assertIsNone(reader.get("missing"))
+            self.assertEqual("default", reader.get("missing", "default"))
+            self.assertIn("zeta", reader)
+            self.assertNotIn("zet", reader)
+            with self.assertRaises(KeyError):
+                reader["missing"]
+
+    def test_many_names_are_looked_up(self):
+        strings = [(f"key_{i}", f"Value {i}") for i in range(1000)]
+        to_mscat(strings, self.mscat_filepath)
+
+        with MscatReader(self.mscat_filepath) as reader:
+            for name, value in strings:
+                self.assertEqual(value, reader.get(name))
+
+    def test_values_that_are_not_strings_are_written_as_text(self):
+        to_mscat([("count", 3), ("ratio", 1.5)], self.mscat_filepath)
+
+        self.assertEqual(
+            [("count", "3"), ("ratio", "1.5")],
+            get_strings_from_mscat(self.mscat_filepath),
+        )
+
+    def test_empty_strings_are_written(self):
+        to_mscat([], self.mscat_filepath)
+
+        with MscatReader(self.mscat_filepath) as reader:
+            self.assertEqual(0, len(reader))
+            self.assertEqual([], list(reader))
+            self.assertIsNone(reader.get("key"))
+
+    def test_file_is_converted_from_and_to_mscat(self):
+        input_filepath = self.files_path / "input" / "strings.xml"
+        write_strings(get_strings(input_filepath, False), self.mscat_filepath)
+        csv_filepath = self.root / "strings.csv"
+        write_strings(get_strings(self.mscat_filepath, False), csv_filepath)
+
+        self.assertEqual(
+            (self.files_path / "template-without-comments" / "strings.csv").read_text(
+                encoding="utf-8"
+            ),
+            csv_filepath.read_text(encoding="utf-8"),
+        )
+
+    def test_compressed_file_is_read(self):
+        mscat_filepath = self.root / "strings.mscat.gz"
+        write_strings(self.strings, mscat_filepath)
+
+        self.assertEqual(self.strings, get_strings(mscat_filepath, False))
+        with MscatReader(mscat_filepath) as reader:
+            self.assertEqual("Last", reader.get("zeta"))
+
+    def test_invalid_files_raise_error(self):
+        to_mscat(self.strings, self.mscat_filepath)
+        content = self.mscat_filepath.read_bytes()
+
+        for invalid_content in (
+            b"",
+            b"MSCAT",
+            b"NOTMSCAT" + content[8:],
+            content[:-1],
+            content[: MSCAT_HEADER.size],
+        ):
+            with self.subTest(invalid_content=invalid_content[:16]):
+                self.mscat_filepath.write_bytes(invalid_content)
+
+                with self.assertRaises(ValueError):
+                    MscatReader(self.mscat_filepath)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import gzip
+import io
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.converter import get_strings, write_strings
+from mobile_strings_converter.patch import patch_strings
+
+
+class TestPatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_changed_xml_values_are_replaced(self):
+        xml_filepath = self.root / "strings.xml"
+        xml_filepath.write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            "<resources>\n"
+            "    <!-- Greetings -->\n"
+            '    <string name="hello">Hello</string>\n'
+            '    <!--<string name="old">Old</string>-->\n'
+            '    <string name="bye">Bye</string>\n'
+            "</resources>\n",
+            encoding="utf-8",
+        )
+
+        counts = patch_strings(
+            [("bye", "Goodbye & <b>see you</b>"), ("hello", "Hello")], xml_filepath
+        )
+
+        self.assertEqual((1, 0), counts)
+        self.assertEqual(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            "<resources>\n"
+            "    <!-- Greetings -->\n"
+            '    <string name="hello">Hello</string>\n'
+            '    <!--<string name="old">Old</string>-->\n'
+            '    <string name="bye">Goodbye &amp; <b>see you</b></string>\n'
+            "</resources>\n",
+            xml_filepath.read_text(encoding="utf-8"),
+        )
+
+    def test_new_xml_keys_are_added_before_the_closing_tag(self):
+        xml_filepath = self.root / "strings.xml"
+        xml_filepath.write_text(
+            '<resources>\n  <string name="a">A</string>\n  </resources>',
+            encoding="utf-8",
+        )
+
+        counts = patch_strings([("b", "B"), ("a", "A2")], xml_filepath)
+
+        self.assertEqual((1, 1), counts)
+        self.assertEqual([("a", "A2"), ("b", "B")], get_strings(xml_filepath, False))
+        self.assertTrue(
+            xml_filepath.read_text(encoding="utf-8").endswith("  </resources>")
+        )
+
+    def test_only_changed_ios_values_are_replaced(self):
+        strings_filepath = self.root / "Localizable.strings"
+        strings_filepath.write_text(
+            "/* Greetings */\n"
+            '"hello" = "Hello";\n'
+            '// "bye" = "Commented";\n'
+            '"bye"   =   "Bye" ;',
+            encoding="utf-8",
+        )
+
+        counts = patch_strings(
+            [("bye", 'Say "bye"'), ("hello", "Hello"), ("new", "New")],
+            strings_filepath,
+        )
+
+        self.assertEqual((1, 1), counts)
+        self.assertEqual(
+            "/* Greetings */\n"
+            '"hello" = "Hello";\n'
+            '// "bye" = "Commented";\n'
+            '"bye"   =   "Say \\"bye\\"" ;\n'
+            '"new" = "New";\n',
+            strings_filepath.read_text(encoding="utf-8"),
+        )
+
+    def test_unchanged_file_is_not_written(self):
+        strings_filepath = self.root / "Localizable.strings"
+        strings_filepath.write_text('"a" = "A";\n', encoding="utf-8")
+        modified_time = strings_filepath.stat().st_mtime_ns
+
+        self.assertEqual((0, 0), patch_strings([("a", "A")], strings_filepath))
+        self.assertEqual(modified_time, strings_filepath.stat().st_mtime_ns)
+        self.assertEqual([strings_filepath], list(self.root.iterdir()))
+
+    def test_compressed_file_is_patched(self):
+        xml_filepath = self.root / "strings.xml.gz"
+        with gzip.open(xml_filepath, "wt", encoding="utf-8") as file:
+            file.write('<resources>\n<string name="a">A</string>\n</resources>')
+
+        patch_strings([("a", "B")], xml_filepath)
+
+        self.assertEqual([("a", "B")], get_strings(xml_filepath, False))
+        self.assertEqual([xml_filepath], list(self.root.iterdir()))
+
+    def test_write_strings_patches_only_existing_files(self):
+        xml_filepath = self.root / "strings.xml"
+
+        with redirect_stdout(io.StringIO()):
+            write_strings([("a", "A")], xml_filepath, patch=True)
+            xml_filepath.write_text(
+                xml_filepath.read_text(encoding="utf-8").replace(
+                    "<resources>", "<resources>\n<!-- Kept -->"
+                ),
+                encoding="utf-8",
+            )
+            write_strings([("a", "B")], xml_filepath, patch=True)
+
+        self.assertIn("<!-- Kept -->", xml_filepath.read_text(encoding="utf-8"))
+        self.assertEqual([("a", "B")], get_strings(xml_filepath, False))
+
+    def test_patch_option(self):
+        input_filepath = self.root / "input.csv"
+        input_filepath.write_text("name,value\na,A2\nb,B\n", encoding="utf-8")
+        output_filepath = self.root / "Localizable.strings"
+        output_filepath.write_text('// Kept\n"a" = "A";\n', encoding="utf-8")
+
+        with redirect_stdout(io.StringIO()):
+            main([str(input_filepath), "-f", str(output_filepath), "--patch"])
+
+        self.assertEqual(
+            '// Kept\n"a" = "A2";\n"b" = "B";\n',
+            output_filepath.read_text(encoding="utf-8"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import sqlite3
+import unittest
+from contextlib import closing, redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.catalog import Catalog, write_catalog
+from mobile_strings_converter.converter import get_strings, write_strings
+from mobile_strings_converter.sqlite import (
+    get_strings_from_sqlite,
+    iter_strings_from_sqlite,
+    to_sqlite,
+)
+
+
+class TestSqlite(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.sqlite_filepath = self.root / "strings.sqlite"
+        self.strings = [
+            ("zeta", "Last"),
+            ("alpha", "Tom & Jerry <3"),
+            ("unicode", "欢迎 ✓"),
+            ("alpha", "Repeated"),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_strings_round_trip_in_order(self):
+        to_sqlite(self.strings, self.sqlite_filepath)
+
+        self.assertEqual(self.strings, get_strings_from_sqlite(self.sqlite_filepath))
+
+    def test_table_has_the_strings_and_a_key_index(self):
+        to_sqlite(self.strings, self.sqlite_filepath, locale="es")
+
+        with closing(sqlite3.connect(self.sqlite_filepath)) as connection:
+            self.assertEqual(
+                [("Tom & Jerry <3",), ("Repeated",)],
+                connection.execute(
+                    "SELECT value FROM strings WHERE name = ? AND locale = ?",
+                    ("alpha", "es"),
+                ).fetchall(),
+            )
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT value FROM strings WHERE name = ?",
+                ("alpha",),
+            ).fetchall()
+
+        self.assertIn("strings_name", str(plan))
+
+    def test_existing_file_is_replaced(self):
+        to_sqlite(self.strings, self.sqlite_filepath)
+        to_sqlite(self.strings[:1], self.sqlite_filepath)
+
+        self.assertEqual(
+            self.strings[:1], get_strings_from_sqlite(self.sqlite_filepath)
+        )
+
+    def test_rows_are_yielded_while_reading(self):
+        to_sqlite(self.strings, self.sqlite_filepath)
+
+        strings = iter_strings_from_sqlite(self.sqlite_filepath)
+        self.assertEqual(("zeta", "Last"), next(strings))
+        self.assertEqual(self.strings[1:], list(strings))
+
+    def test_catalog_is_written_with_a_locale_column(self):
+        catalog = Catalog()
+        catalog.add_locale("default", [("a", "A"), ("b", "B")])
+        catalog.add_locale("es", [("b", "B es"), ("c", "C es")])
+        db_filepath = self.root / "catalog.db"
+
+        with redirect_stdout(io.StringIO()):
+            write_catalog(catalog, db_filepath)
+
+        self.assertEqual([("a", "A"), ("b", "B")], get_strings_from_sqlite(db_filepath))
+        self.assertEqual(
+            [("b", "B es"), ("c", "C es")],
+            get_strings_from_sqlite(db_filepath, locale="es"),
+        )
+
+    def test_file_is_converted_from_and_to_sqlite(self):
+        input_filepath = self.files_path / "input" / "strings.xml"
+        csv_filepath = self.root / "strings.csv"
+
+        with redirect_stdout(io.StringIO()):
+            write_strings(get_strings(input_filepath, False), self.sqlite_filepath)
+            write_strings(get_strings(self.sqlite_filepath, False), csv_filepath)
+
+        self.assertEqual(
+            (self.files_path / "template-without-comments" / "strings.csv").read_text(
+                encoding="utf-8"
+            ),
+            csv_filepath.read_text(encoding="utf-8"),
+        )
+
+    def test_compressed_database_round_trips(self):
+        sqlite_filepath = self.root / "strings.db.gz"
+        to_sqlite(self.strings, sqlite_filepath)
+
+        self.assertEqual(self.strings, get_strings(sqlite_filepath, False))
+
+    def test_invalid_file_raises_error(self):
+        self.sqlite_filepath.write_text("not a database", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            get_strings_from_sqlite(self.sqlite_filepath)
+
+
+if __name__ == "__main__":
+    unittest.main()
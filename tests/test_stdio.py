@@ -0,0 +1,167 @@
+import gzip
+import io
+import json
+import os
+import select
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.converter import get_strings
+
+
+class TestStdio(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_main(self, argv, stdin_data=b"", stderr=None):
+        stdin = io.TextIOWrapper(io.BytesIO(stdin_data), encoding="utf-8")
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+        with mock.patch.object(sys, "stdin", stdin), mock.patch.object(
+            sys, "stdout", stdout
+        ), mock.patch.object(sys, "stderr", stderr or io.StringIO()):
+            main(argv)
+            stdout.flush()
+
+        return stdout.buffer.getvalue()
+
+    def test_stdin_is_converted_to_stdout(self):
+        output = self.run_main(
+            ["-", "--input-type", ".csv", "-f", "-", "-t", ".strings"],
+            'name,value\na,A\nb,"B, ""quoted"""\n'.encode("utf-8"),
+        )
+
+        self.assertEqual(b'"a" = "A";\n"b" = "B, \\"quoted\\"";\n', output)
+
+    def test_stdin_is_converted_to_file(self):
+        output_filepath = self.root / "strings.xml"
+
+        self.run_main(
+            ["-", "--input-type", ".json", "-f", str(output_filepath)],
+            b'[{"name": "a", "value": "A"}]',
+        )
+
+        self.assertEqual([("a", "A")], get_strings(output_filepath, False))
+
+    def test_file_is_converted_to_compressed_stdout(self):
+        input_filepath = self.root / "strings.csv"
+        input_filepath.write_text("name,value\na,A\n", encoding="utf-8")
+
+        output = self.run_main([str(input_filepath), "-f", "-", "-t", ".xml.gz"])
+
+        self.assertIn(b'<string name="a">A</string>', gzip.decompress(output))
+
+    def test_pdf_is_written_to_stdout(self):
+        output = self.run_main(
+            ["-", "--input-type", ".csv", "-f", "-", "-t", ".pdf"],
+            b"name,value\na,A\n",
+        )
+
+        self.assertTrue(output.startswith(b"%PDF-"))
+        self.assertTrue(output.rstrip().endswith(b"%%EOF"))
+
+    def test_binary_format_is_read_from_stdin(self):
+        mscat_filepath = self.root / "strings.mscat"
+        self.run_main(
+            ["-", "--input-type", ".csv", "-f", str(mscat_filepath)],
+            b"name,value\na,A\n",
+        )
+
+        output = self.run_main(
+            ["-", "--input-type", ".mscat", "-f", "-", "-t", ".csv"],
+            mscat_filepath.read_bytes(),
+        )
+
+        self.assertEqual(b"name,value\na,A\n", output.replace(b"\r\n", b"\n"))
+
+    def test_warnings_are_not_mixed_with_the_output(self):
+        stderr = io.StringIO()
+        output = self.run_main(
+            [
+                "-",
+                str(self.root / "missing.txt"),
+                "--input-type",
+                ".csv",
+                "-f",
+                "-",
+                "-t",
+                ".json",
+                "--duplicates",
+                "report",
+            ],
+            b"name,value\na,A\na,B\n",
+            stderr,
+        )
+
+        self.assertEqual(
+            [{"name": "a", "value": "A"}, {"name": "a", "value": "B"}],
+            json.loads(output),
+        )
+        self.assertIn("Skipping unsupported file or path", stderr.getvalue())
+        self.assertIn("Duplicate keys found", stderr.getvalue())
+
+    def test_stdin_without_input_type_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.run_main(["-", "-f", "-", "-t", ".xml"])
+
+    def test_stdout_without_one_target_type_raises_error(self):
+        input_filepath = self.root / "strings.csv"
+        input_filepath.write_text("name,value\na,A\n", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            self.run_main([str(input_filepath), "-f", "-"])
+
+    @unittest.skipIf(os.name == "nt", "select only works with sockets on Windows")
+    def test_output_is_written_before_input_ends(self):
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "mobile_strings_converter",
+                "-",
+                "--input-type",
+                ".csv",
+                "-f",
+                "-",
+                "-t",
+                ".md",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(Path(__file__).parents[1] / "src"),
+            },
+            cwd=self.root,
+        )
+
+        try:
+            # More rows than a block of the writer, but less data than the pipe
+            # holds, so writing them never waits for the output to be read
+            process.stdin.write(b"name,value\n")
+            for i in range(3000):
+                process.stdin.write(f"key_{i},Value {i}\n".encode("utf-8"))
+            process.stdin.flush()
+
+            readable, _, _ = select.select([process.stdout], [], [], 30)
+            self.assertTrue(readable)
+            self.assertTrue(process.stdout.read1(1024).startswith(b"| NAME |"))
+        finally:
+            process.stdin.close()
+            process.stdout.read()
+            process.wait()
+
+        self.assertEqual(0, process.returncode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import gzip
+import io
+import socket
+import unittest
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+
+from mobile_strings_converter import (
+    convert_bytes,
+    convert_stream,
+    get_strings_from_stream,
+    write_strings_to_bytes,
+    write_strings_to_stream,
+)
+from mobile_strings_converter.compression import get_stream_path, is_stream_path
+from mobile_strings_converter.converter import get_strings
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.files_path = Path(__file__).parent / "files"
+        self.strings = [("a", "A"), ("b", 'B "quoted" & <b>bold</b>')]
+
+    def test_bytes_are_converted(self):
+        input_filepath = self.files_path / "input" / "strings.xml"
+
+        output = convert_bytes(input_filepath.read_bytes(), ".xml", ".csv")
+
+        self.assertEqual(
+            get_strings(input_filepath, False), get_strings_from_stream(output, ".csv")
+        )
+
+    def test_streams_are_converted_and_left_open(self):
+        input_stream = io.BytesIO(b"name,value\na,A\n")
+        output_stream = io.BytesIO()
+
+        convert_stream(input_stream, ".csv", output_stream, ".strings")
+
+        self.assertFalse(input_stream.closed)
+        self.assertFalse(output_stream.closed)
+        self.assertEqual(b'"a" = "A";\n', output_stream.getvalue())
+
+    def test_binary_formats_round_trip_in_memory(self):
+        for file_type in (".xlsx", ".mscat", ".sqlite", ".json.gz"):
+            with self.subTest(file_type=file_type):
+                data = write_strings_to_bytes(self.strings, file_type)
+
+                self.assertEqual(self.strings, get_strings_from_stream(data, file_type))
+
+    def test_compressed_output_is_written_to_stream(self):
+        with SpooledTemporaryFile() as output_stream:
+            write_strings_to_stream(self.strings, output_stream, ".yaml.gz")
+            output_stream.seek(0)
+
+            self.assertEqual(
+                self.strings,
+                get_strings_from_stream(
+                    io.BytesIO(gzip.decompress(output_stream.read())), ".yaml"
+                ),
+            )
+
+    def test_strings_are_read_from_socket(self):
+        sender, receiver = socket.socketpair()
+
+        with sender, receiver, receiver.makefile("rb", buffering=0) as file:
+            sender.sendall(b"| NAME | VALUE |\n| --- | --- |\n| a | A |\n")
+            sender.shutdown(socket.SHUT_WR)
+
+            self.assertEqual([("a", "A")], get_strings_from_stream(file, ".md"))
+
+    def test_duplicates_policy_is_applied(self):
+        output = convert_bytes(
+            b"name,value\na,A\na,B\n", ".csv", ".strings", duplicates="last"
+        )
+
+        self.assertEqual(b'"a" = "B";\n', output)
+
+    def test_stream_path_is_released(self):
+        with get_stream_path(io.BytesIO(), ".json") as path:
+            self.assertTrue(is_stream_path(path))
+
+        self.assertFalse(is_stream_path(path))
+
+    def test_unsupported_output_type_raises_error(self):
+        with self.assertRaises(ValueError):
+            write_strings_to_bytes(self.strings, ".txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
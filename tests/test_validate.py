@@ -0,0 +1,116 @@
+import csv
+import io
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.catalog import Catalog
+from mobile_strings_converter.validate import (
+    get_placeholders,
+    validate_placeholders,
+    violations_to_strings,
+)
+
+
+class TestValidate(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_placeholders_are_normalized(self):
+        self.assertEqual(
+            ["%1$s", "%2$d", "{name}"],
+            get_placeholders("{name}: %-5s has %03d items, 100%%"),
+        )
+        self.assertEqual(get_placeholders("%s %d"), get_placeholders("%2$d then %1$s"))
+        self.assertNotEqual(get_placeholders("%s %d"), get_placeholders("%d %s"))
+        self.assertEqual(["%1$@", "%2$ld"], get_placeholders("%@ and %ld"))
+
+    def test_text_is_not_read_as_placeholders(self):
+        self.assertEqual([], get_placeholders("50 % de réduction"))
+        self.assertEqual([], get_placeholders("No placeholders { here }"))
+
+    def test_mismatched_placeholders_are_reported(self):
+        catalog = Catalog()
+        catalog.add_locale(
+            "en", [("a", "%1$s has %2$d"), ("b", "Hi {name}"), ("c", "")]
+        )
+        catalog.add_locale("es", [("a", "%2$d tiene %1$s"), ("b", "Hola {nombre}")])
+        catalog.add_locale("fr", [("a", "%1$s a %2$s"), ("c", "%s")])
+        catalog.add_locale("de", [("b", "Hallo")])
+
+        violations = validate_placeholders(catalog, "en")
+
+        self.assertEqual(
+            {
+                "es": [("b", ["{name}"], ["{nombre}"])],
+                "fr": [
+                    ("a", ["%1$s", "%2$d"], ["%1$s", "%2$s"]),
+                    ("c", [], ["%1$s"]),
+                ],
+                "de": [("b", ["{name}"], [])],
+            },
+            violations,
+        )
+        self.assertEqual(
+            ("c", "[fr] expected no placeholders but found %1$s"),
+            violations_to_strings(violations)[2],
+        )
+
+    def test_missing_translations_and_extra_keys_are_skipped(self):
+        catalog = Catalog()
+        catalog.add_locale("en", [("a", "%s")])
+        catalog.add_locale("es", [("extra", "%d")])
+
+        self.assertEqual({}, validate_placeholders(catalog, "en"))
+
+    def test_validate_command_fails_on_violations(self):
+        self._write("res/values/strings.xml", "a", "Hello %1$s")
+        self._write("res/values-es/strings.xml", "a", "Hola %1$d")
+        output_filepath = self.root / "report.csv"
+
+        with redirect_stdout(io.StringIO()):
+            status = main(
+                [
+                    "validate",
+                    str(self.root / "res"),
+                    "-f",
+                    str(output_filepath),
+                    "-j",
+                    "1",
+                ]
+            )
+
+        self.assertEqual(1, status)
+        with open(output_filepath, encoding="utf-8", newline="") as file:
+            self.assertEqual(
+                ["a", "[es] expected %1$s but found %1$d"], list(csv.reader(file))[1]
+            )
+
+    def test_validate_command_passes(self):
+        self._write("res/values/strings.xml", "a", "Hello %1$s")
+        self._write("res/values-es/strings.xml", "a", "Hola %s")
+
+        with redirect_stdout(io.StringIO()):
+            status = main(["validate", str(self.root / "res"), "-j", "1"])
+
+        self.assertEqual(0, status)
+
+    # Private methods
+
+    def _write(self, relative_path, name, value):
+        filepath = self.root / relative_path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(
+            f'<resources>\n\t<string name="{name}">{value}</string>\n</resources>',
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
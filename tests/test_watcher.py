@@ -0,0 +1,161 @@
+import io
+import os
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from mobile_strings_converter.__main__ import main
+from mobile_strings_converter.converter import get_strings
+from mobile_strings_converter.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_watcher,
+    watch,
+)
+
+
+class BaseWatcherTest(object):
+    # This is a wrapper class that prevents its nested classes from running as tests.
+
+    class WatcherTest(unittest.TestCase):
+        def setUp(self):
+            self.temp_dir = TemporaryDirectory()
+            self.root = Path(self.temp_dir.name)
+            self.strings_filepath = self.root / "strings.xml"
+            self.strings_filepath.write_text("<resources></resources>")
+
+            self.watcher = self.create_watcher([self.root])
+
+        def tearDown(self):
+            self.watcher.close()
+            self.temp_dir.cleanup()
+
+        def create_watcher(self, paths):
+            raise NotImplementedError
+
+        def test_modified_file_is_reported(self):
+            self._write(self.strings_filepath, "<resources>\n</resources>")
+
+            self.assertIn(
+                self.strings_filepath.resolve(), self._read_changes(self.watcher)
+            )
+
+        def test_file_in_new_subdirectory_is_reported(self):
+            new_filepath = self.root / "values-es" / "strings.xml"
+            new_filepath.parent.mkdir()
+            self._write(new_filepath, "<resources></resources>")
+
+            self.assertIn(new_filepath.resolve(), self._read_changes(self.watcher))
+
+        def test_unsupported_file_is_not_reported(self):
+            self._write(self.root / "notes.txt", "notes")
+
+            self.assertEqual(set(), self._read_changes(self.watcher))
+
+        def test_watched_file_is_reported(self):
+            watcher = self.create_watcher([self.strings_filepath])
+            self._write(self.strings_filepath, "<resources>\n</resources>")
+            self._write(self.root / "other.xml", "<resources></resources>")
+
+            try:
+                self.assertEqual(
+                    {self.strings_filepath.resolve()}, self._read_changes(watcher)
+                )
+            finally:
+                watcher.close()
+
+        def test_watch_debounces_bursts_of_writes(self):
+            calls = []
+            stop_event = threading.Event()
+
+            def on_change(filepaths):
+                calls.append(filepaths)
+                stop_event.set()
+
+            thread = threading.Thread(
+                target=watch,
+                args=(self.watcher, on_change),
+                kwargs={"debounce": 0.5, "stop_event": stop_event},
+            )
+            thread.start()
+
+            for i in range(3):
+                self._write(self.strings_filepath, f"<resources>{i}</resources>")
+                self._write(self.root / f"{i}.xml", "<resources></resources>")
+                time.sleep(0.05)
+
+            thread.join(timeout=10)
+            stop_event.set()
+
+            self.assertEqual(1, len(calls))
+            self.assertEqual(4, len(calls[0]))
+
+        # Private methods
+
+        @staticmethod
+        def _write(filepath: Path, content: str):
+            filepath.write_text(content)
+            # Make sure that the polling watcher notices the change
+            stat = filepath.stat()
+            os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        @staticmethod
+        def _read_changes(watcher):
+            changes = set()
+            while more_changes := watcher.read_changes(0.3):
+                changes.update(path.resolve() for path in more_changes)
+
+            return changes
+
+
+class TestPollingWatcher(BaseWatcherTest.WatcherTest):
+    def create_watcher(self, paths):
+        return PollingWatcher(paths, [".xml"], interval=0.05)
+
+
+@unittest.skipUnless(
+    isinstance(create_watcher([], [".xml"]), InotifyWatcher), "inotify not available"
+)
+class TestInotifyWatcher(BaseWatcherTest.WatcherTest):
+    def create_watcher(self, paths):
+        return InotifyWatcher(paths, [".xml"])
+
+
+class TestWatchOption(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_changed_input_is_converted_again(self):
+        input_filepath = self.root / "strings.csv"
+        input_filepath.write_text("name,value\na,A\n", encoding="utf-8")
+        output_filepath = self.root / "output" / "strings.json"
+        watcher = mock.Mock()
+
+        def fake_watch(watcher, on_change):
+            input_filepath.write_text("name,value\na,B\n", encoding="utf-8")
+            on_change([input_filepath])
+
+        with mock.patch(
+            "mobile_strings_converter.__main__.create_watcher", return_value=watcher
+        ), mock.patch(
+            "mobile_strings_converter.__main__.watch", side_effect=fake_watch
+        ), redirect_stdout(
+            io.StringIO()
+        ) as stdout:
+            main([str(input_filepath), "-f", str(output_filepath), "--watch"])
+
+        self.assertIn(f"Watching {input_filepath.resolve()}", stdout.getvalue())
+        self.assertEqual([("a", "B")], get_strings(output_filepath, False))
+        watcher.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
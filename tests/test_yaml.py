@@ -1,7 +1,13 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
+import yaml
 from base_tests import BaseTests
 
+from mobile_strings_converter.converter import get_strings_from_yaml, to_yaml
+
 
 class TestToYaml(BaseTests.ConvertToTest):
     def setUp(self):
@@ -15,5 +21,80 @@ class TestFromYaml(BaseTests.ConvertFromTest):
         self.file_name = "strings.yaml"
 
 
+class TestYamlEvents(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.yaml_filepath = Path(self.temp_dir.name) / "strings.yaml"
+        self.strings = [
+            ("plain", "Hello world"),
+            ("boolean", "yes"),
+            ("number", "3"),
+            ("empty", ""),
+            ("colon", "key: value"),
+            ("quotes", 'It\'s "quoted"'),
+            ("multiline", "first line\nsecond line"),
+            ("unicode", "欢迎来到我的申请"),
+            ("long", "word " * 30),
+            ("integer", 42),
+            ("null", None),
+            ("plain", "Last value"),
+        ]
+        self.implementations = {"python": (yaml.SafeLoader, yaml.SafeDumper)}
+        if yaml.__with_libyaml__:
+            self.implementations["libyaml"] = (yaml.CSafeLoader, yaml.CSafeDumper)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writer_matches_yaml_dump(self):
+        expected_output = yaml.dump(
+            dict(self.strings), default_flow_style=False, allow_unicode=True
+        )
+
+        for name, (_, dumper) in self.implementations.items():
+            with self.subTest(implementation=name), patch(
+                "mobile_strings_converter.converter.YAML_DUMPER", dumper
+            ):
+                to_yaml(self.strings, self.yaml_filepath)
+
+                self.assertEqual(
+                    expected_output, self.yaml_filepath.read_text(encoding="utf-8")
+                )
+
+    def test_reader_matches_safe_load(self):
+        to_yaml(self.strings, self.yaml_filepath)
+        with open(self.yaml_filepath, encoding="utf-8") as file:
+            expected_strings = list(yaml.safe_load(file).items())
+
+        for name, (loader, _) in self.implementations.items():
+            with self.subTest(implementation=name), patch(
+                "mobile_strings_converter.converter.YAML_LOADER", loader
+            ):
+                self.assertEqual(
+                    expected_strings, get_strings_from_yaml(self.yaml_filepath)
+                )
+
+    def test_repeated_keys_are_read(self):
+        self.yaml_filepath.write_text("a: 1\nb: B\na: '2'\n", encoding="utf-8")
+
+        self.assertEqual(
+            [("a", 1), ("b", "B"), ("a", "2")],
+            get_strings_from_yaml(self.yaml_filepath),
+        )
+
+    def test_empty_file_has_no_strings(self):
+        self.yaml_filepath.write_text("", encoding="utf-8")
+
+        self.assertEqual([], get_strings_from_yaml(self.yaml_filepath))
+
+    def test_nested_values_raise_error(self):
+        for content in ("- a\n- b\n", "a:\n  b: c\n", "a: &x A\nb: *x\n"):
+            with self.subTest(content=content):
+                self.yaml_filepath.write_text(content, encoding="utf-8")
+
+                with self.assertRaises(ValueError):
+                    get_strings_from_yaml(self.yaml_filepath)
+
+
 if __name__ == "__main__":
     unittest.main()